@@ -1,20 +1,20 @@
-from functools import lru_cache
-
-import i18n
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.logger import logger
+from fastapi.routing import APIRoute
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.security.http import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import errors, models, schemas
 from ..helpers.check import Check
 from ..utils.dependency import Dependency
-from ..utils.tools import Tools
+from ..utils.model_registry import ModelRegistry
+from ..utils.principal_cache import PrincipalCache
 from . import role as config_role
 from .env import settings
+from .translation import Translation
 
 _oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login/token")
 # _oauth2_scheme = HTTPBearer(auto_error=False)
@@ -25,6 +25,14 @@ class Auth(BaseModel):
     __abilities__ = {
         # v1/admin
         "admin_create_hierarchy": [],
+        # v1 catalog (admin only)
+        "bulk_attacks": [],
+        "bulk_blocks": [],
+        "bulk_cards": [],
+        "bulk_resistances": [],
+        "bulk_series": [],
+        "bulk_variants": [],
+        "bulk_weaknesss": [],
         # v1/cart
         "list_carts_by_user": ["myself"],
         "create_cart": ["possessor", "client"],
@@ -65,22 +73,28 @@ class Auth(BaseModel):
     def _decode_token(
         token: str | None = Depends(_oauth2_scheme),
         db: Session = Depends(Dependency.get_db),
-    ) -> tuple[models.user.User, Session]:
+    ) -> tuple[schemas.user.UserComplete, Session]:
         """This function get the user with the token given (match by matricule ).
 
+        A verified token is kept with its user in the principal cache, the next requests with the token
+        are authenticated without decoding it nor reading the database.
+
         :param token: the token where is stored the jwt authentification token
         :param db: the session
         :type token: str
         :type db: Session
-        :returns: tuple[models.user.User, Session]
+        :returns: tuple[schemas.user.UserComplete, Session]
 
         """
         if token is None:
             logger.error("Token : Decode token - None")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=i18n.t(ERROR_INVALID_CREDENTIALS),
+                detail=Translation.t(ERROR_INVALID_CREDENTIALS),
             )
+        principal = PrincipalCache.get(token)
+        if principal is not None:
+            return (principal, db)
         db_user = None
         try:
             payload = jwt.decode(
@@ -96,7 +110,7 @@ class Auth(BaseModel):
                 )
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=i18n.t(ERROR_INVALID_CREDENTIALS),
+                    detail=Translation.t(ERROR_INVALID_CREDENTIALS),
                 )
             db_user = models.user.User.find_by(db, matricule=matricule, email=email)
             if db_user is None:
@@ -105,124 +119,116 @@ class Auth(BaseModel):
                 )
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=i18n.t(ERROR_INVALID_CREDENTIALS),
+                    detail=Translation.t(ERROR_INVALID_CREDENTIALS),
                 )
         except JWTError as jwt_error:
             logger.error(f"Token : Decode token - JWTError : {jwt_error}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=i18n.t(ERROR_INVALID_CREDENTIALS),
+                detail=Translation.t(ERROR_INVALID_CREDENTIALS),
             )
-        return (db_user, db)
+        principal = schemas.user.UserComplete.model_validate(db_user)
+        PrincipalCache.set(token, principal, payload.get("exp"))
+        return (principal, db)
+
+    @classmethod
+    def compile_abilities(cls) -> dict[str, int]:
+        """This function compile the abilities in the bitmask of the roles allowed by endpoint.
+
+        :returns: dict[str, int]
+        :raises KeyError: raises if an ability names a role which doesn't exist
+
+        """
+        return {
+            endpoint: config_role.Role.mask(roles)
+            for endpoint, roles in cls.__abilities__.items()
+        }
+
+    @classmethod
+    def validate_abilities(cls, routes: list) -> None:
+        """This function check that every route protected by check_role_user has its abilities.
+
+        :param routes: the routes of the app
+        :type routes: list
+        :returns: None
+        :raises AbilityError: raises if a protected route has no abilities
+
+        """
+        missing = sorted(
+            {
+                route.endpoint.__name__
+                for route in routes
+                if isinstance(route, APIRoute)
+                and cls._depends_on(route.dependant, cls.check_role_user)
+                and route.endpoint.__name__ not in cls.__ability_masks__
+            }
+        )
+        if missing:
+            raise errors.ability_error.AbilityError(missing)
+
+    @staticmethod
+    def _depends_on(dependant, call) -> bool:
+        """This function check if a dependency is in the dependencies of a route (recursively).
+
+        :param dependant: the dependencies of the route
+        :param call: the dependency to search
+        :returns: bool
+
+        """
+        return any(
+            dependency.call == call or Auth._depends_on(dependency, call)
+            for dependency in dependant.dependencies
+        )
 
     @classmethod
-    @lru_cache()
-    def _check_role_endpoint(cls, role: tuple, endpoint: str) -> None:
+    def _check_role_endpoint(cls, role: int, endpoint: str) -> None:
         """This function check if the user with the role is allow to go to the endpoint of the request.
 
-        :param role: the role of the user
+        :param role: the bitmask of the roles of the user
         :param endpoint: the endpoint of the request
-        :type role: str
+        :type role: int
         :type endpoint: str
         :returns: None
         :raises HTTPException: raises HTTP exception if the role isn't allow for this endpoint
 
         """
-        if endpoint in cls.__abilities__:
-            if len(set(role) & set(cls.__abilities__[endpoint])) == 0:
-                logger.error(
-                    f"Check role : role ({role}) not allowed for endpoint ({endpoint})"
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=i18n.t("errors.invalid_role"),
-                )
+        allowed = cls.__ability_masks__.get(endpoint)
+        if allowed is not None and not role & allowed:
+            logger.error(
+                f"Check role : role ({config_role.Role.names(role)}) not allowed for endpoint ({endpoint})"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=Translation.t("errors.invalid_role"),
+            )
 
     @classmethod
-    def _get_role(cls, db: Session, user: schemas.user.UserComplete, args: dict) -> set:
+    def _get_role(cls, db: Session, user: schemas.user.UserComplete, args: dict) -> int:
         """This function get the role of an user for the arguments.
 
+        The owners and the members of all the resources of the arguments are read in one query (see Role.resolve).
+
         :param db: the session
         :param user: the user
         :param args: the arguments to find the role
         :type db: Session
         :type user: schemas.user.UserComplete
         :type args: dict
-        :returns: str | None
+        :returns: int, the bitmask of the roles
 
         """
-        # ["owner", "member", "pro", "client"]
-        print(f"{user = }")
-        if user.is_admin:
-            return {"admin"}
-        role = {"pro"} if user.is_pro else {"client"}  # change with scope
-        keys_set = set(args) & set(config_role.Role.__tables_by_id__.keys())
-        for key in keys_set:
-            model_id = int(args[key] or "0")
-            if key == "user_id" and user.id == model_id:
-                if len(keys_set) == 1:
-                    role.add("myself")
-            else:
-                information_table = config_role.Role.__tables_by_id__[key]
-                print(f"{information_table = } | {key = }")
-                cl = information_table["class"]
-                model = Tools.get_class_from_string(
-                    models, f"{cl}.{cl.title().replace('_', '')}"
-                ).find_by(db, id=model_id)
-                print(f"{user = } | {model = }")
-                print(f"1_{role = }")
-                if "user_id" in dir(model):
-                    print(f"{model.user_id = }")
-                if "user_ids" in dir(model):
-                    print(f"{model.user_ids = }")
-                if "user_id" in dir(model) and model.user_id == user.id:
-                    if "role" in information_table:
-                        tmp_role = information_table["role"]
-                        if tmp_role == "owner" and user.is_pro:
-                            role.add("owner")
-                        elif tmp_role == "possessor" and not user.is_pro:
-                            role.add("possessor")
-                elif "user_ids" in dir(model) and user.id in model.user_ids:
-                    role.add("member")
-                print(f"2_{role = }")
-        return role
-
-        # role = None
-        # keys_set = set(args) & set(config_role.Role.__tables_by_id__.keys())
-        # if len(keys_set) > 1 and "team_id" in keys_set and "user_id" not in keys_set:
-        #     keys_set.remove("team_id")
-        # for key in keys_set:
-        #     model_id = int(args[key] or "0")
-        #     if key == "user_id":
-        #         if user.is_admin:
-        #             role = "admin"
-        #         elif user.id == model_id:
-        #             role = "user"
-        #     else:
-        #         information_table = config_role.Role.__tables_by_id__[key]
-        #         cl = information_table["class"]
-        #         model = Tools.get_class_from_string(
-        #             models, f"{cl}.{cl.title().replace('_', '')}"
-        #         ).find_by(db, id=model_id)
-        #         role = config_role.Role.get_best_role(
-        #             db, user, model, information_table
-        #         )
-        #     if role is not None:
-        #         return role
-        # if not keys_set:
-        #     role = config_role.Role.get_best_role(db, user)
-        # return role
+        return config_role.Role.resolve(db, user, args)
 
     @staticmethod
     def get_current_user(
-        response_decode_token: tuple[models.user.User, Session] = Depends(
+        response_decode_token: tuple[schemas.user.UserComplete, Session] = Depends(
             staticmethod(_decode_token)
         )
     ) -> tuple[schemas.user.UserComplete, Session]:
         """This function check existence of the current user and get it.
 
         :param response_decode_token: the tuple containing the user and the session
-        :type response_decode_token: tuple[models.user.User, Session]
+        :type response_decode_token: tuple[schemas.user.UserComplete, Session]
         :returns: tuple[schemas.user.UserComplete, Session]
         :raises HTTPException: raises HTTP exception if the user is None
 
@@ -232,10 +238,10 @@ class Auth(BaseModel):
             logger.error(f"Get current user : no user authenticated")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=i18n.t(ERROR_INVALID_CREDENTIALS),
+                detail=Translation.t(ERROR_INVALID_CREDENTIALS),
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        return (schemas.user.UserComplete.model_validate(user), db)
+        return (user, db)
 
     @classmethod
     def get_level_informations(
@@ -265,7 +271,7 @@ class Auth(BaseModel):
         :raises HTTPException: raises HTTP exception if the model isn't found or if the user isn't allowed for this model
 
         """
-        model_class = Tools.get_class_from_string(models, model_name)
+        model_class = ModelRegistry.get_class(model_name)
         model = Check.model_exist(
             db=db,
             model_class=model_class,
@@ -279,7 +285,7 @@ class Auth(BaseModel):
             logger.error(f"Get level information : role is None")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=i18n.t("errors.invalid_role"),
+                detail=Translation.t("errors.invalid_role"),
             )
         attribut = list(query_json.keys())[0]
         metadata[f"{level}_{attribut}"] = getattr(model, attribut)
@@ -303,15 +309,19 @@ class Auth(BaseModel):
         :returns: schemas.user.User
 
         """
-        current_user, db = response_user
-        user = schemas.user.UserComplete(**current_user.model_dump())
+        # the user is immutable, it is used without copy
+        user, db = response_user
         if "_json" in request.__dict__ and type(request._json) is dict:
             args = request._json
             args.update(request.scope["path_params"])
         else:
             args = dict(request.scope["path_params"])
         role = cls._get_role(db, user, args)
-        if "admin" not in role:
+        if not role & config_role.Role.__bits__["admin"]:
             endpoint = request.scope["route"].endpoint.__name__
-            cls._check_role_endpoint(tuple(role), endpoint)
-        return schemas.user.User(**user.model_dump())
+            cls._check_role_endpoint(role, endpoint)
+        return user
+
+
+# the roles allowed by endpoint (one bitmask per endpoint, checked with a single AND)
+Auth.__ability_masks__ = Auth.compile_abilities()
@@ -3,6 +3,7 @@ from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.staticfiles import StaticFiles
 
 from ..routers import routers
+from .auth import Auth
 
 
 class ConfigApp:
@@ -21,6 +22,8 @@ class ConfigApp:
         # INCLUDE ALL ROUTERS
         for router in routers:
             app.include_router(router)
+        # every route checking the role of the user has its abilities
+        Auth.validate_abilities(app.routes)
 
         @app.get("/docs", include_in_schema=False)
         async def custom_swagger_ui_html():
@@ -4,3 +4,13 @@ CASCADE_ALL_DELETE = "all, delete"
 TIME_ZONE_APP = ZoneInfo("Europe/Paris")
 MAX_FILES_ALLOWED = 10
 MAX_FILE_SIZE_MB = 1
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 500
+BULK_BATCH_SIZE = 500
+# the trimmed schemas (fields=) and the loader options kept by schema
+PROJECTION_CACHE_SIZE = 256
+LOADER_PLAN_CACHE_SIZE = 512
+READ_YOUR_WRITES_COOKIE = "read_primary_until"
+# the HTTP methods without a request body
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+REQUEST_LOGGER = "fastapi.requests"
@@ -1,15 +1,115 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from .env import settings
+from .replica_router import ReplicaRouter
+
+# async drivers of the database engines
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def get_async_url(url: str) -> str:
+    """This function get the url of the async driver of a database url.
+
+    :param url: the url of the database (sync driver)
+    :type url: str
+    :returns: str
+
+    """
+    scheme, _, rest = url.partition("://")
+    dialect = scheme.split("+")[0]
+    return f"{ASYNC_DRIVERS.get(dialect, scheme)}://{rest}"
+
+
+def get_engine_options(url: str) -> dict:
+    """This function get the options of the engine of a database url from the settings (pool, statement cache).
+
+    An in-memory SQLite database keeps the pool chosen by SQLAlchemy (one connection holds the data).
+
+    :param url: the url of the database
+    :type url: str
+    :returns: dict
+
+    """
+    database_url = make_url(url)
+    options = {
+        "echo": settings.fastapi_env.value == "dev",
+        "query_cache_size": settings.database_statement_cache_size,
+    }
+    if database_url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if database_url.database in [None, "", ":memory:"]:
+            return options
+    options.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+    )
+    return options
+
+
+def get_pool_stats(engine) -> dict:
+    """This function get the state of the connection pool of an engine.
+
+    :param engine: the engine
+    :returns: dict
+
+    """
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout=pool.timeout(),
+        )
+    return stats
+
 
 engine = create_engine(
-    settings.database_url,
-    echo=settings.fastapi_env.value == "dev",
-    connect_args=(
-        {"check_same_thread": False} if settings.database_engine == "sqlite" else {}
-    ),
+    settings.database_url, **get_engine_options(settings.database_url)
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# the reads of the safe methods go to the replicas (if any)
+replica_router = ReplicaRouter(
+    engine,
+    [
+        create_engine(url, **get_engine_options(url))
+        for url in settings.database_replica_urls
+    ],
+    settings.database_replica_strategy,
+)
+
+# the async engine is only created in async mode (its driver is imported at the creation)
+async_url = settings.database_async_url or get_async_url(settings.database_url)
+async_engine = (
+    create_async_engine(async_url, **get_engine_options(async_url))
+    if settings.database_async
+    else None
+)
+async_replica_router = (
+    ReplicaRouter(
+        async_engine,
+        [
+            create_async_engine(get_async_url(url), **get_engine_options(url))
+            for url in settings.database_replica_urls
+        ],
+        settings.database_replica_strategy,
+    )
+    if async_engine is not None
+    else None
+)
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
 
 Base = declarative_base()
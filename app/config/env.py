@@ -14,14 +14,58 @@ class _Settings(BaseSettings):
     app_source: str = "local"
     app_uri: str = ""
     app_version: str = "0.0.1"
+    auth_principal_cache_size: int = 1024
+    auth_principal_cache_ttl: float = 60
+    auth_role_cache_size: int = 4096
+    auth_role_cache_ttl: float = 5
+    aws_connect_timeout: float = 5
     aws_dynamodb_table: str = "functional-monitoring-dynamodb--table"
+    aws_max_pool_connections: int = 50
+    aws_read_timeout: float = 30
+    aws_region: str | None = None
+    aws_retry_max_attempts: int = 5
+    aws_retry_mode: str = "standard"
     bucket_prefix: str = ""
+    compression_level: int = 6
+    compression_minimum_size: int = 1024
+    compression_snapshot_size: int = 32
+    database_async: bool = False
+    database_async_url: str = ""
     database_engine: str = "sqlite"
+    database_max_overflow: int = 20
+    database_pool_pre_ping: bool = True
+    database_pool_recycle: int = 1800
+    database_pool_size: int = 10
+    database_pool_timeout: float = 30
+    database_read_your_writes_seconds: float = 5
+    database_replica_strategy: str = "round_robin"
+    database_replica_urls: list[str] = []
+    database_sqlite_cache_size: int = -64000
+    database_sqlite_journal_mode: str = "WAL"
+    database_sqlite_mmap_size: int = 268435456
+    database_sqlite_synchronous: str = "NORMAL"
+    database_statement_cache_size: int = 500
     database_url: str = "sqlite:///./db/sql_app.db"
     fastapi_env: EnvironmentEnum = EnvironmentEnum.dev
     fastapi_title: str = "FastAPI Test - Backend"
+    json_fast_path: bool = True
+    json_response: str = "orjson"
     openapi_path: str = ""
     pytest_xdist_worker: str | None = None
+    query_plan_cache_size: int = 512
+    read_cache_redis_url: str | None = None
+    read_cache_size: int = 2048
+    read_cache_ttl: float = 300
+    request_log_body_size: int = 2048
+    request_log_redact_fields: list[str] = [
+        "access_token",
+        "authorization",
+        "password",
+        "refresh_token",
+        "secret",
+        "token",
+    ]
+    request_log_sample_rate: float = 1.0
     root_path: str = ""
     secret_key_jwt: str = ""
 
@@ -6,29 +6,40 @@ from fastapi.logger import logger
 from fastapi.staticfiles import StaticFiles
 
 from ..routers import routers
+from ..services.autocomplete import Autocomplete
+from ..services.aws import AWSClients
 from .config_app import ConfigApp
-from .database import engine
+from .database import async_engine, engine
+from .env import settings
 from .logging import Logging
 from .seeds import Seed
+from .translation import Translation
 
 
-def startup(app: FastAPI, engine):
+def startup(app: FastAPI, engine, async_engine=None):
     """This function do some actions in startup of the app.
 
     :param app: the app of the project
     :param engine: the engine of the database
+    :param async_engine: the async engine of the database (None if the app isn't async)
     :type app: FastAPI
 
     """
     Logging.initialite_logging()
-    Seed.initialize_database(engine)
+    Translation.load()
+    Seed.initialize_database(engine, async_engine)
+    Autocomplete.initialize(engine)
     ConfigApp.initialize_app(app)
+    if settings.app_source.lower() == "aws":
+        AWSClients.initialize()
     logger.debug("startup done.")
 
 
 def shutdown():
     """This function do some actions in shutdown of the app."""
     logger.debug("shutdown done.")
+    Logging.stop_request_logging()
+    AWSClients.close()
 
 
 @asynccontextmanager
@@ -42,7 +53,7 @@ async def lifespan(app: FastAPI):
 
     scheduler = BackgroundScheduler()
 
-    startup(app, engine)
+    startup(app, engine, async_engine)
     scheduler.start()
     yield
 
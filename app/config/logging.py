@@ -1,9 +1,13 @@
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import ClassVar
 
 from fastapi.logger import logger as logger_fastapi
 from pydantic import BaseModel
 from uvicorn.logging import AccessFormatter, DefaultFormatter
 
+from .constants import REQUEST_LOGGER
 from .env import settings
 
 
@@ -39,6 +43,9 @@ class AppAccessFormatter(AppFormatter, AccessFormatter):
 
 
 class Logging(BaseModel):
+    # the thread writing the logs of the requests
+    request_listener: ClassVar[QueueListener | None] = None
+
     @staticmethod
     def _set_formatter_or_add_handler(
         formatter: AppFormatter,
@@ -99,3 +106,28 @@ class Logging(BaseModel):
             handler=handler_stream,
             formatter=AppAccessFormatter,
         )
+        cls.initialize_request_logging()
+
+    @classmethod
+    def initialize_request_logging(cls) -> None:
+        """This function send the logs of the requests through a queue, written by the handlers of fastapi in a thread.
+
+        The request only put the record in the queue, it doesn't wait for the write of the stream.
+
+        """
+        cls.stop_request_logging()
+        queue = SimpleQueue()
+        logger_request = logging.getLogger(REQUEST_LOGGER)
+        logger_request.handlers = [QueueHandler(queue)]
+        logger_request.propagate = False
+        cls.request_listener = QueueListener(
+            queue, *logger_fastapi.handlers, respect_handler_level=True
+        )
+        cls.request_listener.start()
+
+    @classmethod
+    def stop_request_logging(cls) -> None:
+        """This function write the logs of the requests left in the queue and stop its thread."""
+        if cls.request_listener is not None:
+            cls.request_listener.stop()
+            cls.request_listener = None
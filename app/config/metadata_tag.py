@@ -60,6 +60,10 @@ class MetadataTag(BaseModel):
         prefix="/resistances",
         description="Endpoints related to resistance data.",
     )
+    __tag_autocomplete__: _MetadataTag = _MetadataTag(
+        name="autocomplete",
+        description="Endpoints related to the suggestions of names (cards, series and blocks).",
+    )
 
     @classmethod
     def tag_list(cls) -> list[_MetadataTag]:
@@ -78,6 +82,7 @@ class MetadataTag(BaseModel):
             cls.__tag_attack__.model_dump(),
             cls.__tag_weakness__.model_dump(),
             cls.__tag_resistance__.model_dump(),
+            cls.__tag_autocomplete__.model_dump(),
         ]
         while None in list_tags:
             list_tags.remove(None)
@@ -0,0 +1,52 @@
+import itertools
+from threading import Lock
+
+
+class ReplicaRouter:
+    """Choose the engine of a session : the primary for the writes, one of the replicas for the reads."""
+
+    def __init__(
+        self, primary, replicas: list | None = None, strategy: str = "round_robin"
+    ):
+        self.primary = primary
+        self.replicas = replicas or []
+        self.strategy = strategy
+        self._counter = itertools.count()
+        self._lock = Lock()
+
+    @staticmethod
+    def checked_out(engine) -> int:
+        """This function get the number of connections of an engine in use.
+
+        :param engine: the engine
+        :returns: int
+
+        """
+        checkedout = getattr(engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
+
+    def next_replica(self):
+        """This function get the replica for the next read (round robin or least connections).
+
+        :returns: the engine of the replica
+
+        """
+        if self.strategy == "least_connections":
+            return min(self.replicas, key=self.checked_out)
+        with self._lock:
+            index = next(self._counter)
+        return self.replicas[index % len(self.replicas)]
+
+    def get_bind(self, write: bool = False, read_your_writes: bool = False):
+        """This function get the engine of the session of a route.
+
+        :param write: True if the route writes (its session is the write dependency)
+        :param read_your_writes: True if the client wrote recently and must read the primary
+        :type write: bool
+        :type read_your_writes: bool
+        :returns: the engine
+
+        """
+        if not self.replicas or read_your_writes or write:
+            return self.primary
+        return self.next_replica()
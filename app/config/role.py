@@ -1,8 +1,22 @@
+import time
+from functools import lru_cache
+from threading import Lock
+from typing import ClassVar
+
 from pydantic import BaseModel
+from sqlalchemy import Table, bindparam, exists, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import visitors
 
 from .. import models, schemas
+from ..utils.lru import LRUCache
+from ..utils.model_registry import ModelRegistry
+from ..utils.table_version import TableVersion
 from ..utils.tools import Tools
+from .env import settings
+
+# the bind parameter of the id of the user in the membership conditions
+_MEMBER_PARAM = "member_id"
 
 
 class Role(BaseModel):
@@ -38,4 +52,233 @@ class Role(BaseModel):
         "user_id": {"class": "user", "table": "users"},
     }
 
-    __roles__ = ["admin", "owner", "member", "pro", "possessor", "client"]
+    __roles__ = ["admin", "owner", "member", "pro", "possessor", "client", "myself"]
+    # the bit of each role, the roles of a user are the OR of their bits
+    __bits__ = {name: 1 << index for index, name in enumerate(__roles__)}
+
+    # the owner and the membership of the resources of a request by user, resources and version of their tables
+    facts: ClassVar[LRUCache] = LRUCache(
+        maxsize=settings.auth_role_cache_size, ttl=settings.auth_role_cache_ttl
+    )
+    checks: ClassVar[int] = 0
+    queries: ClassVar[int] = 0
+    started: ClassVar[float] = time.monotonic()
+    _lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def _owner_path(cls, key: str) -> tuple[type, list[tuple[type, str]]] | None:
+        """This function get the model of a key and the parents to join up to the model holding the user.
+
+        product_id : Product joined to Shop by shop_id, the user of the shop (user_id / user_ids) owns the product.
+
+        :param key: the key of the resource in the request (shop_id, ...)
+        :type key: str
+        :returns: tuple with the model and the (parent, foreign key) to join, None if a model doesn't exist
+
+        """
+        information_table = cls.__tables_by_id__[key]
+        model_class = ModelRegistry.get_class(information_table["class"])
+        if model_class is None:
+            return None
+        joins = []
+        current_class = model_class
+        while information_table.get("parent_id", "user_id") != "user_id":
+            parent_key = information_table["parent_id"]
+            information_table = cls.__tables_by_id__[parent_key]
+            parent_class = ModelRegistry.get_class(information_table["class"])
+            if parent_class is None:
+                return None
+            joins.append((parent_class, getattr(current_class, parent_key)))
+            current_class = parent_class
+        return (model_class, joins)
+
+    @staticmethod
+    def _resource_query(model_class, joins: list, key: str, column):
+        """This function select a column of the resource of a key joined to its parents.
+
+        :param model_class: the model of the resource
+        :param joins: the (parent, foreign key) to join
+        :param key: the key of the resource, name of the bind parameter of its id
+        :param column: the column to select
+        :type joins: list
+        :type key: str
+        :returns: Select
+
+        """
+        query = select(column).select_from(model_class)
+        for parent_class, foreign_key in joins:
+            query = query.join(parent_class, parent_class.id == foreign_key)
+        return query.where(model_class.id == bindparam(key))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def statement(cls, keys: tuple[str, ...]):
+        """This function build the query of the owner and the membership of the resources of some keys.
+
+        One row with, for each key, the user holding the resource (column <key>_owner) and if the requested user
+        is in its members (column <key>_member), the ids are bound by key and the user by member_id.
+
+        :param keys: the sorted keys of the resources (shop_id, product_id, ...)
+        :type keys: tuple[str, ...]
+        :returns: Select | None if no key has a model
+
+        """
+        columns = []
+        for key in keys:
+            path = cls._owner_path(key)
+            if path is None:
+                continue
+            model_class, joins = path
+            holder_class = joins[-1][0] if joins else model_class
+            info = holder_class.__model_info__
+            if "user_id" in info.columns:
+                owner = cls._resource_query(
+                    model_class, joins, key, holder_class.user_id
+                )
+                columns.append(owner.scalar_subquery().label(f"{key}_owner"))
+            if hasattr(holder_class, "user_ids"):
+                # user_ids is the association proxy of the members (relationship, user_id of the member)
+                proxy = holder_class.user_ids
+                member = cls._resource_query(model_class, joins, key, model_class.id)
+                is_member = proxy.local_attr.any(
+                    proxy.remote_attr == bindparam(_MEMBER_PARAM)
+                )
+                columns.append(exists(member.where(is_member)).label(f"{key}_member"))
+        return select(*columns) if columns else None
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def tables(cls, keys: tuple[str, ...]) -> tuple[str, ...]:
+        """This function get the names of the tables read by the query of the resources of some keys.
+
+        The tables of the resources, of their parents and of their members (association table).
+
+        :param keys: the sorted keys of the resources (shop_id, product_id, ...)
+        :type keys: tuple[str, ...]
+        :returns: tuple[str, ...], the sorted names of the tables
+
+        """
+        statement = cls.statement(keys)
+        if statement is None:
+            return ()
+        return tuple(
+            sorted(
+                {
+                    element.name
+                    for element in visitors.iterate(statement)
+                    if isinstance(element, Table)
+                }
+            )
+        )
+
+    @classmethod
+    def _facts(cls, db: Session, user_id: int, ids: dict[str, int]) -> dict:
+        """This function get the owner and the membership of the resources of a request (kept for the ttl).
+
+        The facts are dropped when a table read by the query (resources, parents or members) is written by this
+        process (version in the key), the writes of the other processes are seen after the ttl.
+
+        :param db: the session
+        :param user_id: the id of the user
+        :param ids: the ids of the resources by key
+        :type db: Session
+        :type user_id: int
+        :type ids: dict[str, int]
+        :returns: dict
+
+        """
+        keys = tuple(sorted(ids))
+        versions = tuple(
+            TableVersion.counters.get(table, 0) for table in cls.tables(keys)
+        )
+        cache_key = (user_id, tuple(ids[key] for key in keys), keys, versions)
+        facts = cls.facts.get(cache_key)
+        if facts is not None:
+            return facts
+        statement = cls.statement(keys)
+        facts = {}
+        if statement is not None:
+            with cls._lock:
+                cls.queries += 1
+            row = db.execute(statement, {**ids, _MEMBER_PARAM: user_id}).one()
+            facts = dict(row._mapping)
+        cls.facts.set(cache_key, facts)
+        return facts
+
+    @classmethod
+    def resolve(cls, db: Session, user, args: dict) -> int:
+        """This function get the roles of a user for the resources of a request (one query for all the resources).
+
+        :param db: the session
+        :param user: the user
+        :param args: the arguments of the request (body and path parameters)
+        :type db: Session
+        :type args: dict
+        :returns: int, the bitmask of the roles
+
+        """
+        with cls._lock:
+            cls.checks += 1
+        bits = cls.__bits__
+        if user.is_admin:
+            return bits["admin"]
+        role = bits["pro"] if user.is_pro else bits["client"]  # change with scope
+        ids = {
+            key: int(args[key] or "0") for key in set(args) & set(cls.__tables_by_id__)
+        }
+        if "user_id" in ids:
+            if ids.pop("user_id") == user.id and not ids:
+                role |= bits["myself"]
+        if not ids:
+            return role
+        facts = cls._facts(db, user.id, ids)
+        for key in ids:
+            tmp_role = cls.__tables_by_id__[key].get("role")
+            if facts.get(f"{key}_owner") == user.id:
+                if tmp_role == "owner" and user.is_pro:
+                    role |= bits["owner"]
+                elif tmp_role == "possessor" and not user.is_pro:
+                    role |= bits["possessor"]
+            elif facts.get(f"{key}_member"):
+                role |= bits["member"]
+        return role
+
+    @classmethod
+    def mask(cls, names) -> int:
+        """This function get the bitmask of some roles.
+
+        :param names: the names of the roles
+        :returns: int
+        :raises KeyError: raises if a role doesn't exist
+
+        """
+        mask = 0
+        for name in names:
+            mask |= cls.__bits__[name]
+        return mask
+
+    @classmethod
+    def names(cls, mask: int) -> set:
+        """This function get the names of the roles of a bitmask.
+
+        :param mask: the bitmask of the roles
+        :type mask: int
+        :returns: set
+
+        """
+        return {name for name, bit in cls.__bits__.items() if mask & bit}
+
+    @classmethod
+    def stats(cls) -> dict:
+        """This function get the number of role checks (by second since the start) and of queries.
+
+        :returns: dict
+
+        """
+        elapsed = time.monotonic() - cls.started
+        return {
+            "checks": cls.checks,
+            "queries": cls.queries,
+            "checks_per_second": cls.checks / elapsed if elapsed > 0 else 0.0,
+            "cache": cls.facts.stats(),
+        }
@@ -1,5 +1,3 @@
-import sqlite3
-
 from alembic.config import Config
 from fastapi.logger import logger
 from pydantic import BaseModel
@@ -13,16 +11,22 @@ from .env import settings
 class Seed(BaseModel):
     @staticmethod
     def _set_sqlite_pragma(dbapi_connection, connection_record) -> None:
-        """This function set PRAGMA foreign_keys to ON if the database is sqlite3 (refuse a foreign_key that doesn't exist in the linked table).
+        """This function set PRAGMA foreign_keys to ON on a sqlite connection (refuse a foreign_key that doesn't exist in the linked table).
+
+        It also tunes the connection from the settings : WAL journal (the readers don't block the writer), synchronous, mmap and page cache sizes.
+        The connection is a sqlite3 connection or the aiosqlite connection adapted by SQLAlchemy (same cursor API).
 
         :param dbapi_connection: the database
         :returns: None
 
         """
-        if type(dbapi_connection) is sqlite3.Connection:
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(f"PRAGMA journal_mode={settings.database_sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.database_sqlite_synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.database_sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.database_sqlite_cache_size)}")
+        cursor.close()
 
     @staticmethod
     def _create_database() -> None:
@@ -33,14 +37,21 @@ class Seed(BaseModel):
         """
 
     @classmethod
-    def initialize_database(cls, engine):
+    def initialize_database(cls, engine, async_engine=None):
         """This function prepare the database at the start of the server (create tables and seed them on dev mode).
 
         :param engine: the database
+        :param async_engine: the async engine of the database (None if the app isn't async)
         :returns: None
 
         """
-        event.listen(engine, "connect", cls._set_sqlite_pragma)
+        # the events of an async engine are listened on its sync engine
+        engines = (
+            [engine] if async_engine is None else [engine, async_engine.sync_engine]
+        )
+        for sync_engine in engines:
+            if sync_engine.dialect.name == "sqlite":
+                event.listen(sync_engine, "connect", cls._set_sqlite_pragma)
 
     @staticmethod
     def initialize_table(engine) -> None:
@@ -1,20 +1,169 @@
-import i18n
+import re
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar
+
+import yaml
+from pydantic import BaseModel
 
-_default_lang = "en"
 DEFAULT_LANGUAGE = "en"
 SUPPORTED_LANGUAGE = ["fr", "en"]
+LOCALES_PATH = Path(__file__).resolve().parent.parent / "locales"
+
+# a %{name} placeholder once the braces of the message are escaped
+_PLACEHOLDER = re.compile(r"%\{\{(\w+)\}\}")
+# the language of the current request (each request runs in its own context)
+_locale: ContextVar[str] = ContextVar("locale", default=DEFAULT_LANGUAGE)
+
+
+class _Values(dict):
+    """The values of the placeholders of a message, a placeholder without value is kept as is."""
+
+    def __missing__(self, key: str) -> str:
+        return f"%{{{key}}}"
+
+
+class Translation(BaseModel):
+    # the messages by language and key ("errors.invalid_role"), read once from the locales
+    catalogs: ClassVar[dict[str, MappingProxyType]] = {}
+    loads: ClassVar[int] = 0
+
+    @staticmethod
+    def _compile(message) -> str:
+        """This function turn a message with %{name} placeholders in a format string.
+
+        :param message: the message of the locale file
+        :returns: str
+
+        """
+        message = str(message).replace("{", "{{").replace("}", "}}")
+        return _PLACEHOLDER.sub(r"{\1}", message)
+
+    @classmethod
+    def _flatten(cls, messages: dict, prefix: str, catalog: dict) -> None:
+        """This function add the messages of a locale file to a catalog under their dotted keys.
+
+        :param messages: the messages (nested by key)
+        :param prefix: the key of the parent of the messages
+        :param catalog: the catalog to fill
+        :type messages: dict
+        :type prefix: str
+        :type catalog: dict
+        :returns: None
+
+        """
+        for key, message in messages.items():
+            if isinstance(message, dict):
+                cls._flatten(message, f"{prefix}.{key}", catalog)
+            else:
+                catalog[f"{prefix}.{key}"] = cls._compile(message)
+
+    @classmethod
+    def load(cls, path: Path = LOCALES_PATH) -> None:
+        """This function read the locale files (<path>/<language>/<namespace>.<language>.yml) in frozen catalogs.
+
+        :param path: the folder of the locales
+        :type path: Path
+        :returns: None
+
+        """
+        catalogs = {}
+        for language in SUPPORTED_LANGUAGE:
+            catalog = {}
+            for file in sorted((path / language).glob(f"*.{language}.yml")):
+                content = yaml.safe_load(file.read_text(encoding="utf-8")) or {}
+                namespace = file.name.split(".", 1)[0]
+                cls._flatten(content.get(language) or {}, namespace, catalog)
+            catalogs[language] = MappingProxyType(catalog)
+        cls.catalogs = catalogs
+        cls.loads += 1
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def parse_accept_language(header: str | None) -> str:
+        """This function get the supported language preferred by an Accept-Language header (q-values).
+
+        :param header: the header (fr-CH, fr;q=0.9, en;q=0.8, *;q=0.5)
+        :type header: str | None
+        :returns: str
+
+        """
+        best, best_quality = DEFAULT_LANGUAGE, 0.0
+        for item in (header or "").split(","):
+            tag, _, parameters = item.partition(";")
+            language = tag.strip().split("-", 1)[0].lower()
+            quality = 1.0
+            parameter, _, value = parameters.partition("=")
+            if parameter.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            if language == "*":
+                language = DEFAULT_LANGUAGE
+            if language in SUPPORTED_LANGUAGE and quality > best_quality:
+                best, best_quality = language, quality
+        return best
+
+    @classmethod
+    def activate(cls, header: str | None) -> Token:
+        """This function set the language of the current request from its Accept-Language header.
+
+        :param header: the Accept-Language header
+        :type header: str | None
+        :returns: Token to reset the language
+
+        """
+        return _locale.set(cls.parse_accept_language(header))
+
+    @staticmethod
+    def reset(token: Token) -> None:
+        """This function set back the language before activate.
+
+        :param token: the token returned by activate
+        :type token: Token
+        :returns: None
+
+        """
+        _locale.reset(token)
+
+    @staticmethod
+    def locale() -> str:
+        """This function get the language of the current request.
+
+        :returns: str
+
+        """
+        return _locale.get()
+
+    @classmethod
+    def t(cls, key: str, **values) -> str:
+        """This function translate a key in the language of the current request (in English if it's missing).
+
+        :param key: the key of the message (errors.invalid_role)
+        :param values: the values of the placeholders of the message
+        :type key: str
+        :returns: str, the key itself if the message doesn't exist
+
+        """
+        if not cls.catalogs:
+            cls.load()
+        message = cls.catalogs[_locale.get()].get(key)
+        if message is None:
+            message = cls.catalogs[DEFAULT_LANGUAGE].get(key)
+            if message is None:
+                return key
+        return message.format_map(_Values(values))
 
 
-def active_translation(lang: str):
-    global _default_lang
+def active_translation(lang: str | None) -> Token:
+    """This function set the language of the current context from an Accept-Language header.
 
-    request_lang = lang.split(",")[0] if lang is not None else DEFAULT_LANGUAGE
+    :param lang: the Accept-Language header
+    :type lang: str | None
+    :returns: Token
 
-    _default_lang = (
-        DEFAULT_LANGUAGE if request_lang not in SUPPORTED_LANGUAGE else request_lang
-    )
-    i18n.set("locale", _default_lang)
-    i18n.set("fallback", DEFAULT_LANGUAGE)
-    i18n.load_path.append(f"./app/locales/{DEFAULT_LANGUAGE}")
-    if _default_lang != DEFAULT_LANGUAGE:
-        i18n.load_path.append(f"./app/locales/{_default_lang}")
+    """
+    return Translation.activate(lang)
@@ -0,0 +1,8 @@
+class AbilityError(Exception):
+    def __init__(self, endpoints: list[str], message: str = "Abilities aren't defined"):
+        self.message = message
+        self.endpoints = endpoints
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f"{self.message} -> endpoints : {', '.join(self.endpoints)}"
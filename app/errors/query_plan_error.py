@@ -0,0 +1,10 @@
+class UncacheableQueryError(Exception):
+    def __init__(
+        self, value_type: str, message: str = "Query can't be cached as a plan"
+    ):
+        self.message = message
+        self.value_type = value_type
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f"{self.message} -> the value of type '{self.value_type}' can't be bound as a parameter"
@@ -1,9 +1,10 @@
-import i18n
 from fastapi import HTTPException
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.decl_api import DeclarativeMeta
 
+from ..config.translation import Translation
 from ..errors.no_account_user import NoAccountUserError
 
 
@@ -17,6 +18,7 @@ class Check(BaseModel):
         attribute: str | None = None,
         check: bool = False,
         bypass: bool = False,
+        loaders: tuple | None = None,
     ):
         """This function check existance of a model by query and return this model.
 
@@ -26,17 +28,88 @@ class Check(BaseModel):
         :param status_code: the status code if failed
         :param attribute: the name of the attribute if check for unicity of the model
         :param check: a bool to check existance or not of the model
+        :param loaders: the loader options of the relationships of the model
         :type db: Session
         :type model_class: DeclarativeMeta
         :type query: dict
         :type status_code: int
         :type attribute: str | None
         :type check: bool
+        :type loaders: tuple | None
+        :returns: the model
+        :raises HTTPException: raises HTTP exception if the model is found with check = True or isn't found with check = False
+
+        """
+        db_model = model_class.find_by(db, loaders=loaders, **query)
+        return Check._check_model(
+            db_model, model_class, query, status_code, attribute, check, bypass
+        )
+
+    @staticmethod
+    async def model_exist_async(
+        db: AsyncSession,
+        model_class: DeclarativeMeta,
+        query: dict,
+        status_code: int,
+        attribute: str | None = None,
+        check: bool = False,
+        bypass: bool = False,
+        loaders: tuple | None = None,
+    ):
+        """This function check existance of a model by query with an async session and return this model.
+
+        :param db: the async session
+        :param model_class: the class of the model
+        :param query: the query to find the model
+        :param status_code: the status code if failed
+        :param attribute: the name of the attribute if check for unicity of the model
+        :param check: a bool to check existance or not of the model
+        :param loaders: the loader options of the relationships of the model
+        :type db: AsyncSession
+        :type model_class: DeclarativeMeta
+        :type query: dict
+        :type status_code: int
+        :type attribute: str | None
+        :type check: bool
+        :type loaders: tuple | None
+        :returns: the model
+        :raises HTTPException: raises HTTP exception if the model is found with check = True or isn't found with check = False
+
+        """
+        db_model = await model_class.find_by_async(db, loaders=loaders, **query)
+        return Check._check_model(
+            db_model, model_class, query, status_code, attribute, check, bypass
+        )
+
+    @staticmethod
+    def _check_model(
+        db_model,
+        model_class: DeclarativeMeta,
+        query: dict,
+        status_code: int,
+        attribute: str | None,
+        check: bool,
+        bypass: bool,
+    ):
+        """This function raise the error of model_exist if the model found doesn't match the check.
+
+        :param db_model: the model found or None
+        :param model_class: the class of the model
+        :param query: the query to find the model
+        :param status_code: the status code if failed
+        :param attribute: the name of the attribute if check for unicity of the model
+        :param check: a bool to check existance or not of the model
+        :param bypass: raise NoAccountUserError instead of an HTTP exception
+        :type model_class: DeclarativeMeta
+        :type query: dict
+        :type status_code: int
+        :type attribute: str | None
+        :type check: bool
+        :type bypass: bool
         :returns: the model
         :raises HTTPException: raises HTTP exception if the model is found with check = True or isn't found with check = False
 
         """
-        db_model = model_class.find_by(db, **query)
         db_model_exist = db_model is not None if check else db_model is None
         error = "errors.already_with_name" if check else "errors.not_found_with_name"
         if db_model_exist:
@@ -45,9 +118,9 @@ class Check(BaseModel):
             key = "name" if attribute is None else f"attributes.{attribute}"
             raise HTTPException(
                 status_code=status_code,
-                detail=i18n.t(
+                detail=Translation.t(
                     error,
-                    name=i18n.t(f"models.{model_class.__tablename__}.{key}"),
+                    name=Translation.t(f"models.{model_class.__tablename__}.{key}"),
                 ),
             )
         return db_model
@@ -0,0 +1,181 @@
+import base64
+import binascii
+import hashlib
+import json
+
+from fastapi import HTTPException, Query, Request, Response, status
+from fastapi.logger import logger
+from pydantic import BaseModel, ConfigDict
+
+from ..config.constants import MAX_PAGE_SIZE, SAFE_METHODS
+from ..config.translation import Translation
+from ..utils.table_version import TableVersion
+from .projection import FIELDS_DESCRIPTION
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# the JSON types of the items of a cursor
+CURSOR_SCALARS = (str, int, float, bool, type(None))
+
+
+class ListParams(BaseModel):
+    limit: int | None = None
+    after: str | None = None
+    stream: bool = False
+    ndjson: bool = False
+    fields: str | None = None
+    body: bytes = b""
+    request: Request | None = None
+    response: Response | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    async def depends(
+        cls,
+        request: Request,
+        response: Response,
+        limit: int | None = Query(
+            None,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="The size of the page (keyset pagination), all the rows if empty.",
+        ),
+        after: str | None = Query(
+            None, description="The cursor of the previous page (see the Link header)."
+        ),
+        stream: bool = Query(
+            False,
+            description="Stream the rows in a JSON array (NDJSON with 'Accept: application/x-ndjson').",
+        ),
+        fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    ) -> "ListParams":
+        """This function is the dependency giving the parameters of a list route.
+
+        :param request: the request
+        :param response: the response
+        :param limit: the size of the page
+        :param after: the opaque cursor of the previous page
+        :param stream: stream the rows instead of sending the whole list at once
+        :param fields: the comma-separated fields to return
+        :type request: Request
+        :type response: Response
+        :type limit: int | None
+        :type after: str | None
+        :type stream: bool
+        :type fields: str | None
+        :returns: ListParams
+
+        """
+        ndjson = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+        # the body of a POST list (filters) changes the list like the query string
+        body = b"" if request.method in SAFE_METHODS else await request.body()
+        return cls(
+            limit=limit,
+            after=after,
+            stream=stream or ndjson,
+            ndjson=ndjson,
+            fields=fields,
+            body=body,
+            request=request,
+            response=response,
+        )
+
+    @staticmethod
+    def encode_cursor(column: str, key: list) -> str:
+        """This function encode the last key of a page in an opaque cursor.
+
+        :param column: the name of the column ordering the pages
+        :param key: the last key [value of the column, primary key]
+        :type column: str
+        :type key: list
+        :returns: str
+
+        """
+        payload = json.dumps([column, *key], default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, column: str, model_class) -> list | None:
+        """This function decode the cursor of the request for the column ordering the pages.
+
+        :param column: the name of the column ordering the pages
+        :param model_class: the class of the model converting the key to the types of its columns
+        :type column: str
+        :returns: the last key [value of the column, primary key] or None
+        :raises HTTPException: raises HTTP exception if the cursor is invalid
+
+        """
+        if self.after is None:
+            return None
+        try:
+            padding = "=" * (-len(self.after) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(f"{self.after}{padding}"))
+            # only the list [column, value, primary key] of scalars written by encode_cursor is a cursor
+            if not isinstance(cursor, list) or not all(
+                isinstance(item, CURSOR_SCALARS) for item in cursor
+            ):
+                raise TypeError("the cursor isn't a list of scalars")
+            cursor_column, *key = cursor
+            if cursor_column != column:
+                raise ValueError(f"the cursor orders by {cursor_column}")
+            return model_class._keyset_key(column, key)
+        except (binascii.Error, ValueError, TypeError) as error:
+            logger.error(f"List params : invalid cursor {self.after} - {error}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=Translation.t("errors.invalid_cursor"),
+            )
+
+    def set_next(self, column: str, key: list | None) -> None:
+        """This function add the link to the next page in the headers of the response.
+
+        :param column: the name of the column ordering the pages
+        :param key: the last key of the page, None if it's the last page
+        :type column: str
+        :type key: list | None
+        :returns: None
+
+        """
+        if key is None or self.request is None or self.response is None:
+            return
+        next_url = self.request.url.include_query_params(
+            after=self.encode_cursor(column, key)
+        )
+        self.response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+    def etag_parts(self) -> tuple:
+        """This function get the parts of the request changing the list (url, format and digest of the body).
+
+        :returns: tuple
+
+        """
+        digest = hashlib.sha1(self.body).hexdigest() if self.body else None
+        return (str(self.request.url), self.ndjson, digest)
+
+    def needs_etag(self) -> bool:
+        """This function check if the list of the request has an ETag (the version of the table is read).
+
+        Only the requests with If-None-Match and the full lists (kept compressed under their ETag) have one, the
+        pages and the streams of the other requests are loaded without reading the version.
+
+        :returns: bool
+
+        """
+        if self.request is None:
+            return False
+        return "if-none-match" in self.request.headers or (
+            self.limit is None and not self.stream
+        )
+
+    def not_modified(self, etag: str) -> bool:
+        """This function check the If-None-Match header of the request and add the ETag in the headers of the response.
+
+        :param etag: the ETag of the current list
+        :type etag: str
+        :returns: True if the client already has this version of the list
+
+        """
+        if self.response is not None:
+            self.response.headers["ETag"] = etag
+        if self.request is None:
+            return False
+        return TableVersion.match(etag, self.request.headers.get("if-none-match"))
@@ -0,0 +1,76 @@
+from functools import lru_cache
+
+from fastapi import HTTPException, Query, status
+from fastapi.logger import logger
+from pydantic import BaseModel, ConfigDict, create_model
+
+from ..config.constants import PROJECTION_CACHE_SIZE
+from ..config.translation import Translation
+from ..schemas.custom_base import CustomBase
+
+FIELDS_DESCRIPTION = "The comma-separated fields to return (all the fields if empty)."
+
+
+class _ProjectionBase(CustomBase):
+    model_config = ConfigDict(from_attributes=True)
+
+
+class Projection(BaseModel):
+    @staticmethod
+    def query():
+        """This function get the 'fields' query parameter of a route.
+
+        :returns: the Query of the parameter
+
+        """
+        return Query(None, description=FIELDS_DESCRIPTION)
+
+    @staticmethod
+    def parse(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+        """This function get the requested fields of a response schema.
+
+        :param fields: the comma-separated fields of the request
+        :param schema: the response schema
+        :type fields: str | None
+        :type schema: type[BaseModel]
+        :returns: the fields in the order of the schema or None for all the fields
+        :raises HTTPException: raises HTTP exception if a field isn't in the schema
+
+        """
+        if not fields or schema is None:
+            return None
+        names = {name.strip() for name in fields.split(",") if name.strip()}
+        invalid_fields = sorted(
+            name for name in names if name not in schema.model_fields
+        )
+        if invalid_fields:
+            logger.error(f"Projection : invalid fields {invalid_fields}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=Translation.t(
+                    "errors.invalid_fields", fields=", ".join(invalid_fields)
+                ),
+            )
+        # in the order of the schema, the same fields give the same key of the caches whatever their order
+        return tuple(name for name in schema.model_fields if name in names) or None
+
+    @staticmethod
+    @lru_cache(maxsize=PROJECTION_CACHE_SIZE)
+    def schema(schema: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+        """This function get the response schema trimmed to the requested fields (built once per fields).
+
+        :param schema: the response schema
+        :param fields: the requested fields
+        :type schema: type[BaseModel]
+        :type fields: tuple[str, ...]
+        :returns: type[BaseModel]
+
+        """
+        return create_model(
+            f"{schema.__name__}Fields",
+            __base__=_ProjectionBase,
+            **{
+                name: (schema.model_fields[name].annotation, schema.model_fields[name])
+                for name in fields
+            },
+        )
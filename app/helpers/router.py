@@ -1,18 +1,39 @@
-import i18n
-from fastapi import HTTPException, status
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from .. import models, schemas
+from functools import lru_cache
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+
+from .. import errors, schemas
+from ..config.constants import STREAM_BATCH_SIZE
+from ..config.env import settings
+from ..config.translation import Translation
+from ..utils.compression import Compression
+from ..utils.fast_json import FastJSON
+from ..utils.loader_plan import LoaderPlan
+from ..utils.model_registry import ModelRegistry
+from ..utils.read_cache import ReadCache
+from ..utils.table_version import TableVersion
 from ..utils.tools import Tools
 from .check import Check
 from .check_uniq import CheckUniqHelper
+from .list_params import NDJSON_MEDIA_TYPE, ListParams
+from .projection import Projection
 
 
 class RouterModelHelper(BaseModel):
     name: str
     parents: list[str] = []
     uniq_list: list[CheckUniqHelper] = []
+    cursor_column: str = "id"
+    list_schema: type[BaseModel] | None = None
+    read_schema: type[BaseModel] | None = None
 
     def _add_to_query(
         self,
@@ -68,9 +89,7 @@ class RouterModelHelper(BaseModel):
         :returns: the class of the model self.name
 
         """
-        model_class = Tools.get_class_from_string(
-            models, f"{self.name}.{self.name.title().replace('_', '')}"
-        )
+        model_class = ModelRegistry.get_class(self.name)
         for uniq in self.uniq_list:
             if (
                 new_model_dict is None
@@ -105,20 +124,597 @@ class RouterModelHelper(BaseModel):
                 )
         return model_class
 
-    def list(self, db: Session, query: dict):
-        """This function is a generic list route.
+    def _check_parents_bulk(self, db: Session, rows: list[dict]) -> None:
+        """This function check the existence of the parents of all the rows with one query by parent.
+
+        :param db: the session
+        :param rows: the rows to write
+        :type db: Session
+        :type rows: list[dict]
+        :returns: None
+        :raises HTTPException: raises HTTP exception if a parent isn't found
+
+        """
+        for parent in self.parents:
+            model_parent = ModelRegistry.get_class(parent)
+            parent_ids = {row[f"{parent}_id"] for row in rows if f"{parent}_id" in row}
+            found_ids = set(
+                db.scalars(
+                    select(model_parent.id).where(model_parent.id.in_(parent_ids))
+                )
+            )
+            if parent_ids - found_ids:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=Translation.t(
+                        "errors.not_found_with_name",
+                        name=Translation.t(f"models.{model_parent.__tablename__}.name"),
+                    ),
+                )
+
+    def _check_uniq_bulk(
+        self, db: Session, model_class, rows: list[dict], update: bool = False
+    ) -> None:
+        """This function check for each attribute in uniq_list that the rows are uniq, with one query for all the rows.
+
+        :param db: the session
+        :param model_class: the class of the model
+        :param rows: the rows to write
+        :param update: True if the rows update existing models (found by their id)
+        :type db: Session
+        :type rows: list[dict]
+        :type update: bool
+        :returns: None
+        :raises HTTPException: raises HTTP exception if two rows or a row and a model have the same values
+
+        """
+        for uniq in self.uniq_list:
+            columns = [*uniq.equal_list, *uniq.ilike_list]
+
+            def uniq_key(values) -> tuple:
+                return tuple(
+                    str(value).lower() if column in uniq.ilike_list else value
+                    for column, value in zip(columns, values)
+                )
+
+            ids_by_key = {}
+            duplicated = False
+            for row in rows:
+                if not all(column in row for column in columns):
+                    continue
+                key = uniq_key([row[column] for column in columns])
+                duplicated = duplicated or key in ids_by_key
+                ids_by_key[key] = row.get("id")
+            if ids_by_key and not duplicated:
+                conditions = [
+                    getattr(model_class, column).in_(
+                        {row[column] for row in rows if column in row}
+                    )
+                    for column in uniq.equal_list
+                ] + [
+                    func.lower(getattr(model_class, column)).in_(
+                        {str(row[column]).lower() for row in rows if column in row}
+                    )
+                    for column in uniq.ilike_list
+                ]
+                existing = db.execute(
+                    select(
+                        model_class.id,
+                        *[getattr(model_class, column) for column in columns],
+                    ).where(*conditions)
+                )
+                duplicated = any(
+                    uniq_key(values) in ids_by_key
+                    and not (update and ids_by_key[uniq_key(values)] == id)
+                    for id, *values in existing
+                )
+            if duplicated:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=Translation.t(
+                        "errors.already_with_name",
+                        name=Translation.t(
+                            f"models.{model_class.__tablename__}.attributes.{uniq.name}"
+                        ),
+                    ),
+                )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def bulk_schema(model_class: type) -> type[BaseModel]:
+        """This function get the schema of a row of the bulk route of a model (built once per model).
+
+        The row has the columns of the table, each optional (an update sends only its changes) and typed by its column,
+        and no other key : an unknown key or a wrong type is a 422. The columns required by the mode (id to update, not
+        nullable columns to create) are checked by the database.
+
+        :param model_class: the class of the model
+        :type model_class: type
+        :returns: type[BaseModel]
+
+        """
+        fields = {}
+        for column in model_class.__table__.columns:
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = Any
+            fields[column.key] = (python_type | None, None)
+        return create_model(
+            f"{model_class.__name__}BulkRow",
+            __config__=ConfigDict(extra="forbid"),
+            **fields,
+        )
+
+    def bulk(
+        self, db: Session, rows: list[BaseModel | dict], mode: str = "create"
+    ) -> list:
+        """This function is a generic bulk route (create, update or upsert of the rows in one transaction).
+
+        :param db: the session
+        :param rows: the rows to write (with their id to update), bulk_schema instances or dicts
+        :param mode: create, update or upsert
+        :type db: Session
+        :type rows: list[BaseModel | dict]
+        :type mode: str
+        :returns: the list of the models written, in the order of the rows
+        :raises HTTPException: raises HTTP exception if a row is invalid
+
+        """
+        model_class = ModelRegistry.get_class(self.name)
+        rows = [
+            row.model_dump(exclude_unset=True) if isinstance(row, BaseModel) else row
+            for row in rows
+        ]
+        if mode == "update":
+            ids = {row.get("id") for row in rows}
+            found_ids = set(
+                db.scalars(select(model_class.id).where(model_class.id.in_(ids)))
+            )
+            if ids - found_ids:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=Translation.t(
+                        "errors.not_found_with_name",
+                        name=Translation.t(f"models.{model_class.__tablename__}.name"),
+                    ),
+                )
+        self._check_parents_bulk(db, rows)
+        self._check_uniq_bulk(db, model_class, rows, update=mode != "create")
+        bulk_write = {
+            "create": model_class.bulk_create,
+            "update": model_class.bulk_update,
+            "upsert": model_class.bulk_upsert,
+        }[mode]
+        try:
+            ids = bulk_write(db, rows)
+        except errors.columns_error.ColumnsError as columns_error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=Translation.t(
+                    "errors.invalid_columns", columns=", ".join(columns_error.columns)
+                ),
+            )
+        except (IntegrityError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=Translation.t("errors.bulk_conflict"),
+            )
+        db_models = {
+            db_model.id: db_model for db_model in model_class.where(db, id={"in_": ids})
+        }
+        return [db_models[id] for id in ids if id in db_models]
+
+    def _stream_rows(
+        self, db: Session, db_query: Query, ndjson: bool, schema: type[BaseModel]
+    ):
+        """This function serialize the rows of the query one batch at a time (NDJSON lines or JSON array).
+
+        The session is closed at the end of the stream because the dependency giving it is already done when the response is sent.
+
+        :param db: the session
+        :param db_query: the query of the rows
+        :param ndjson: True for NDJSON lines, False for a JSON array
+        :param schema: the schema of the rows
+        :type db: Session
+        :type db_query: Query
+        :type ndjson: bool
+        :type schema: type[BaseModel]
+        :returns: a generator of bytes
+
+        """
+        separator = b"\n" if ndjson else b","
+        try:
+            if not ndjson:
+                yield b"["
+            chunk = []
+            first_chunk = True
+            for db_model in db_query.yield_per(STREAM_BATCH_SIZE):
+                chunk.append(FastJSON.dump(schema, db_model))
+                if len(chunk) == STREAM_BATCH_SIZE:
+                    yield self._join_chunk(chunk, separator, ndjson, first_chunk)
+                    chunk = []
+                    first_chunk = False
+            if chunk:
+                yield self._join_chunk(chunk, separator, ndjson, first_chunk)
+            if not ndjson:
+                yield b"]"
+        finally:
+            db.close()
+
+    @staticmethod
+    def _join_chunk(
+        chunk: list[bytes], separator: bytes, ndjson: bool, first: bool
+    ) -> bytes:
+        """This function join the serialized rows of a batch.
+
+        :param chunk: the serialized rows
+        :param separator: the separator between two rows
+        :param ndjson: True for NDJSON lines, False for a JSON array
+        :param first: True if it's the first batch of the stream
+        :type chunk: list[bytes]
+        :type separator: bytes
+        :type ndjson: bool
+        :type first: bool
+        :returns: bytes
+
+        """
+        body = separator.join(chunk)
+        if ndjson:
+            return body + separator
+        return body if first else separator + body
+
+    def _list_projection(
+        self, params: ListParams | None
+    ) -> tuple[tuple[str, ...] | None, type[BaseModel] | None]:
+        """This function get the fields requested for a list and the list schema trimmed to these fields.
+
+        :param params: the parameters of the list route
+        :type params: ListParams | None
+        :returns: tuple with the fields (None for all) and the schema of the rows
+
+        """
+        fields = (
+            Projection.parse(params.fields, self.list_schema)
+            if params is not None
+            else None
+        )
+        if fields is None:
+            return (None, self.list_schema)
+        return (fields, Projection.schema(self.list_schema, fields))
+
+    def _fast_json(self, params: ListParams | None) -> bool:
+        """This function check if the list of a route is serialized by the helper (settings.json_fast_path).
+
+        The lists asked without the request (by the code) are models.
+
+        :param params: the parameters of the list route
+        :type params: ListParams | None
+        :returns: bool
+
+        """
+        return (
+            settings.json_fast_path
+            and self.list_schema is not None
+            and params is not None
+            and params.request is not None
+        )
+
+    def _snapshot(
+        self, etag: str | None, params: ListParams | None, fields: tuple | None
+    ) -> str | None:
+        """This function get the key of the compressed body of a full list (None if the list isn't kept compressed).
+
+        A full list (not paginated, not streamed) serialized by the helper is kept compressed for the clients accepting
+        gzip, under its ETag which changes with the version of the table.
+
+        :param etag: the ETag of the list
+        :param params: the parameters of the list route
+        :param fields: the requested fields
+        :type etag: str | None
+        :type params: ListParams | None
+        :type fields: tuple | None
+        :returns: str | None
+
+        """
+        if (
+            etag is None
+            or params.limit is not None
+            or settings.compression_snapshot_size <= 0
+            or not (fields or self._fast_json(params))
+            or not Compression.accepts(params.request)
+        ):
+            return None
+        return etag
+
+    @staticmethod
+    def _route_headers(response: Response, params: ListParams | None) -> Response:
+        """This function copy the headers set on the response of the route (ETag, next page) to a returned response.
+
+        :param response: the returned response
+        :param params: the parameters of the list route
+        :type response: Response
+        :type params: ListParams | None
+        :returns: Response
+
+        """
+        if params is not None and params.response is not None:
+            for header in ["ETag", "Link"]:
+                if header in params.response.headers:
+                    response.headers[header] = params.response.headers[header]
+        return response
+
+    @staticmethod
+    def _json_response(
+        schema: type[BaseModel],
+        db_models: list,
+        params: ListParams | None,
+        snapshot: str | None = None,
+    ) -> Response:
+        """This function serialize the rows of a list in one pass with a schema (the response_model of the route is bypassed).
+
+        :param schema: the trimmed schema
+        :param db_models: the rows
+        :param params: the parameters of the list route
+        :param snapshot: the key to keep the compressed body under
+        :type schema: type[BaseModel]
+        :type db_models: list
+        :type params: ListParams | None
+        :type snapshot: str | None
+        :returns: Response
+
+        """
+        content = FastJSON.dump_list(schema, db_models)
+        compressed = (
+            Compression.snapshot(snapshot, content) if snapshot is not None else None
+        )
+        if compressed is not None:
+            response = Compression.response(compressed)
+        else:
+            response = Response(content=content, media_type="application/json")
+        return RouterModelHelper._route_headers(response, params)
+
+    def stream(self, db: Session, query: dict, params: ListParams) -> StreamingResponse:
+        """This function is a generic list route streaming the rows as they are read from the database.
 
         :param db: the session
         :param query: the query to search the list of the model
+        :param params: the parameters of the list route
         :type db: Session
         :type query: dict
+        :type params: ListParams
+        :returns: StreamingResponse
+
+        """
+        model_class = ModelRegistry.get_class(self.name)
+        fields, schema = self._list_projection(params)
+        db_query = model_class._query(
+            db,
+            keyset={"column": self.cursor_column},
+            loaders=LoaderPlan.options(model_class, schema),
+            fields=fields,
+            **query,
+        )
+        return StreamingResponse(
+            self._stream_rows(db, db_query, params.ndjson, schema),
+            media_type=NDJSON_MEDIA_TYPE if params.ndjson else "application/json",
+        )
+
+    async def _stream_rows_async(
+        self, db: AsyncSession, statement, ndjson: bool, schema: type[BaseModel]
+    ):
+        """This function serialize the rows of the statement one batch at a time with an async session (NDJSON lines or JSON array).
+
+        :param db: the async session
+        :param statement: the statement of the rows
+        :param ndjson: True for NDJSON lines, False for a JSON array
+        :param schema: the schema of the rows
+        :type db: AsyncSession
+        :type ndjson: bool
+        :type schema: type[BaseModel]
+        :returns: an async generator of bytes
+
+        """
+        separator = b"\n" if ndjson else b","
+        try:
+            if not ndjson:
+                yield b"["
+            first_chunk = True
+            result = await db.stream_scalars(
+                statement.execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for db_models in result.partitions(STREAM_BATCH_SIZE):
+                chunk = [FastJSON.dump(schema, db_model) for db_model in db_models]
+                yield self._join_chunk(chunk, separator, ndjson, first_chunk)
+                first_chunk = False
+            if not ndjson:
+                yield b"]"
+        finally:
+            await db.close()
+
+    def stream_async(
+        self, db: AsyncSession, query: dict, params: ListParams
+    ) -> StreamingResponse:
+        """This function is the list route streaming the rows as they are read from the database with an async session.
+
+        :param db: the async session
+        :param query: the query to search the list of the model
+        :param params: the parameters of the list route
+        :type db: AsyncSession
+        :type query: dict
+        :type params: ListParams
+        :returns: StreamingResponse
+
+        """
+        model_class = ModelRegistry.get_class(self.name)
+        fields, schema = self._list_projection(params)
+        statement = model_class._query(
+            db.sync_session,
+            keyset={"column": self.cursor_column},
+            loaders=LoaderPlan.options(model_class, schema),
+            fields=fields,
+            **query,
+        ).statement
+        return StreamingResponse(
+            self._stream_rows_async(db, statement, params.ndjson, schema),
+            media_type=NDJSON_MEDIA_TYPE if params.ndjson else "application/json",
+        )
+
+    def list(self, db: Session, query: dict, params: ListParams | None = None):
+        """This function is a generic list route (paginated by keyset if a limit is given in params, streamed if asked).
+
+        With the params of a request with If-None-Match or of a full list, the list has an ETag and a request with the
+        same ETag in If-None-Match gets a 304.
+        A full list is kept compressed for the clients accepting gzip until the version of the table changes.
+
+        :param db: the session
+        :param query: the query to search the list of the model
+        :param params: the parameters of the list route
+        :type db: Session
+        :type query: dict
+        :type params: ListParams | None
         :returns: the list of the model
 
         """
-        model_class = Tools.get_class_from_string(
-            models, f"{self.name}.{self.name.title().replace('_', '')}"
+        model_class = ModelRegistry.get_class(self.name)
+        fields, schema = self._list_projection(params)
+        etag = None
+        if params is not None and params.needs_etag():
+            # conditional GET : the version of the table is checked before loading the rows
+            etag = TableVersion.etag(db, model_class, *params.etag_parts())
+            if params.not_modified(etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+        loaders = LoaderPlan.options(model_class, schema)
+        snapshot = self._snapshot(etag, params, fields)
+        if params is None or params.limit is None:
+            if params is not None and params.stream and self.list_schema is not None:
+                response = self.stream(db, query, params)
+                if etag is not None:
+                    response.headers["ETag"] = etag
+                return response
+            if snapshot is not None:
+                content = Compression.get(snapshot)
+                if content is not None:
+                    return self._route_headers(Compression.response(content), params)
+        db_models = self._load(db, model_class, query, params, loaders, fields)
+        if fields or self._fast_json(params):
+            return self._json_response(schema, db_models, params, snapshot)
+        return db_models
+
+    def _load(
+        self,
+        db: Session,
+        model_class,
+        query: dict,
+        params: ListParams | None,
+        loaders: tuple,
+        fields: tuple | None,
+    ) -> list:
+        """This function load the rows of a list (a page by keyset if a limit is given in params).
+
+        :param db: the session
+        :param model_class: the class of the model
+        :param query: the query to search the list of the model
+        :param params: the parameters of the list route
+        :param loaders: the loader options of the relationships
+        :param fields: the requested fields (None for all)
+        :type db: Session
+        :type query: dict
+        :type params: ListParams | None
+        :type loaders: tuple
+        :type fields: tuple | None
+        :returns: list of the models
+
+        """
+        if params is None or params.limit is None:
+            return model_class.where(db, loaders=loaders, fields=fields, **query)
+        db_models, last_key = model_class.paginate(
+            db,
+            loaders=loaders,
+            fields=fields,
+            limit=params.limit,
+            after=params.decode_cursor(self.cursor_column, model_class),
+            column=self.cursor_column,
+            **query,
         )
-        return model_class.where(db, **query)
+        params.set_next(self.cursor_column, last_key)
+        return db_models
+
+    def list_models(
+        self, db: Session, query: dict, params: ListParams | None = None
+    ) -> list:
+        """This function get the models of a list (paginated by keyset if a limit is given in params).
+
+        Unlike list, it never returns a Response (304, stream or serialized list), for the routes which put the list
+        in their own response.
+
+        :param db: the session
+        :param query: the query to search the list of the model
+        :param params: the parameters of the list route
+        :type db: Session
+        :type query: dict
+        :type params: ListParams | None
+        :returns: list of the models
+
+        """
+        model_class = ModelRegistry.get_class(self.name)
+        loaders = LoaderPlan.options(model_class, self.list_schema)
+        return self._load(db, model_class, query, params, loaders, None)
+
+    async def list_async(
+        self, db: AsyncSession, query: dict, params: ListParams | None = None
+    ):
+        """This function is the generic list route with an async session (see list).
+
+        :param db: the async session
+        :param query: the query to search the list of the model
+        :param params: the parameters of the list route
+        :type db: AsyncSession
+        :type query: dict
+        :type params: ListParams | None
+        :returns: the list of the model
+
+        """
+        model_class = ModelRegistry.get_class(self.name)
+        fields, schema = self._list_projection(params)
+        etag = None
+        if params is not None and params.needs_etag():
+            etag = await TableVersion.etag_async(db, model_class, *params.etag_parts())
+            if params.not_modified(etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+        loaders = LoaderPlan.options(model_class, schema)
+        snapshot = self._snapshot(etag, params, fields)
+        if params is None or params.limit is None:
+            if params is not None and params.stream and self.list_schema is not None:
+                response = self.stream_async(db, query, params)
+                if etag is not None:
+                    response.headers["ETag"] = etag
+                return response
+            if snapshot is not None:
+                content = Compression.get(snapshot)
+                if content is not None:
+                    return self._route_headers(Compression.response(content), params)
+            db_models = await model_class.where_async(
+                db, loaders=loaders, fields=fields, **query
+            )
+        else:
+            db_models, last_key = await model_class.paginate_async(
+                db,
+                loaders=loaders,
+                fields=fields,
+                limit=params.limit,
+                after=params.decode_cursor(self.cursor_column, model_class),
+                column=self.cursor_column,
+                **query,
+            )
+            params.set_next(self.cursor_column, last_key)
+        if fields or self._fast_json(params):
+            return self._json_response(schema, db_models, params, snapshot)
+        return db_models
 
     def create(self, db: Session, model_dict: dict):
         """This function is a generic create route.
@@ -131,9 +727,7 @@ class RouterModelHelper(BaseModel):
 
         """
         for parent in self.parents:
-            model_parent = Tools.get_class_from_string(
-                models, f"{parent}.{parent.title().replace('_', '')}"
-            )
+            model_parent = ModelRegistry.get_class(parent)
             Check.model_exist(
                 db=db,
                 model_class=model_parent,
@@ -143,27 +737,168 @@ class RouterModelHelper(BaseModel):
         model_class = self._check_uniq(db, model_dict)
         return model_class.create(db, **model_dict)
 
-    def read(self, db: Session, id: int):
+    @staticmethod
+    def _read_loaders(model_class, schema: type[BaseModel], fields: tuple) -> tuple:
+        """This function get the loader options of a read trimmed to some fields.
+
+        :param model_class: the class of the model
+        :param schema: the trimmed read schema
+        :param fields: the requested fields
+        :type schema: type[BaseModel]
+        :type fields: tuple
+        :returns: tuple
+
+        """
+        return (
+            *LoaderPlan.options(model_class, schema),
+            model_class._load_only(fields),
+        )
+
+    def read(
+        self, db: Session, id: int, cache: bool = False, fields: str | None = None
+    ):
         """This function is a generic read route.
 
+        With cache, the response serialized by read_schema is read through the read cache (invalidated by the writes of the model).
+        With fields, only the columns of the fields are loaded and the response is serialized by the trimmed read_schema.
+
         :param db: the session
         :param id: the id of the searched model
+        :param cache: return the cached JSON response
+        :param fields: the comma-separated fields to return
         :type db: Session
         :type id: int
-        :returns: the model
+        :type cache: bool
+        :type fields: str | None
+        :returns: the model (a Response with cache or fields)
 
         """
-        model_class = Tools.get_class_from_string(
-            models, f"{self.name}.{self.name.title().replace('_', '')}"
-        )
+        model_class = ModelRegistry.get_class(self.name)
+        names = Projection.parse(fields, self.read_schema)
+        if names:
+            schema = Projection.schema(self.read_schema, names)
+            db_model = Check.model_exist(
+                db=db,
+                model_class=model_class,
+                query={"id": id},
+                status_code=status.HTTP_404_NOT_FOUND,
+                loaders=self._read_loaders(model_class, schema, names),
+            )
+            return Response(
+                content=FastJSON.dump(schema, db_model),
+                media_type="application/json",
+            )
+        if cache and self.read_schema is not None:
+            content = ReadCache.get(model_class.__tablename__, id)
+            if content is None:
+                db_model = self.read(db, id)
+                content = FastJSON.dump(self.read_schema, db_model)
+                ReadCache.set(model_class.__tablename__, id, content)
+            return Response(content=content, media_type="application/json")
         db_model = Check.model_exist(
             db=db,
             model_class=model_class,
             query={"id": id},
             status_code=status.HTTP_404_NOT_FOUND,
+            loaders=LoaderPlan.options(model_class, self.read_schema),
         )
         return db_model
 
+    async def read_async(
+        self, db: AsyncSession, id: int, cache: bool = False, fields: str | None = None
+    ):
+        """This function is the generic read route with an async session (see read).
+
+        :param db: the async session
+        :param id: the id of the searched model
+        :param cache: return the cached JSON response
+        :param fields: the comma-separated fields to return
+        :type db: AsyncSession
+        :type id: int
+        :type cache: bool
+        :type fields: str | None
+        :returns: the model (a Response with cache or fields)
+
+        """
+        model_class = ModelRegistry.get_class(self.name)
+        names = Projection.parse(fields, self.read_schema)
+        if names:
+            schema = Projection.schema(self.read_schema, names)
+            db_model = await Check.model_exist_async(
+                db=db,
+                model_class=model_class,
+                query={"id": id},
+                status_code=status.HTTP_404_NOT_FOUND,
+                loaders=self._read_loaders(model_class, schema, names),
+            )
+            return Response(
+                content=FastJSON.dump(schema, db_model),
+                media_type="application/json",
+            )
+        if cache and self.read_schema is not None:
+            content = ReadCache.get(model_class.__tablename__, id)
+            if content is None:
+                db_model = await self.read_async(db, id)
+                content = FastJSON.dump(self.read_schema, db_model)
+                ReadCache.set(model_class.__tablename__, id, content)
+            return Response(content=content, media_type="application/json")
+        return await Check.model_exist_async(
+            db=db,
+            model_class=model_class,
+            query={"id": id},
+            status_code=status.HTTP_404_NOT_FOUND,
+            loaders=LoaderPlan.options(model_class, self.read_schema),
+        )
+
+    async def read_route(
+        self,
+        db: Session | AsyncSession,
+        id: int,
+        cache: bool = False,
+        fields: str | None = None,
+    ):
+        """This function is the read route for the session of Dependency.get_read_db (sync or async).
+
+        The sync read runs in the thread pool, so the route is the same whatever the database.
+
+        :param db: the session or the async session
+        :param id: the id of the searched model
+        :param cache: return the cached JSON response
+        :param fields: the comma-separated fields to return
+        :type db: Session | AsyncSession
+        :type id: int
+        :type cache: bool
+        :type fields: str | None
+        :returns: the model (a Response with cache or fields)
+
+        """
+        if isinstance(db, AsyncSession):
+            return await self.read_async(db, id, cache=cache, fields=fields)
+        return await run_in_threadpool(self.read, db, id, cache=cache, fields=fields)
+
+    async def list_route(
+        self,
+        db: Session | AsyncSession,
+        query: dict,
+        params: ListParams | None = None,
+    ):
+        """This function is the list route for the session of Dependency.get_read_db (sync or async).
+
+        The sync list runs in the thread pool, so the route is the same whatever the database.
+
+        :param db: the session or the async session
+        :param query: the query to search the list of the model
+        :param params: the parameters of the list route
+        :type db: Session | AsyncSession
+        :type query: dict
+        :type params: ListParams | None
+        :returns: the list of the model
+
+        """
+        if isinstance(db, AsyncSession):
+            return await self.list_async(db, query, params)
+        return await run_in_threadpool(self.list, db, query, params)
+
     def update(self, db: Session, id: int, new_model_dict: dict):
         """This function is a generic update route.
 
@@ -212,18 +947,14 @@ class RouterLinkHelper(BaseModel):
         for relation in self.relations:
             relation_id = f"{relation}_id"
             query[relation_id] = model_dict[relation_id]
-            model_relation = Tools.get_class_from_string(
-                models, f"{relation}.{relation.title().replace('_', '')}"
-            )
+            model_relation = ModelRegistry.get_class(relation)
             Check.model_exist(
                 db=db,
                 model_class=model_relation,
                 query={"id": model_dict[relation_id]},
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
-        model_class = Tools.get_class_from_string(
-            models, f"{self.name}.{self.name.title().replace('_', '')}"
-        )
+        model_class = ModelRegistry.get_class(self.name)
         Check.model_exist(
             db=db,
             model_class=model_class,
@@ -243,9 +974,7 @@ class RouterLinkHelper(BaseModel):
         :returns: dict
 
         """
-        model_class = Tools.get_class_from_string(
-            models, f"{self.name}.{self.name.title().replace('_', '')}"
-        )
+        model_class = ModelRegistry.get_class(self.name)
         query = {}
         for relation in self.relations:
             relation_id = f"{relation}_id"
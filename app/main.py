@@ -1,9 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .config.env import settings
 from .config.lifespan import lifespan
 from .config.metadata_tag import MetadataTag
+from .utils.fast_json import FastJSON
 from .utils.middleware import add_middlewares
 
 # CREATE APP WITH GENERIC PARAMS
@@ -18,6 +20,9 @@ app = FastAPI(
     lifespan=lifespan,
     title=settings.fastapi_title,
     version=settings.app_version,
+    # the JSON library of the responses (JSON_RESPONSE), the lists of the models are
+    # serialized in one pass by their schema (JSON_FAST_PATH, see RouterModelHelper)
+    default_response_class=FastJSON.response_class(settings.json_response),
 )
 
 app.add_middleware(
@@ -27,4 +32,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# gzip the bodies (streamed or not) above the minimum size, the bodies already compressed are left untouched
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    compresslevel=settings.compression_level,
+)
 add_middlewares(app)
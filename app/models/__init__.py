@@ -1,4 +1,6 @@
 from ..config.database import Base
+from ..utils.model_registry import ModelRegistry
 from ..utils.tools import Tools
 
 Tools.import_all_module_in_package(__path__[0], __package__)
+ModelRegistry.build(Base)
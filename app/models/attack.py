@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy import (
     ARRAY,
     TIMESTAMP,
@@ -24,7 +26,7 @@ class Attack(BaseModel):
 
     costs = Column(ARRAY(Integer), nullable=True)
 
-    updated_at = Column(TIMESTAMP)
+    updated_at = Column(TIMESTAMP, onupdate=datetime.now)
     created_at = Column(TIMESTAMP)
 
     PrimaryKeyConstraint("id")
@@ -1,17 +1,64 @@
+from datetime import date, time
+from functools import lru_cache
+from itertools import groupby
+
 from fastapi.logger import logger
-from sqlalchemy import Column, ForeignKey, Integer, not_
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    Text,
+    and_,
+    cast,
+    func,
+    insert,
+    inspect,
+    literal,
+    not_,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.associationproxy import ObjectAssociationProxyInstance
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import Session, joinedload, relationship
+from sqlalchemy.orm import Session, joinedload, load_only, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.elements import BinaryExpression, UnaryExpression
 
 from .. import errors
+from ..config.constants import BULK_BATCH_SIZE
+from ..config.env import settings
+from ..utils.query_plan import QueryPlanCache
+from ..utils.read_cache import ReadCache
+from ..utils.table_version import TableVersion
+from ..utils.unit_of_work import UnitOfWork
 from . import Base
 
 
+@lru_cache(maxsize=None)
+def _type_adapter(python_type: type) -> TypeAdapter:
+    """This function get the (cached) validator of a python type.
+
+    :param python_type: the python type
+    :type python_type: type
+    :returns: TypeAdapter
+
+    """
+    return TypeAdapter(python_type)
+
+
 class BaseModel(Base):
     __abstract__ = True
+    # the generated columns are fetched by the INSERT/UPDATE (RETURNING when the database supports it)
+    __mapper_args__ = {"eager_defaults": True}
     _errors: Exception | None = None
+    _query_plans = QueryPlanCache(maxsize=settings.query_plan_cache_size)
+    # the functions called after the bulk writes of each table (the bulk statements don't send the mapper events)
+    _bulk_write_listeners: dict[str, list] = {}
 
     def __repr__(self) -> str:
         """This function get the str of an instance.
@@ -19,9 +66,7 @@ class BaseModel(Base):
         :returns: str
 
         """
-        columns = [
-            f"{key}={getattr(self, key)}" for key in self.__mapper__.columns.keys()
-        ]
+        columns = [f"{key}={getattr(self, key)}" for key in self.__model_info__.columns]
         return f"{self.__class__.__name__}({', '.join(columns)})"
 
     def as_dict(self) -> dict:
@@ -31,8 +76,49 @@ class BaseModel(Base):
         :returns: dict
 
         """
-        keys = list(self.__dict__.keys())
-        return {key: getattr(self, key) for key in keys if not key.startswith("_")}
+        attributes = self.__model_info__.attributes
+        keys = [key for key in self.__dict__ if key in attributes]
+        return {key: getattr(self, key) for key in keys}
+
+    @classmethod
+    def _after_write(cls, id: int | None = None) -> None:
+        """This function bump the version of the table and invalidate the cached reads after a write.
+
+        :param cls: the class
+        :param id: the id of the written instance, None if several instances are written
+        :type id: int | None
+        :returns: None
+
+        """
+        TableVersion.bump(cls.__tablename__)
+        ReadCache.invalidate(cls.__tablename__, id)
+
+    @classmethod
+    def _after_bulk_write(cls, db: Session, ids: list[int]) -> None:
+        """This function do the actions of a write after a bulk write, then call the bulk write listeners of the table.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param ids: the ids of the written instances
+        :type db: Session
+        :type ids: list[int]
+        :returns: None
+
+        """
+        cls._after_write()
+        for listener in cls._bulk_write_listeners.get(cls.__tablename__, []):
+            listener(db, ids)
+
+    @classmethod
+    def listen_bulk_write(cls, listener) -> None:
+        """This function call a function after each bulk write of the model, like after_insert and after_update for a save.
+
+        :param cls: the class
+        :param listener: the function called with the session and the ids of the written instances
+        :returns: None
+
+        """
+        cls._bulk_write_listeners.setdefault(cls.__tablename__, []).append(listener)
 
     def delete(self, db: Session) -> bool:
         """This function delete the instance from the database and return True.
@@ -44,62 +130,168 @@ class BaseModel(Base):
 
         """
         self._errors = None
+        id = self.id
         db.delete(self)
-        db.commit()
+        if UnitOfWork.get(db) is None:
+            db.commit()
+        else:
+            db.flush()
+        UnitOfWork.on_commit(db, lambda: self._after_write(id))
         return True
 
-    def save(self, db: Session) -> bool:
+    def save(self, db: Session, refresh: bool = True) -> bool:
         """This function save the instance in the database and return a bool.
 
+        The columns are loaded by the flush (generated columns with RETURNING) and kept after the commit,
+        so the instance isn't reloaded with a SELECT. In a unit of work (UnitOfWork.begin), the instance
+        is only flushed and the session is committed at the end of the unit of work.
+
         :param self: the instance
         :param db: the connection with the database
+        :param refresh: False if the instance isn't used after the save (expired by the commit)
         :type db: Session
+        :type refresh: bool
         :returns: bool
 
         """
         self._errors = None
+        unit = UnitOfWork.get(db)
+        inserted = inspect(self).key is None
         try:
             db.add(self)
-            db.commit()
-            db.refresh(self)
+            db.flush()
+            id = self.id
+            if unit is None:
+                values = self._loaded_columns(inserted) if refresh else None
+                db.commit()
+                if values is not None:
+                    self._restore_columns(db, values)
         except Exception as inst:
             self._errors = inst
-            db.rollback()
+            if unit is None:
+                db.rollback()
+            else:
+                unit.fail(inst)
             return False
+        UnitOfWork.on_commit(db, lambda: self._after_write(id))
         return True
 
-    def update(self, db: Session, **columns):
+    def _loaded_columns(self, inserted: bool) -> dict:
+        """This function get the values of the columns known after the flush.
+
+        The columns not given to an INSERT and without server default are NULL.
+
+        :param self: the instance
+        :param inserted: True if the flush inserted the instance
+        :type inserted: bool
+        :returns: dict
+
+        """
+        values = {}
+        for key, column in self.__model_info__.columns.items():
+            if key in self.__dict__:
+                values[key] = self.__dict__[key]
+            elif inserted and column.server_default is None:
+                values[key] = None
+        return values
+
+    def _restore_columns(self, db: Session, values: dict) -> None:
+        """This function set the values of the columns expired by the commit, refresh the instance if some are missing.
+
+        :param self: the instance
+        :param db: the connection with the database
+        :param values: the values of the columns before the commit
+        :type db: Session
+        :type values: dict
+        :returns: None
+
+        """
+        if len(values) < len(self.__model_info__.columns):
+            db.refresh(self)
+            return
+        for key, value in values.items():
+            set_committed_value(self, key, value)
+
+    def update(self, db: Session, refresh: bool = True, **columns):
         """This function update the instance in the database and return a bool.
 
         :param self: the instance
         :param db: the connection with the database
+        :param refresh: False if the instance isn't used after the update
         :param columns: keyword arguments with the columns to change
         :type db: Session
+        :type refresh: bool
         :returns: bool
 
         """
         self._errors = None
-        invalid_columns = []
-        _columns_nullable = []
-        for _name, _column in self.__table__.columns.items():
-            if _column.nullable:
-                _columns_nullable.append(_name)
-        for key in columns:
-            if key in self.__table__.columns.keys():
-                if (
-                    columns[key] is not None
-                    or key in _columns_nullable
-                    and getattr(self, key) != columns[key]
-                ):
-                    setattr(self, key, columns[key])
-            else:
-                invalid_columns.append(key)
+        try:
+            values = self._update_values(columns)
+        except errors.columns_error.ColumnsError as error:
+            self._errors = error
+            return False
+        for key, value in values.items():
+            if value is not None or getattr(self, key) is not None:
+                setattr(self, key, value)
+        return self.save(db, refresh=refresh)
+
+    @classmethod
+    def _update_values(cls, columns: dict) -> dict:
+        """This function check the columns of an update and drop the None values of the columns not nullable.
+
+        :param cls: the class
+        :param columns: the columns to change
+        :type columns: dict
+        :returns: dict
+        :raises ColumnsError: raises if a column isn't in the table
+
+        """
+        info = cls.__model_info__
+        invalid_columns = [key for key in columns if key not in info.columns]
         if invalid_columns:
-            self._errors = errors.columns_error.ColumnsError(
-                tablename=self.__tablename__, columns=invalid_columns
+            raise errors.columns_error.ColumnsError(
+                tablename=cls.__tablename__, columns=invalid_columns
             )
-            return False
-        return self.save(db)
+        return {
+            key: value
+            for key, value in columns.items()
+            if value is not None or key in info.nullable
+        }
+
+    @classmethod
+    def update_by_id(cls, db: Session, id: int, **columns) -> bool:
+        """This function update an instance with a single UPDATE (without loading or refreshing it) and return a bool.
+
+        The instance in the session, if any, is expired to be reloaded on its next access. In a unit of work, the
+        UPDATE is committed at the end of the unit of work.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param id: the id of the instance
+        :param columns: keyword arguments with the columns to change
+        :type db: Session
+        :type id: int
+        :returns: True if the instance exists
+        :raises ColumnsError: raises if a column isn't in the table
+
+        """
+        values = cls._update_values(columns)
+        primary_key = getattr(cls, cls.__model_info__.primary_key)
+        if values:
+            result = db.execute(
+                update(cls)
+                .where(primary_key == id)
+                .values(values)
+                .execution_options(synchronize_session="fetch")
+            )
+            found = result.rowcount > 0
+        else:
+            found = db.scalar(select(primary_key).where(primary_key == id)) is not None
+        if UnitOfWork.get(db) is None:
+            db.commit()
+        if found and values:
+            UnitOfWork.on_commit(db, lambda: cls._after_write(id))
+        return found
 
     @classmethod
     def count(cls, db: Session, **columns):
@@ -115,21 +307,257 @@ class BaseModel(Base):
         return cls._query(db, **columns).count()
 
     @classmethod
-    def create(cls, db: Session, **columns):
+    def create(cls, db: Session, refresh: bool = True, **columns):
         """This function create an instance in the database.
 
         :param cls: the class
         :param db: the connection with the database
+        :param refresh: False if the instance isn't used after the creation
         :param columns: keyword arguments with the columns to create
         :type db: Session
+        :type refresh: bool
         :returns: an instance
 
         """
         # control the existence of the column
         _model_cls = cls(**columns)
-        _model_cls.save(db)
+        _model_cls.save(db, refresh=refresh)
         return _model_cls
 
+    @classmethod
+    def _bulk_rows(cls, rows: list[dict]) -> list[dict]:
+        """This function check the columns of the rows and convert the ISO strings of the date columns.
+
+        :param cls: the class
+        :param rows: the rows to write
+        :type rows: list[dict]
+        :returns: list[dict]
+        :raises ColumnsError: raises if a row has a column which isn't in the table
+
+        """
+        info = cls.__model_info__
+        invalid_columns = sorted(
+            {key for row in rows for key in row} - info.columns.keys()
+        )
+        if invalid_columns:
+            raise errors.columns_error.ColumnsError(
+                tablename=cls.__tablename__, columns=invalid_columns
+            )
+        dates = {
+            name: python_type
+            for name, python_type in info.types.items()
+            if isinstance(python_type, type) and issubclass(python_type, date | time)
+        }
+        return [
+            {
+                key: (
+                    dates[key].fromisoformat(value)
+                    if key in dates and isinstance(value, str)
+                    else value
+                )
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _bulk_batches(rows: list[dict], batch_size: int):
+        """This function split the rows in batches of rows with the same columns (one executemany each).
+
+        :param rows: the rows to write
+        :param batch_size: the maximum number of rows in a batch
+        :type rows: list[dict]
+        :type batch_size: int
+        :returns: a generator of list[dict]
+
+        """
+        for _, same_columns in groupby(rows, key=lambda row: tuple(sorted(row))):
+            same_columns = list(same_columns)
+            for start in range(0, len(same_columns), batch_size):
+                yield same_columns[start : start + batch_size]
+
+    @classmethod
+    def _bulk_write(
+        cls,
+        db: Session,
+        build_statement,
+        rows: list[dict],
+        batch_size: int,
+        returning: bool = True,
+    ) -> list[int]:
+        """This function execute the statement of each batch of rows in one transaction (the one of the unit of work if any).
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param build_statement: a function giving the statement (returning the ids or not) for the columns of a batch
+        :param rows: the rows to write
+        :param batch_size: the maximum number of rows by executemany
+        :param returning: True if the statements return the ids
+        :type db: Session
+        :type rows: list[dict]
+        :type batch_size: int
+        :type returning: bool
+        :returns: list of the ids returned by the statements
+        :raises Exception: raises the error of the database after the rollback
+
+        """
+        unit = UnitOfWork.get(db)
+        ids = []
+        try:
+            for batch in cls._bulk_batches(cls._bulk_rows(rows), batch_size):
+                result = db.execute(build_statement(tuple(sorted(batch[0]))), batch)
+                if returning:
+                    ids += result.scalars().all()
+            if unit is None:
+                db.commit()
+        except Exception as error:
+            if unit is None:
+                db.rollback()
+            else:
+                unit.fail(error)
+            raise
+        written_ids = ids if returning else [row["id"] for row in rows]
+        UnitOfWork.on_commit(db, lambda: cls._after_bulk_write(db, written_ids))
+        return ids
+
+    @classmethod
+    def bulk_create(
+        cls, db: Session, rows: list[dict], batch_size: int = BULK_BATCH_SIZE
+    ) -> list[int]:
+        """This function create several instances with batched INSERT in one transaction.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param rows: the columns of each instance to create
+        :param batch_size: the maximum number of rows by INSERT
+        :type db: Session
+        :type rows: list[dict]
+        :type batch_size: int
+        :returns: the ids of the instances created (in the order of the rows)
+
+        """
+        return cls._bulk_write(
+            db,
+            lambda columns: insert(cls).returning(cls.id, sort_by_parameter_order=True),
+            rows,
+            batch_size,
+        )
+
+    @classmethod
+    def bulk_update(
+        cls, db: Session, rows: list[dict], batch_size: int = BULK_BATCH_SIZE
+    ) -> list[int]:
+        """This function update several instances (found by the id of each row) with batched UPDATE in one transaction.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param rows: the id and the columns to change of each instance
+        :param batch_size: the maximum number of rows by UPDATE
+        :type db: Session
+        :type rows: list[dict]
+        :type batch_size: int
+        :returns: the ids of the instances updated
+
+        """
+        cls._bulk_write(
+            db, lambda columns: update(cls), rows, batch_size, returning=False
+        )
+        return [row["id"] for row in rows]
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        db: Session,
+        rows: list[dict],
+        index_elements: list[str] = ["id"],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> list[int]:
+        """This function create or update several instances with INSERT ... ON CONFLICT (PostgreSQL, SQLite) in one transaction.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param rows: the columns of each instance
+        :param index_elements: the columns of the unique constraint finding the existing instances
+        :param batch_size: the maximum number of rows by INSERT
+        :type db: Session
+        :type rows: list[dict]
+        :type index_elements: list[str]
+        :type batch_size: int
+        :returns: the ids of the instances created or updated (in the order of the rows)
+
+        """
+        dialect_insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(
+            db.bind.dialect.name
+        )
+        if dialect_insert is None:
+            # no ON CONFLICT : one merge by row, still in one transaction
+            merged = [db.merge(cls(**row)) for row in cls._bulk_rows(rows)]
+            db.flush()
+            ids = [model.id for model in merged]
+            if UnitOfWork.get(db) is None:
+                db.commit()
+            UnitOfWork.on_commit(db, cls._after_write)
+            return ids
+
+        def build_statement(columns: tuple):
+            statement = dialect_insert(cls)
+            updated = {
+                column: statement.excluded[column]
+                for column in columns
+                if column not in index_elements
+            }
+            statement = (
+                statement.on_conflict_do_update(
+                    index_elements=index_elements, set_=updated
+                )
+                if updated
+                else statement.on_conflict_do_nothing(index_elements=index_elements)
+            )
+            return statement.returning(cls.id, sort_by_parameter_order=True)
+
+        return cls._bulk_write(db, build_statement, rows, batch_size)
+
+    @classmethod
+    def facets(cls, db: Session, facet_columns: list[str], **columns) -> dict:
+        """This function count the instances with the requested columns for each value of the facet columns, in one grouped query.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param facet_columns: the names of the columns to count by value
+        :param columns: keyword arguments with the columns to find
+        :type db: Session
+        :type facet_columns: list[str]
+        :returns: dict with the list of (value, count) for each facet column
+
+        """
+        facet_columns = [
+            column for column in facet_columns if column in cls.__model_info__.columns
+        ]
+        result = {column: [] for column in facet_columns}
+        if not facet_columns:
+            return result
+        filtered = cls._query(db, **columns).statement.subquery()
+        db_query = union_all(
+            *[
+                select(
+                    literal(column).label("facet"),
+                    cast(filtered.c[column], Text).label("value"),
+                    func.count().label("count"),
+                ).group_by(filtered.c[column])
+                for column in facet_columns
+            ]
+        )
+        for facet, value, count in db.execute(db_query):
+            python_type = cls.__model_info__.types[facet]
+            if value is not None and python_type is bool:
+                value = value.lower() in ["1", "t", "true"]
+            elif value is not None and python_type is not str:
+                value = python_type(value)
+            result[facet].append((value, count))
+        for values in result.values():
+            values.sort(key=lambda item: (-item[1], str(item[0])))
+        return result
+
     @classmethod
     def find_by(cls, db: Session, **columns):
         """This function find the first instance in the database with the requested columns.
@@ -190,13 +618,13 @@ class BaseModel(Base):
 
         # check if the value is a dict
         if isinstance(value, dict):
-            common = list(set(value) & set(dir(attribute)))
-
             # check if the value is a dict and have only one key and is a method of the attribute
-            if len(common) == 1 == len(value) and callable(
-                getattr(attribute, common[0])
+            # (the methods of the comparator of the type, like ARRAY.overlap, aren't listed by dir)
+            key_operator = next(iter(value)) if len(value) == 1 else None
+            if isinstance(key_operator, str) and callable(
+                getattr(attribute, key_operator, None)
             ):
-                operator = common[0]
+                operator = key_operator
                 value = value[operator]
             else:
                 return None
@@ -205,7 +633,7 @@ class BaseModel(Base):
         if operator in ["like", "ilike"]:
             return cls._get_like_expression(attribute, operator, value)
 
-        elif operator not in ["in_", "not_in"] and (
+        elif operator not in ["in_", "not_in", "overlap", "contained_by"] and (
             isinstance(value, dict)
             or isinstance(value, list)
             or isinstance(value, set)
@@ -244,7 +672,7 @@ class BaseModel(Base):
             sub_relation["query"] = attribute
 
             # check the attribute uselist to know if need to use method 'any' or 'has'
-            if model_relation.__mapper__.relationships[key].uselist:
+            if model_relation.__model_info__.relationships[key].uselist:
                 sub_relation["method"] = "any"
             else:
                 sub_relation["method"] = "has"
@@ -367,13 +795,13 @@ class BaseModel(Base):
 
         """
         # if key is a column of the class
-        if key in model_relation.__mapper__.columns.keys():
+        if key in model_relation.__model_info__.columns:
             return (
                 db_query,
                 cls._query_simple_column(attributes, model_relation, key, **columns),
             )
         # if key is a relation of the class
-        elif key in model_relation.__mapper__.relationships.keys():
+        elif key in model_relation.__model_info__.relationships:
             return cls._query_relationship(
                 attributes, model_relation, key, relations, db_query, **columns
             )
@@ -456,6 +884,31 @@ class BaseModel(Base):
             db_query = db_query.where(False)
         return db_query
 
+    @classmethod
+    def _query_filters(cls, db: Session, **columns):
+        """This function prepare a query filtered by the requested columns, reusing the statement built for the same shape of filters.
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param columns: keyword arguments with the columns to find
+        :type db: Session
+        :returns: a query
+
+        """
+        try:
+            shape, template, values = QueryPlanCache.parametrize(columns)
+        except errors.query_plan_error.UncacheableQueryError:
+            return cls._sub_query([], db.query(cls), **columns)
+        key = (cls, shape)
+        statement = cls._query_plans.get(key)
+        if statement is None:
+            statement = cls._sub_query([], select(cls), **template)
+            cls._query_plans.set(key, statement)
+        db_query = db.query(cls)
+        if statement.whereclause is not None:
+            db_query = db_query.where(statement.whereclause)
+        return db_query.params(values) if values else db_query
+
     @classmethod
     def _get_argument_options(
         cls, model_relation, key: str, options: dict
@@ -471,9 +924,9 @@ class BaseModel(Base):
         :returns: BinaryExpression | None
 
         """
-        if key in model_relation.__mapper__.columns.keys():
+        if key in model_relation.__model_info__.columns:
             return cls._get_condition_column(model_relation, key, **options)
-        elif key in model_relation.__mapper__.relationships.keys():
+        elif key in model_relation.__model_info__.relationships:
             attribute = cls._get_condition_relationship(model_relation, key, **options)
             if isinstance(attribute, UnaryExpression | BinaryExpression):
                 return attribute
@@ -497,7 +950,7 @@ class BaseModel(Base):
         join_options = []
         if isinstance(options, dict):
             for key, value in options.items():
-                if key in model_relation.__mapper__.relationships.keys():
+                if key in model_relation.__model_info__.relationships:
                     attribute = getattr(model_relation, key)
                     sub_model = attribute.prop.mapper.__dict__["class_"]
                     attributes, sub_options = cls._build_options(sub_model, value)
@@ -506,11 +959,11 @@ class BaseModel(Base):
                     )
         elif isinstance(options, list):
             for key in options:
-                if key in model_relation.__mapper__.relationships.keys():
+                if key in model_relation.__model_info__.relationships:
                     attribute = getattr(model_relation, key)
                     join_options.append(joinedload(attribute))
         elif isinstance(options, str):
-            if options in model_relation.__mapper__.relationships.keys():
+            if options in model_relation.__model_info__.relationships:
                 attribute = getattr(model_relation, options)
                 join_options.append(joinedload(attribute))
         return join_options
@@ -554,7 +1007,7 @@ class BaseModel(Base):
 
         # for each key in the columns, check if key is a column or a relation or not in table
         for key, value in options.items():
-            if key in cls.__mapper__.relationships.keys():
+            if key in cls.__model_info__.relationships:
                 attribute = getattr(cls, key)
                 sub_model = attribute.prop.mapper.__dict__["class_"]
                 arguments, join_options = cls._build_options(sub_model, value)
@@ -567,6 +1020,22 @@ class BaseModel(Base):
             db_query = db_query.options(*joineds)
         return db_query
 
+    @classmethod
+    def _load_only(cls, fields: tuple, column: str | None = None):
+        """This function get the option loading only the columns of the fields (with the primary key and the ordering column).
+
+        :param cls: the class
+        :param fields: the requested fields (the relationships are ignored)
+        :param column: the column ordering the rows
+        :type fields: tuple
+        :type column: str | None
+        :returns: the load_only option
+
+        """
+        info = cls.__model_info__
+        keys = dict.fromkeys([info.primary_key, column, *fields])
+        return load_only(*[getattr(cls, key) for key in keys if key in info.columns])
+
     @classmethod
     def _query_order_by(cls, model_relation, db_query, order_by):
         """This function prepare the query by ordering.
@@ -581,13 +1050,69 @@ class BaseModel(Base):
         arguments_order_by = []
         if isinstance(order_by, dict):
             for key, value in order_by.items():
-                if key in model_relation.__mapper__.columns.keys():
+                if key in model_relation.__model_info__.columns:
                     attribute = getattr(model_relation, key)
                     if value in ["asc", "desc"]:
                         attribute = getattr(attribute, value)()
                     arguments_order_by.append(attribute)
         return db_query.order_by(*arguments_order_by)
 
+    @classmethod
+    def _keyset_key(cls, column: str, after: list) -> list:
+        """This function convert a key [value of the column, primary key] to the python types of the columns.
+
+        :param cls: the class
+        :param column: the name of the column used to order the rows
+        :param after: the key [value of the column, primary key]
+        :type column: str
+        :type after: list
+        :returns: the converted key
+        :raises ValueError: the key doesn't match the types of the columns
+
+        """
+        info = cls.__model_info__
+        if column not in info.columns:
+            column = info.primary_key
+        value, last_id = after
+        last_id = _type_adapter(info.types[info.primary_key]).validate_python(last_id)
+        python_type = info.types[column]
+        if value is not None and python_type is not None:
+            value = _type_adapter(python_type).validate_python(value)
+        return [value, last_id]
+
+    @classmethod
+    def _query_keyset(cls, db_query, column: str, after: list | None = None):
+        """This function prepare the query to seek the rows after a key, ordered by the column then the primary key.
+
+        :param cls: the class
+        :param db_query: the query
+        :param column: the name of the column used to order the rows
+        :param after: the last key [value of the column, primary key] of the previous page
+        :type column: str
+        :type after: list | None
+        :returns: a query
+
+        """
+        info = cls.__model_info__
+        primary_key = info.columns[info.primary_key]
+        if column not in info.columns:
+            column = primary_key.key
+        attribute = getattr(cls, column)
+        if after is not None:
+            value, last_id = cls._keyset_key(column, after)
+            if column == primary_key.key:
+                db_query = db_query.where(primary_key > last_id)
+            else:
+                db_query = db_query.where(
+                    or_(
+                        attribute > value,
+                        and_(attribute == value, primary_key > last_id),
+                    )
+                )
+        if column == primary_key.key:
+            return db_query.order_by(primary_key)
+        return db_query.order_by(attribute, primary_key)
+
     @classmethod
     def _query(
         cls,
@@ -598,6 +1123,9 @@ class BaseModel(Base):
         offset: int | None = None,
         having=None,
         group_by=None,
+        keyset: dict | None = None,
+        loaders: tuple | None = None,
+        fields: tuple | None = None,
         **columns,
     ):
         """This function prepare a query for the instances in database with the requested columns.
@@ -608,17 +1136,30 @@ class BaseModel(Base):
         :param order_by: order by for query
         :param limit: limit for query
         :param offset: offset for query
+        :param keyset: the column and the last key for a keyset pagination ({"column": "id", "after": [value, id]})
+        :param loaders: the loader options of the relationships (see LoaderPlan)
+        :param fields: the only columns to load (the primary key and the keyset column are always loaded)
         :param columns: keyword arguments with the columns to find
         :type limit: int
         :type offset: int
+        :type keyset: dict | None
+        :type loaders: tuple | None
+        :type fields: tuple | None
         :type db: Session
         :returns: a query
 
         """
-        db_query = db.query(cls)
-        db_query = cls._sub_query([], db_query, **columns)
+        db_query = cls._query_filters(db, **columns)
         if options:
             db_query = cls._query_options(db_query, options)
+        if loaders:
+            db_query = db_query.options(*loaders)
+        if fields:
+            db_query = db_query.options(
+                cls._load_only(fields, keyset["column"] if keyset else None)
+            )
+        if keyset:
+            db_query = cls._query_keyset(db_query, **keyset)
         if order_by:
             db_query = cls._query_order_by(cls, db_query, order_by)
         if limit:
@@ -643,7 +1184,66 @@ class BaseModel(Base):
         :returns: a list of instance
 
         """
-        return cls._query(db, **columns).delete(synchronize_session=False)
+        deleted = cls._query(db, **columns).delete(synchronize_session=False)
+        UnitOfWork.on_commit(db, cls._after_write)
+        return deleted
+
+    @classmethod
+    def paginate(
+        cls,
+        db: Session,
+        limit: int,
+        after: list | None = None,
+        column: str = "id",
+        **columns,
+    ) -> tuple[list, list | None]:
+        """This function find a page of instances with the requested columns after the key of the previous page (keyset pagination).
+
+        :param cls: the class
+        :param db: the connection with the database
+        :param limit: the size of the page
+        :param after: the last key [value of the column, primary key] of the previous page
+        :param column: the name of the column used to order the pages
+        :param columns: keyword arguments with the columns to find
+        :type db: Session
+        :type limit: int
+        :type after: list | None
+        :type column: str
+        :returns: tuple with the list of instances and the key of the last one (None if it's the last page)
+
+        """
+        db_models = cls._query(
+            db, keyset={"column": column, "after": after}, limit=limit + 1, **columns
+        ).all()
+        return cls._page(db_models, limit, column)
+
+    @classmethod
+    def _page(
+        cls, db_models: list, limit: int, column: str
+    ) -> tuple[list, list | None]:
+        """This function cut the extra instance read to know if there is a next page and get the key of the last instance.
+
+        :param cls: the class
+        :param db_models: the instances of the page and the first instance of the next page
+        :param limit: the size of the page
+        :param column: the name of the column used to order the pages
+        :type db_models: list
+        :type limit: int
+        :type column: str
+        :returns: tuple with the list of instances and the key of the last one (None if it's the last page)
+
+        """
+        if len(db_models) <= limit:
+            return (db_models, None)
+        db_models = db_models[:limit]
+        last_model = db_models[-1]
+        primary_key = cls.__model_info__.primary_key
+        if column not in cls.__model_info__.columns:
+            column = primary_key
+        return (
+            db_models,
+            [getattr(last_model, column), getattr(last_model, primary_key)],
+        )
 
     @classmethod
     def where(cls, db: Session, **columns):
@@ -657,3 +1257,98 @@ class BaseModel(Base):
 
         """
         return cls._query(db, **columns).all()
+
+    @staticmethod
+    async def _all_async(db: AsyncSession, db_query) -> list:
+        """This function execute with an async session a query built by _query.
+
+        The query is built on the sync session of the async session (no IO), only its statement is executed.
+
+        :param db: the async session
+        :param db_query: the query
+        :type db: AsyncSession
+        :returns: a list of instance
+
+        """
+        result = await db.execute(db_query.statement)
+        return list(result.unique().scalars().all())
+
+    @classmethod
+    async def count_async(cls, db: AsyncSession, **columns) -> int:
+        """This function count all the instances in the database with the requested columns (async session).
+
+        :param cls: the class
+        :param db: the async session
+        :param columns: keyword arguments with the columns to find
+        :type db: AsyncSession
+        :returns: the number of instances match with requested parameter
+
+        """
+        statement = cls._query(db.sync_session, **columns).statement
+        return await db.scalar(select(func.count()).select_from(statement.subquery()))
+
+    @classmethod
+    async def find_by_async(cls, db: AsyncSession, **columns):
+        """This function find the first instance in the database with the requested columns (async session).
+
+        :param cls: the class
+        :param db: the async session
+        :param columns: keyword arguments with the columns to find
+        :type db: AsyncSession
+        :returns: an instance or None
+
+        """
+        if not columns:
+            return None
+        db_models = await cls._all_async(
+            db, cls._query(db.sync_session, limit=1, **columns)
+        )
+        return db_models[0] if db_models else None
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        db: AsyncSession,
+        limit: int,
+        after: list | None = None,
+        column: str = "id",
+        **columns,
+    ) -> tuple[list, list | None]:
+        """This function find a page of instances after the key of the previous page (keyset pagination, async session).
+
+        :param cls: the class
+        :param db: the async session
+        :param limit: the size of the page
+        :param after: the last key [value of the column, primary key] of the previous page
+        :param column: the name of the column used to order the pages
+        :param columns: keyword arguments with the columns to find
+        :type db: AsyncSession
+        :type limit: int
+        :type after: list | None
+        :type column: str
+        :returns: tuple with the list of instances and the key of the last one (None if it's the last page)
+
+        """
+        db_models = await cls._all_async(
+            db,
+            cls._query(
+                db.sync_session,
+                keyset={"column": column, "after": after},
+                limit=limit + 1,
+                **columns,
+            ),
+        )
+        return cls._page(db_models, limit, column)
+
+    @classmethod
+    async def where_async(cls, db: AsyncSession, **columns) -> list:
+        """This function find all the instances in the database with the requested columns (async session).
+
+        :param cls: the class
+        :param db: the async session
+        :param columns: keyword arguments with the columns to find
+        :type db: AsyncSession
+        :returns: a list of instance
+
+        """
+        return await cls._all_async(db, cls._query(db.sync_session, **columns))
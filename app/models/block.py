@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy import (
     TIMESTAMP,
     Column,
@@ -20,7 +22,7 @@ class Block(BaseModel):
     tag = Column(Text, nullable=False)
     logo = Column(Text, nullable=False)
 
-    updated_at = Column(TIMESTAMP)
+    updated_at = Column(TIMESTAMP, onupdate=datetime.now)
     created_at = Column(TIMESTAMP)
 
     PrimaryKeyConstraint("id")
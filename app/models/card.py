@@ -1,13 +1,16 @@
+from datetime import datetime
+
 from sqlalchemy import (
-    ARRAY,
     TIMESTAMP,
     Boolean,
     Column,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     Text,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from ..config.constants import CASCADE_ALL_DELETE
@@ -16,6 +19,32 @@ from .base_model import BaseModel
 
 class Card(BaseModel):
     __tablename__ = "cards"
+    __table_args__ = (
+        # trigram indexes of the search (pg_trgm), only on postgresql : a B-tree doesn't help the search of a text
+        *(
+            Index(
+                f"ix_cards_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in ["name", "illustrator", "description"]
+        ),
+        # indexes of the filter route (set and range filters, facets)
+        Index("ix_cards_category_rarity", "category", "rarity"),
+        Index(
+            "ix_cards_standard_expanded_regulation_mark",
+            "standard",
+            "expanded",
+            "regulation_mark",
+        ),
+        Index("ix_cards_stage", "stage"),
+        Index("ix_cards_hp", "hp"),
+        Index("ix_cards_retreat", "retreat"),
+        # overlap (&&) of the arrays
+        Index("ix_cards_energy_types", "energy_types", postgresql_using="gin"),
+        Index("ix_cards_pokedex_numbers", "pokedex_numbers", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(Text, nullable=False)
@@ -41,7 +70,7 @@ class Card(BaseModel):
     expanded = Column(Boolean, nullable=False)
     standard = Column(Boolean, nullable=False)
 
-    updated_at = Column(TIMESTAMP)
+    updated_at = Column(TIMESTAMP, onupdate=datetime.now)
     created_at = Column(TIMESTAMP)
 
     PrimaryKeyConstraint("id")
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy import (
     TIMESTAMP,
     Boolean,
@@ -35,7 +37,7 @@ class Serie(BaseModel):
 
     realease = Column(Date)
 
-    updated_at = Column(TIMESTAMP)
+    updated_at = Column(TIMESTAMP, onupdate=datetime.now)
     created_at = Column(TIMESTAMP)
 
     PrimaryKeyConstraint("id")
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy import (
     TIMESTAMP,
     Boolean,
@@ -11,6 +13,7 @@ from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from ..config.constants import CASCADE_ALL_DELETE
+from ..utils.principal_cache import PrincipalCache
 from .base_model import BaseModel
 
 
@@ -21,6 +24,19 @@ class User(BaseModel):
     first_name = Column(Text, nullable=False)
     last_name = Column(Text, nullable=False)
     email = Column(Text, nullable=False)
-    updated_at = Column(TIMESTAMP)
+    updated_at = Column(TIMESTAMP, onupdate=datetime.now)
     created_at = Column(TIMESTAMP)
     PrimaryKeyConstraint("id")
+
+    @classmethod
+    def _after_write(cls, id: int | None = None) -> None:
+        """This function forget the authenticated users written (the next request reads them again).
+
+        :param cls: the class
+        :param id: the id of the written user, None if several users are written
+        :type id: int | None
+        :returns: None
+
+        """
+        super()._after_write(id)
+        PrincipalCache.invalidate(id)
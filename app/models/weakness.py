@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy import (
     TIMESTAMP,
     Column,
@@ -19,7 +21,7 @@ class Weakness(BaseModel):
     value = Column(Text, nullable=False)
     energy_type = Column(Integer, nullable=True)
 
-    updated_at = Column(TIMESTAMP)
+    updated_at = Column(TIMESTAMP, onupdate=datetime.now)
     created_at = Column(TIMESTAMP)
 
     PrimaryKeyConstraint("id")
@@ -12,10 +12,13 @@ from sqlalchemy import MetaData, create_mock_engine
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
+from ..config.database import async_engine, get_pool_stats
 from ..config.env import settings
 from ..config.metadata_tag import MetadataTag
+from ..config.role import Role
 from ..config.seeds import Seed
 from ..utils.dependency import Dependency
+from ..utils.read_cache import ReadCache
 
 api_router = APIRouter(
     prefix=MetadataTag.__tag_debug__.prefix, tags=[MetadataTag.__tag_debug__.name]
@@ -90,7 +93,7 @@ def write_schema(db: Session, schema_sql_file: str):
 
 
 @api_router.get("/all_users", response_model=list[schemas.user.UserBase])
-def get_all_users(db: Session = Depends(Dependency.get_db)):
+def get_all_users(db: Session = Depends(Dependency.get_replica_db)):
     list_users = db.query(models.user.User).all()
     return [schemas.user.UserBase(**user.as_dict()) for user in list_users]
 
@@ -100,7 +103,7 @@ def get_tables(
     mode: str = Query(enum=["json", "sql"]),
     save: bool = Query(enum=[False, True]),
     name: str = Query(None, enum=get_tablenames()),
-    db: Session = Depends(Dependency.get_db),
+    db: Session = Depends(Dependency.get_replica_db),
 ):
     result = {}
     tables = list(models.Base.metadata.tables.values())
@@ -144,7 +147,7 @@ def get_info():
 
 @lru_cache()
 @api_router.get("/schema", response_class=PlainTextResponse)
-def get_schema(db: Session = Depends(Dependency.get_db)):
+def get_schema(db: Session = Depends(Dependency.get_replica_db)):
     schema_sql_file = "./sql/schema.sql"
     if not Path(schema_sql_file).is_file():
         write_schema(db, schema_sql_file)
@@ -153,6 +156,23 @@ def get_schema(db: Session = Depends(Dependency.get_db)):
     return response
 
 
+@api_router.get("/caches")
+def get_caches():
+    return {
+        "read": ReadCache.stats(),
+        "query_plan": models.base_model.BaseModel._query_plans.stats(),
+        "roles": Role.stats(),
+    }
+
+
+@api_router.get("/pool")
+def get_pool(db: Session = Depends(Dependency.get_replica_db)):
+    pools = {"sync": get_pool_stats(db.get_bind().engine)}
+    if async_engine is not None:
+        pools["async"] = get_pool_stats(async_engine.sync_engine)
+    return pools
+
+
 @api_router.get("/fill_tables")
 def get_fill_tables(db: Session = Depends(Dependency.get_db)):
     logger.debug("fill the empty tables")
@@ -1,6 +1,5 @@
 from datetime import datetime, timedelta
 
-import i18n
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.logger import logger
 from fastapi.security import OAuth2PasswordRequestForm
@@ -11,6 +10,7 @@ from .. import models
 from ..config.constants import TIME_ZONE_APP
 from ..config.env import settings
 from ..config.metadata_tag import MetadataTag
+from ..config.translation import Translation
 from ..utils.dependency import Dependency
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 120
@@ -27,7 +27,9 @@ async def login(
 ):
     user = models.user.User.find_by(db, email=form_data.username)
     if not user or user.matricule != form_data.password:
-        raise HTTPException(status_code=400, detail=i18n.t("errors.invalid_login"))
+        raise HTTPException(
+            status_code=400, detail=Translation.t("errors.invalid_login")
+        )
 
     to_encode = {
         "matricule": user.matricule,
@@ -1,27 +1,59 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_attack = RouterModelHelper(name="attack", parents=[], uniq_list=[])
+router_attack = RouterModelHelper(
+    name="attack",
+    parents=[],
+    uniq_list=[],
+    list_schema=schemas.attack.AttackList,
+    read_schema=schemas.attack.Attack,
+)
 
 
 @router.get("/{attack_id}", response_model=schemas.attack.Attack)
-def read_attack(attack_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_attack.read(db, attack_id)
+async def read_attack(
+    attack_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_attack.read_route(db, attack_id, cache=True, fields=fields)
 
 
 @router.get("", response_model=list[schemas.attack.AttackList])
-def list_attacks(db: Session = Depends(Dependency.get_db)):
-    return router_attack.list(db, query={})
+async def list_attacks(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_attack.list_route(db, query={}, params=params)
 
 
 @router.get("/name/{name}", response_model=list[schemas.attack.AttackList])
-def list_attacks_by_name(name: str, db: Session = Depends(Dependency.get_db)):
-    return router_attack.list(db, query={"name": {"ilike": f"%{name}%"}})
+async def list_attacks_by_name(
+    name: str,
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_attack.list_route(
+        db, query={"name": {"ilike": f"%{name}%"}}, params=params
+    )
+
+
+@router.post("/bulk", response_model=list[schemas.attack.Attack])
+def bulk_attacks(
+    rows: list[router_attack.bulk_schema(models.attack.Attack)] = Body(min_length=1),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_attack.bulk(db, rows, mode)
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Query
+
+from ... import schemas
+from ...services.autocomplete import Autocomplete
+
+router = APIRouter()
+
+
+@router.get("", response_model=list[schemas.autocomplete.Suggestion])
+def autocomplete(
+    q: str = Query(min_length=1, description="The typed text."),
+    limit: int = Query(10, ge=1, le=20),
+):
+    return Autocomplete.complete(q, limit)
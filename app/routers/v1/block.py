@@ -1,27 +1,59 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_block = RouterModelHelper(name="block", parents=[], uniq_list=[])
+router_block = RouterModelHelper(
+    name="block",
+    parents=[],
+    uniq_list=[],
+    list_schema=schemas.block.BlockList,
+    read_schema=schemas.block.Block,
+)
 
 
 @router.get("/{block_id}", response_model=schemas.block.Block)
-def read_block(block_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_block.read(db, block_id)
+async def read_block(
+    block_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_block.read_route(db, block_id, cache=True, fields=fields)
 
 
 @router.get("", response_model=list[schemas.block.BlockList])
-def list_blocks(db: Session = Depends(Dependency.get_db)):
-    return router_block.list(db, query={})
+async def list_blocks(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_block.list_route(db, query={}, params=params)
 
 
 @router.get("/name/{name}", response_model=list[schemas.block.BlockList])
-def list_blocks_by_name(name: str, db: Session = Depends(Dependency.get_db)):
-    return router_block.list(db, query={"name": {"ilike": f"%{name}%"}})
+async def list_blocks_by_name(
+    name: str,
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_block.list_route(
+        db, query={"name": {"ilike": f"%{name}%"}}, params=params
+    )
+
+
+@router.post("/bulk", response_model=list[schemas.block.Block])
+def bulk_blocks(
+    rows: list[router_block.bulk_schema(models.block.Block)] = Body(min_length=1),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_block.bulk(db, rows, mode)
@@ -1,27 +1,99 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
+from ...services.search import Search
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_card = RouterModelHelper(name="card", parents=[], uniq_list=[])
+router_card = RouterModelHelper(
+    name="card",
+    parents=[],
+    uniq_list=[],
+    list_schema=schemas.card.CardList,
+    read_schema=schemas.card.Card,
+)
+
+# columns counted by value in the response of the filter route
+FACET_COLUMNS = [
+    "category",
+    "rarity",
+    "stage",
+    "regulation_mark",
+    "retreat",
+    "expanded",
+    "standard",
+]
+
+
+@router.get("/search", response_model=list[schemas.card.CardList])
+def search_cards(
+    q: str = Query(min_length=1, description="The searched text."),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(Dependency.get_replica_db),
+):
+    return Search.search_cards(db, q, limit)
+
+
+@router.post("/filter", response_model=schemas.card.CardFiltered)
+def filter_cards(
+    card_filter: schemas.card.CardFilter,
+    params: ListParams = Depends(ListParams.depends),
+    db: Session = Depends(Dependency.get_replica_db),
+):
+    query = card_filter.to_query()
+    # the items and the facets are in the same JSON object, so the list isn't streamed
+    items = router_card.list_models(db, query=query, params=params)
+    facets = models.card.Card.facets(db, FACET_COLUMNS, **query)
+    return {
+        "items": items,
+        "facets": {
+            column: [{"value": value, "count": count} for value, count in values]
+            for column, values in facets.items()
+        },
+    }
 
 
 @router.get("/{card_id}", response_model=schemas.card.Card)
-def read_card(card_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_card.read(db, card_id)
+async def read_card(
+    card_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_card.read_route(db, card_id, cache=True, fields=fields)
 
 
 @router.get("", response_model=list[schemas.card.CardList])
-def list_cards(db: Session = Depends(Dependency.get_db)):
-    return router_card.list(db, query={})
+async def list_cards(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_card.list_route(db, query={}, params=params)
 
 
 @router.get("/name/{name}", response_model=list[schemas.card.CardList])
-def list_cards_by_name(name: str, db: Session = Depends(Dependency.get_db)):
-    return router_card.list(db, query={"name": {"ilike": f"%{name}%"}})
+async def list_cards_by_name(
+    name: str,
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_card.list_route(
+        db, query={"name": {"ilike": f"%{name}%"}}, params=params
+    )
+
+
+@router.post("/bulk", response_model=list[schemas.card.Card])
+def bulk_cards(
+    rows: list[router_card.bulk_schema(models.card.Card)] = Body(min_length=1),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_card.bulk(db, rows, mode)
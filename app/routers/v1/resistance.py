@@ -1,22 +1,52 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_resistance = RouterModelHelper(name="resistance", parents=[], uniq_list=[])
+router_resistance = RouterModelHelper(
+    name="resistance",
+    parents=[],
+    uniq_list=[],
+    list_schema=schemas.resistance.ResistanceList,
+    read_schema=schemas.resistance.Resistance,
+)
 
 
 @router.get("/{resistance_id}", response_model=schemas.resistance.Resistance)
-def read_resistance(resistance_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_resistance.read(db, resistance_id)
+async def read_resistance(
+    resistance_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_resistance.read_route(
+        db, resistance_id, cache=True, fields=fields
+    )
 
 
 @router.get("", response_model=list[schemas.resistance.ResistanceList])
-def list_resistances(db: Session = Depends(Dependency.get_db)):
-    return router_resistance.list(db, query={})
+async def list_resistances(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_resistance.list_route(db, query={}, params=params)
+
+
+@router.post("/bulk", response_model=list[schemas.resistance.Resistance])
+def bulk_resistances(
+    rows: list[router_resistance.bulk_schema(models.resistance.Resistance)] = Body(
+        min_length=1
+    ),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_resistance.bulk(db, rows, mode)
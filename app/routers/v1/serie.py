@@ -1,27 +1,59 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_serie = RouterModelHelper(name="serie", parents=[], uniq_list=[])
+router_serie = RouterModelHelper(
+    name="serie",
+    parents=["block"],
+    uniq_list=[],
+    list_schema=schemas.serie.SerieList,
+    read_schema=schemas.serie.Serie,
+)
 
 
 @router.get("/{serie_id}", response_model=schemas.serie.Serie)
-def read_serie(serie_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_serie.read(db, serie_id)
+async def read_serie(
+    serie_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_serie.read_route(db, serie_id, cache=True, fields=fields)
 
 
 @router.get("", response_model=list[schemas.serie.SerieList])
-def list_series(db: Session = Depends(Dependency.get_db)):
-    return router_serie.list(db, query={})
+async def list_series(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_serie.list_route(db, query={}, params=params)
 
 
 @router.get("/name/{name}", response_model=list[schemas.serie.SerieList])
-def list_series_by_name(name: str, db: Session = Depends(Dependency.get_db)):
-    return router_serie.list(db, query={"name": {"ilike": f"%{name}%"}})
+async def list_series_by_name(
+    name: str,
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_serie.list_route(
+        db, query={"name": {"ilike": f"%{name}%"}}, params=params
+    )
+
+
+@router.post("/bulk", response_model=list[schemas.serie.Serie])
+def bulk_series(
+    rows: list[router_serie.bulk_schema(models.serie.Serie)] = Body(min_length=1),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_serie.bulk(db, rows, mode)
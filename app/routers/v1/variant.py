@@ -1,22 +1,48 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_variant = RouterModelHelper(name="variant", parents=[], uniq_list=[])
+router_variant = RouterModelHelper(
+    name="variant",
+    parents=[],
+    uniq_list=[],
+    list_schema=schemas.variant.VariantList,
+    read_schema=schemas.variant.Variant,
+)
 
 
 @router.get("/{variant_id}", response_model=schemas.variant.Variant)
-def read_variant(variant_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_variant.read(db, variant_id)
+async def read_variant(
+    variant_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_variant.read_route(db, variant_id, cache=True, fields=fields)
 
 
 @router.get("", response_model=list[schemas.variant.VariantList])
-def list_variants(db: Session = Depends(Dependency.get_db)):
-    return router_variant.list(db, query={})
+async def list_variants(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_variant.list_route(db, query={}, params=params)
+
+
+@router.post("/bulk", response_model=list[schemas.variant.Variant])
+def bulk_variants(
+    rows: list[router_variant.bulk_schema(models.variant.Variant)] = Body(min_length=1),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_variant.bulk(db, rows, mode)
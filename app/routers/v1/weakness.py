@@ -1,22 +1,50 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ... import schemas
+from ... import models, schemas
 from ...config.auth import Auth
 from ...helpers.check_uniq import CheckUniqHelper
+from ...helpers.list_params import ListParams
+from ...helpers.projection import Projection
 from ...helpers.router import RouterModelHelper
 from ...utils.dependency import Dependency
 
 router = APIRouter()
 
-router_weakness = RouterModelHelper(name="weakness", parents=[], uniq_list=[])
+router_weakness = RouterModelHelper(
+    name="weakness",
+    parents=[],
+    uniq_list=[],
+    list_schema=schemas.weakness.WeaknessList,
+    read_schema=schemas.weakness.Weakness,
+)
 
 
 @router.get("/{weakness_id}", response_model=schemas.weakness.Weakness)
-def read_weakness(weakness_id: int, db: Session = Depends(Dependency.get_db)):
-    return router_weakness.read(db, weakness_id)
+async def read_weakness(
+    weakness_id: int,
+    fields: str | None = Projection.query(),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_weakness.read_route(db, weakness_id, cache=True, fields=fields)
 
 
 @router.get("", response_model=list[schemas.weakness.WeaknessList])
-def list_weaknesss(db: Session = Depends(Dependency.get_db)):
-    return router_weakness.list(db, query={})
+async def list_weaknesss(
+    params: ListParams = Depends(ListParams.depends),
+    db: Session | AsyncSession = Depends(Dependency.get_read_db),
+):
+    return await router_weakness.list_route(db, query={}, params=params)
+
+
+@router.post("/bulk", response_model=list[schemas.weakness.Weakness])
+def bulk_weaknesss(
+    rows: list[router_weakness.bulk_schema(models.weakness.Weakness)] = Body(
+        min_length=1
+    ),
+    mode: str = Query("create", enum=["create", "update", "upsert"]),
+    current_user: schemas.user.User = Depends(Auth.check_role_user),
+    db: Session = Depends(Dependency.get_db),
+):
+    return router_weakness.bulk(db, rows, mode)
@@ -0,0 +1,9 @@
+from pydantic import Field
+
+from .custom_base import CustomBase
+
+
+class Suggestion(CustomBase):
+    type: str = Field(examples=["card"], description="Le type de la suggestion")
+    id: int = Field(examples=[1], description="L'id de la suggestion")
+    name: str = Field(examples=["Pikachu"], description="Le nom de la suggestion")
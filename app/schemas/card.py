@@ -48,7 +48,6 @@ class Card(CardBase):
     expanded: bool
     standard: bool
 
-    realease: datetime
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -58,3 +57,61 @@ class CardList(Card):
 
 class CardComplete(Card):
     pass
+
+
+class IntRange(CustomBase):
+    min: int | None = Field(None, description="The minimum value (included)")
+    max: int | None = Field(None, description="The maximum value (included)")
+
+
+class CardFilter(CustomBase):
+    # set filters (any of the values)
+    category: list[str] | None = Field(None, examples=[["Pokemon"]])
+    rarity: list[int] | None = None
+    stage: list[int] | None = None
+    regulation_mark: list[str] | None = Field(None, examples=[["G", "H"]])
+    expanded: bool | None = None
+    standard: bool | None = None
+
+    # range filters
+    hp: IntRange | None = None
+    retreat: IntRange | None = None
+
+    # array filters (cards with at least one of the values)
+    energy_types: list[int] | None = None
+    pokedex_numbers: list[int] | None = None
+
+    def to_query(self) -> dict:
+        """This function translate the filter in the query dict of BaseModel._query.
+
+        :returns: dict
+
+        """
+        query = {}
+        for column, value in self:
+            if value is None:
+                continue
+            if isinstance(value, IntRange):
+                if value.min is not None and value.max is not None:
+                    query[column] = {"between": [value.min, value.max]}
+                elif value.min is not None:
+                    query[column] = {"__ge__": value.min}
+                elif value.max is not None:
+                    query[column] = {"__le__": value.max}
+            elif column in ["energy_types", "pokedex_numbers"]:
+                query[column] = {"overlap": value}
+            elif isinstance(value, list):
+                query[column] = {"in_": value}
+            else:
+                query[column] = value
+        return query
+
+
+class CardFacetValue(CustomBase):
+    value: str | int | bool | None
+    count: int
+
+
+class CardFiltered(CustomBase):
+    items: list[CardList]
+    facets: dict[str, list[CardFacetValue]]
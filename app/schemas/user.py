@@ -58,4 +58,5 @@ class User(UserBase):
 
 
 class UserComplete(User):
-    pass
+    # the principal of the authenticated requests, shared between them by the principal cache
+    model_config = ConfigDict(from_attributes=True, frozen=True)
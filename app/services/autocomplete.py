@@ -0,0 +1,299 @@
+import heapq
+from bisect import insort
+from threading import RLock
+from typing import ClassVar
+
+from fastapi.logger import logger
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, object_session
+from unidecode import unidecode
+
+from .. import models
+from ..utils.unit_of_work import UnitOfWork
+
+# number of best entries kept on each node (greater than the maximum limit of suggestions)
+_BEST_SIZE = 50
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries", "best")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.entries: set[tuple] = set()
+        self.best: list[tuple] = []
+
+
+class PrefixTrie:
+    """A prefix tree of accent-folded names, each name being reachable from the start of any of its words.
+
+    Each node keeps the best entries of its subtree, so a completion doesn't walk the subtree.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._keys: dict[tuple, list[str]] = {}
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """This function fold a text for the comparison (accents removed, lowercased, spaces collapsed).
+
+        :param text: the text to fold
+        :type text: str
+        :returns: str
+
+        """
+        return " ".join(unidecode(text).lower().split())
+
+    def _insert(self, kind: str, entry_id: int, name: str, update_best: bool) -> None:
+        """This function insert the keys of a name in the trie.
+
+        :param kind: the type of the entry (card, serie, block)
+        :param entry_id: the id of the entry
+        :param name: the name of the entry
+        :param update_best: update the best entries of the nodes on the path
+        :type kind: str
+        :type entry_id: int
+        :type name: str
+        :type update_best: bool
+        :returns: None
+
+        """
+        folded = self.fold(name)
+        words = folded.split(" ")
+        # the full name then the name from each of its next words
+        keys = [" ".join(words[i:]) for i in range(len(words))]
+        for position, key in enumerate(keys):
+            # the start of the name first, then the shortest names
+            entry = (position > 0, len(folded), name, kind, entry_id)
+            path = [self._root]
+            for character in key:
+                path.append(path[-1].children.setdefault(character, _TrieNode()))
+            path[-1].entries.add(entry)
+            if update_best:
+                for node in path:
+                    insort(node.best, entry)
+                    del node.best[_BEST_SIZE:]
+        self._keys[(kind, entry_id)] = keys
+
+    def add(self, kind: str, entry_id: int, name: str | None) -> None:
+        """This function add (or replace) a name in the trie.
+
+        :param kind: the type of the entry (card, serie, block)
+        :param entry_id: the id of the entry
+        :param name: the name of the entry
+        :type kind: str
+        :type entry_id: int
+        :type name: str | None
+        :returns: None
+
+        """
+        with self._lock:
+            self.remove(kind, entry_id)
+            if name:
+                self._insert(kind, entry_id, name, update_best=True)
+
+    def load(self, entries) -> None:
+        """This function replace the content of the trie, computing the best entries once at the end.
+
+        :param entries: an iterable of (kind, id, name)
+        :returns: None
+
+        """
+        with self._lock:
+            self.clear()
+            for kind, entry_id, name in entries:
+                if name:
+                    self._insert(kind, entry_id, name, update_best=False)
+            # post-order walk: the children are refreshed before their parent
+            stack = [(self._root, False)]
+            while stack:
+                node, visited = stack.pop()
+                if visited:
+                    self._refresh_best(node)
+                else:
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in node.children.values())
+
+    @staticmethod
+    def _refresh_best(node: _TrieNode) -> None:
+        """This function compute the best entries of a node from its entries and the best entries of its children.
+
+        :param node: the node to refresh
+        :type node: _TrieNode
+        :returns: None
+
+        """
+        node.best = heapq.nsmallest(
+            _BEST_SIZE,
+            set(node.entries).union(*(child.best for child in node.children.values())),
+        )
+
+    def remove(self, kind: str, entry_id: int) -> None:
+        """This function remove an entry from the trie (and the nodes left empty).
+
+        :param kind: the type of the entry
+        :param entry_id: the id of the entry
+        :type kind: str
+        :type entry_id: int
+        :returns: None
+
+        """
+        with self._lock:
+            keys = self._keys.pop((kind, entry_id), None)
+            for key in keys or []:
+                path = [self._root]
+                for character in key:
+                    path.append(path[-1].children[character])
+                path[-1].entries = {
+                    entry for entry in path[-1].entries if entry[3:] != (kind, entry_id)
+                }
+                for depth in range(len(key), -1, -1):
+                    node = path[depth]
+                    if depth and not node.children and not node.entries:
+                        del path[depth - 1].children[key[depth - 1]]
+                    elif any(entry[3:] == (kind, entry_id) for entry in node.best):
+                        self._refresh_best(node)
+
+    def clear(self) -> None:
+        """This function remove all the entries of the trie."""
+        with self._lock:
+            self._root = _TrieNode()
+            self._keys.clear()
+
+    def complete(self, prefix: str, limit: int = 10) -> list[dict]:
+        """This function get the best names starting with the prefix (start of the name first, then the shortest names).
+
+        :param prefix: the typed text
+        :param limit: the maximum number of suggestions
+        :type prefix: str
+        :type limit: int
+        :returns: list of suggestions {"type", "id", "name"}
+
+        """
+        folded = self.fold(prefix)
+        if not folded:
+            return []
+        with self._lock:
+            node = self._root
+            for character in folded:
+                node = node.children.get(character)
+                if node is None:
+                    return []
+            best = list(node.best)
+        suggestions = []
+        seen = set()
+        for _, _, name, kind, entry_id in best:
+            if (kind, entry_id) not in seen:
+                seen.add((kind, entry_id))
+                suggestions.append({"type": kind, "id": entry_id, "name": name})
+                if len(suggestions) == limit:
+                    break
+        return suggestions
+
+
+class Autocomplete(BaseModel):
+    # the models (type of suggestion, class) loaded in the trie
+    __models__: ClassVar[dict[str, type]] = {
+        "card": models.card.Card,
+        "serie": models.serie.Serie,
+        "block": models.block.Block,
+    }
+    trie: ClassVar[PrefixTrie] = PrefixTrie()
+
+    @classmethod
+    def load(cls, db: Session) -> None:
+        """This function fill the trie with the names of the models.
+
+        :param db: the session
+        :type db: Session
+        :returns: None
+
+        """
+        cls.trie.load(
+            (kind, entry_id, name)
+            for kind, model_class in cls.__models__.items()
+            for entry_id, name in db.query(model_class.id, model_class.name).yield_per(
+                1_000
+            )
+        )
+        logger.debug(f"Autocomplete : {len(cls.trie)} names loaded")
+
+    @classmethod
+    def refresh(cls, db: Session, kind: str, ids: list[int]) -> None:
+        """This function read again the names of some models in the trie.
+
+        :param db: the session
+        :param kind: the type of the models (card, serie, block)
+        :param ids: the ids of the models
+        :type db: Session
+        :type kind: str
+        :type ids: list[int]
+        :returns: None
+
+        """
+        model_class = cls.__models__[kind]
+        for entry_id, name in db.query(model_class.id, model_class.name).where(
+            model_class.id.in_(ids)
+        ):
+            cls.trie.add(kind, entry_id, name)
+
+    @classmethod
+    def initialize(cls, engine) -> None:
+        """This function load the trie at the start of the server.
+
+        :param engine: the engine of the database
+        :returns: None
+
+        """
+        try:
+            with Session(engine) as db:
+                cls.load(db)
+        except SQLAlchemyError as error:
+            logger.warning(f"Autocomplete : names not loaded - {error}")
+
+    @classmethod
+    def complete(cls, text: str, limit: int = 10) -> list[dict]:
+        """This function get the suggestions for a typed text.
+
+        :param text: the typed text
+        :param limit: the maximum number of suggestions
+        :type text: str
+        :type limit: int
+        :returns: list of suggestions
+
+        """
+        return cls.trie.complete(text, limit)
+
+
+def _listen_model(kind: str, model_class: type) -> None:
+    # the trie is changed at the commit of the writes : the rolled back writes don't leave names in it
+    @event.listens_for(model_class, "after_insert")
+    @event.listens_for(model_class, "after_update")
+    def _add_name(mapper, connection, target) -> None:
+        id, name = target.id, target.name
+        UnitOfWork.after_commit(
+            object_session(target), lambda: Autocomplete.trie.add(kind, id, name)
+        )
+
+    @event.listens_for(model_class, "after_delete")
+    def _remove_name(mapper, connection, target) -> None:
+        id = target.id
+        UnitOfWork.after_commit(
+            object_session(target), lambda: Autocomplete.trie.remove(kind, id)
+        )
+
+    def _refresh_names(db: Session, ids: list[int]) -> None:
+        Autocomplete.refresh(db, kind, ids)
+
+    model_class.listen_bulk_write(_refresh_names)
+
+
+for _kind, _model_class in Autocomplete.__models__.items():
+    _listen_model(_kind, _model_class)
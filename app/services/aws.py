@@ -1,6 +1,10 @@
+import threading
 from datetime import datetime
+from typing import ClassVar
 
 import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
 from fastapi import UploadFile
 from fastapi.logger import logger
 from pydantic import BaseModel
@@ -8,6 +12,84 @@ from pydantic import BaseModel
 from ..config.env import settings
 from ..errors.topic_error import CreateTopicError
 
+# the services used by AWS, their clients are created at the startup
+SERVICES = ("dynamodb", "s3", "ses", "sns")
+
+
+class AWSClients(BaseModel):
+    # one client by (service, region), shared by all the threads (a boto3 client is thread-safe, a session isn't)
+    clients: ClassVar[dict[tuple[str, str | None], BaseClient]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _session: ClassVar[boto3.session.Session | None] = None
+
+    @staticmethod
+    def config() -> Config:
+        """This function get the config of the clients (connection pool, timeouts and retries of the settings).
+
+        :returns: Config
+
+        """
+        return Config(
+            connect_timeout=settings.aws_connect_timeout,
+            max_pool_connections=settings.aws_max_pool_connections,
+            read_timeout=settings.aws_read_timeout,
+            retries={
+                "max_attempts": settings.aws_retry_max_attempts,
+                "mode": settings.aws_retry_mode,
+            },
+        )
+
+    @classmethod
+    def client(cls, service: str, region: str | None = None) -> BaseClient:
+        """This function get the client of a service, created once and reused by every call.
+
+        :param service: the name of the service (s3, dynamodb, ...)
+        :param region: the region of the service (settings.aws_region or the region of the environment if None)
+        :type service: str
+        :type region: str | None
+        :returns: BaseClient
+
+        """
+        key = (service, region or settings.aws_region or None)
+        client = cls.clients.get(key)
+        if client is not None:
+            return client
+        with cls._lock:
+            client = cls.clients.get(key)
+            if client is None:
+                if cls._session is None:
+                    cls._session = boto3.session.Session()
+                client = cls._session.client(
+                    service, region_name=key[1], config=cls.config()
+                )
+                cls.clients[key] = client
+        return client
+
+    @classmethod
+    def initialize(cls, services: tuple[str, ...] = SERVICES) -> None:
+        """This function create the clients of the services (the credentials and the config are read once).
+
+        :param services: the names of the services
+        :type services: tuple[str, ...]
+        :returns: None
+
+        """
+        for service in services:
+            cls.client(service)
+
+    @classmethod
+    def close(cls) -> None:
+        """This function close the connections of the clients and forget them.
+
+        :returns: None
+
+        """
+        with cls._lock:
+            clients, cls.clients = cls.clients, {}
+            cls._session = None
+        for client in clients.values():
+            client.close()
+
 
 class AWS(BaseModel):
     @classmethod
@@ -31,7 +113,7 @@ class AWS(BaseModel):
         :returns: None or the details of the error
 
         """
-        s3_client = boto3.client("s3")
+        s3_client = AWSClients.client("s3")
         try:
             s3_client.upload_fileobj(
                 file.file, bucket_name, filename, ExtraArgs=extra_args
@@ -43,7 +125,7 @@ class AWS(BaseModel):
     def s3_download_file(
         cls, bucket_name: str, bucket_key: str, file_path: str
     ) -> str | None:
-        s3_client = boto3.client("s3")
+        s3_client = AWSClients.client("s3")
         try:
             s3_client.download_file(bucket_name, bucket_key, file_path)
         except Exception as e:
@@ -60,7 +142,7 @@ class AWS(BaseModel):
         :returns: None or the details of the error
 
         """
-        dynamodb_client = boto3.client("dynamodb")
+        dynamodb_client = AWSClients.client("dynamodb")
         try:
             dynamodb_client.put_item(TableName=table_name, Item=item)
         except Exception as e:
@@ -77,7 +159,7 @@ class AWS(BaseModel):
         :returns: None or the details of the error
 
         """
-        dynamodb_client = boto3.client("dynamodb")
+        dynamodb_client = AWSClients.client("dynamodb")
         try:
             result = dynamodb_client.scan(TableName=table_name, **scan)
         except Exception as e:
@@ -87,7 +169,7 @@ class AWS(BaseModel):
     @classmethod
     def sns_publish(cls, topic_arn: str, subject: str, body: str, client=None) -> None:
         if not client:
-            client = boto3.client("sns")
+            client = AWSClients.client("sns")
 
         if not body:
             body = f"""le critère *criteria* de l'objet {subject} a déclenché cette notification.
@@ -100,7 +182,7 @@ class AWS(BaseModel):
     @classmethod
     def sns_subscribe(cls, topic_arn: str, email: str, client=None) -> None | str:
         if not client:
-            client = boto3.client("sns")
+            client = AWSClients.client("sns")
 
         subscription = client.subscribe(
             TopicArn=topic_arn,
@@ -111,12 +193,12 @@ class AWS(BaseModel):
 
     @classmethod
     def sns_get_subscriptions_status(cls, topic_arn):
-        client = boto3.client("sns")
+        client = AWSClients.client("sns")
         return client.list_subscriptions_by_topic(TopicArn=topic_arn)["Subscriptions"]
 
     @classmethod
     def sns_create_alert(cls, alert) -> None | str:
-        sns_client = boto3.client("sns")
+        sns_client = AWSClients.client("sns")
 
         try:
             topic = sns_client.create_topic(
@@ -128,26 +210,26 @@ class AWS(BaseModel):
 
     @classmethod
     def sns_delete_alert(cls, alert) -> None:
-        sns_client = boto3.client("sns")
+        sns_client = AWSClients.client("sns")
         sns_client.delete_topic(TopicArn=alert.topic_arn)
 
     @classmethod
     def ses_create_alert(cls, topic_arn):
-        ses_client = boto3.client("ses")
+        ses_client = AWSClients.client("ses")
         set_name = cls._ses_id_from_sns_arn(topic_arn)
         configuration_set = {"Name": set_name}
         ses_client.create_configuration_set(ConfigurationSet=configuration_set)
 
     @classmethod
     def ses_delete_alert(cls, alert):
-        ses_client = boto3.client("ses")
+        ses_client = AWSClients.client("ses")
         ses_client.delete_configuration_set(
             ConfigurationSetName=cls._ses_id_from_sns_arn(alert.topic_arn)
         )
 
     @classmethod
     def send_notification_email(cls, alert, subscribers_email, body):
-        ses_client = boto3.client("ses")
+        ses_client = AWSClients.client("ses")
         email = settings.notification_email
         ses_client.send_email(
             Source=email,
@@ -166,11 +248,11 @@ class AWS(BaseModel):
     @classmethod
     def ses_verify_email(cls, email, client=None):
         if not client:
-            client = boto3.client("ses")
+            client = AWSClients.client("ses")
         verification = client.verify_email_address(EmailAddress=email)
         return verification, client
 
     @classmethod
     def ses_get_verified_email_addresses(cls):
-        client = boto3.client("ses")
+        client = AWSClients.client("ses")
         return client.list_verified_email_addresses()["VerifiedEmailAddresses"]
@@ -0,0 +1,270 @@
+import re
+from collections import Counter, defaultdict
+from threading import RLock
+from typing import ClassVar
+
+from fastapi.logger import logger
+from pydantic import BaseModel
+from sqlalchemy import event, func, or_
+from sqlalchemy.orm import Session, object_session
+from unidecode import unidecode
+
+from .. import models
+from ..utils.unit_of_work import UnitOfWork
+
+_WORD_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+class TrigramIndex:
+    """An in-process inverted index of trigrams (same trigrams as pg_trgm) with weighted fields."""
+
+    def __init__(self, fields: dict[str, float]):
+        self.fields = fields
+        self.loaded = False
+        self._postings: dict[str, set[tuple[int, str]]] = defaultdict(set)
+        self._documents: dict[int, dict[str, set[str]]] = {}
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @staticmethod
+    def trigrams(text: str | None) -> set[str]:
+        """This function get the trigrams of a text (accents folded, lowercased, each word padded like pg_trgm).
+
+        :param text: the text
+        :type text: str | None
+        :returns: set[str]
+
+        """
+        if not text:
+            return set()
+        result = set()
+        for word in _WORD_SPLIT.split(unidecode(text).lower()):
+            if word:
+                padded = f"  {word} "
+                result.update(padded[i : i + 3] for i in range(len(padded) - 2))
+        return result
+
+    def add(self, document_id: int, **values: str | None) -> None:
+        """This function add (or replace) a document in the index.
+
+        :param document_id: the id of the document
+        :param values: the text of each field of the document
+        :type document_id: int
+        :returns: None
+
+        """
+        with self._lock:
+            self.remove(document_id)
+            document = {}
+            for field in self.fields:
+                document[field] = self.trigrams(values.get(field))
+                for trigram in document[field]:
+                    self._postings[trigram].add((document_id, field))
+            self._documents[document_id] = document
+
+    def remove(self, document_id: int) -> None:
+        """This function remove a document from the index.
+
+        :param document_id: the id of the document
+        :type document_id: int
+        :returns: None
+
+        """
+        with self._lock:
+            document = self._documents.pop(document_id, None)
+            if document is None:
+                return
+            for field, trigrams in document.items():
+                for trigram in trigrams:
+                    postings = self._postings[trigram]
+                    postings.discard((document_id, field))
+                    if not postings:
+                        del self._postings[trigram]
+
+    def clear(self) -> None:
+        """This function remove all the documents of the index."""
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            self.loaded = False
+
+    def search(
+        self, text: str, limit: int = 20, threshold: float = 0.6
+    ) -> list[tuple[int, float]]:
+        """This function rank the documents by the weighted share of the trigrams of the text found in their fields.
+
+        :param text: the searched text
+        :param limit: the maximum number of results
+        :param threshold: the minimum share of trigrams found in a field
+        :type text: str
+        :type limit: int
+        :type threshold: float
+        :returns: list of (document id, score) ordered by score
+
+        """
+        query_trigrams = self.trigrams(text)
+        if not query_trigrams:
+            return []
+        matches: Counter = Counter()
+        with self._lock:
+            for trigram in query_trigrams:
+                matches.update(self._postings.get(trigram, ()))
+        scores: dict[int, float] = {}
+        for (document_id, field), count in matches.items():
+            similarity = count / len(query_trigrams)
+            if similarity >= threshold:
+                score = similarity * self.fields[field]
+                if score > scores.get(document_id, 0.0):
+                    scores[document_id] = score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+
+class Search(BaseModel):
+    # searched fields of the cards and their weight in the ranking
+    __card_fields__: ClassVar[dict[str, float]] = {
+        "name": 1.0,
+        "illustrator": 0.6,
+        "description": 0.4,
+    }
+    threshold: ClassVar[float] = 0.6
+    card_index: ClassVar[TrigramIndex] = TrigramIndex(__card_fields__)
+
+    @classmethod
+    def _load_card_index(cls, db: Session) -> None:
+        """This function fill the in-process index with all the cards.
+
+        :param db: the session
+        :type db: Session
+        :returns: None
+
+        """
+        cls.card_index.clear()
+        cls._index_cards(db)
+        cls.card_index.loaded = True
+        logger.debug(f"Search : {len(cls.card_index)} cards indexed")
+
+    @classmethod
+    def _index_cards(cls, db: Session, ids: list[int] | None = None) -> None:
+        """This function add (or replace) cards in the in-process index.
+
+        :param db: the session
+        :param ids: the ids of the cards, all the cards if None
+        :type db: Session
+        :type ids: list[int] | None
+        :returns: None
+
+        """
+        card = models.card.Card
+        columns = [getattr(card, field) for field in cls.__card_fields__]
+        db_query = db.query(card.id, *columns)
+        if ids is not None:
+            db_query = db_query.where(card.id.in_(ids))
+        for row in db_query.yield_per(1_000):
+            cls.card_index.add(row[0], **dict(zip(cls.__card_fields__, row[1:])))
+
+    @classmethod
+    def _search_cards_postgresql(cls, db: Session, text: str, limit: int) -> list:
+        """This function rank the cards with pg_trgm (word similarity, served by the GIN trigram indexes).
+
+        :param db: the session
+        :param text: the searched text
+        :param limit: the maximum number of results
+        :type db: Session
+        :type text: str
+        :type limit: int
+        :returns: list of cards
+
+        """
+        card = models.card.Card
+        scores = [
+            func.coalesce(func.word_similarity(text, getattr(card, field)), 0) * weight
+            for field, weight in cls.__card_fields__.items()
+        ]
+        return (
+            db.query(card)
+            .where(
+                or_(
+                    *[
+                        getattr(card, field).op("%>")(text)
+                        for field in cls.__card_fields__
+                    ]
+                )
+            )
+            .order_by(func.greatest(*scores).desc(), card.id)
+            .limit(limit)
+            .all()
+        )
+
+    @classmethod
+    def _search_cards_index(cls, db: Session, text: str, limit: int) -> list:
+        """This function rank the cards with the in-process trigram index.
+
+        :param db: the session
+        :param text: the searched text
+        :param limit: the maximum number of results
+        :type db: Session
+        :type text: str
+        :type limit: int
+        :returns: list of cards
+
+        """
+        if not cls.card_index.loaded:
+            cls._load_card_index(db)
+        ranked = cls.card_index.search(text, limit=limit, threshold=cls.threshold)
+        if not ranked:
+            return []
+        cards = {
+            card.id: card
+            for card in models.card.Card.where(
+                db, id={"in_": [card_id for card_id, _ in ranked]}
+            )
+        }
+        return [cards[card_id] for card_id, _ in ranked if card_id in cards]
+
+    @classmethod
+    def search_cards(cls, db: Session, text: str, limit: int = 20) -> list:
+        """This function search the cards by name, illustrator and description, best match first.
+
+        :param db: the session
+        :param text: the searched text
+        :param limit: the maximum number of results
+        :type db: Session
+        :type text: str
+        :type limit: int
+        :returns: list of cards
+
+        """
+        if db.bind.dialect.name == "postgresql":
+            return cls._search_cards_postgresql(db, text, limit)
+        return cls._search_cards_index(db, text, limit)
+
+
+# the index is changed at the commit of the writes : the rolled back writes don't leave entries in it
+@event.listens_for(models.card.Card, "after_insert")
+@event.listens_for(models.card.Card, "after_update")
+def _index_card(mapper, connection, target) -> None:
+    if Search.card_index.loaded:
+        id = target.id
+        fields = {field: getattr(target, field) for field in Search.__card_fields__}
+        UnitOfWork.after_commit(
+            object_session(target), lambda: Search.card_index.add(id, **fields)
+        )
+
+
+@event.listens_for(models.card.Card, "after_delete")
+def _unindex_card(mapper, connection, target) -> None:
+    id = target.id
+    UnitOfWork.after_commit(
+        object_session(target), lambda: Search.card_index.remove(id)
+    )
+
+
+def _index_bulk_cards(db: Session, ids: list[int]) -> None:
+    if Search.card_index.loaded:
+        Search._index_cards(db, ids)
+
+
+models.card.Card.listen_bulk_write(_index_bulk_cards)
@@ -0,0 +1,44 @@
+import pytest
+import pytest_check as check
+from fastapi import APIRouter, Depends, HTTPException
+
+from ...config.auth import Auth
+from ...config.role import Role
+from ...errors.ability_error import AbilityError
+from ..test_main import app
+
+
+def test_compile_abilities(monkeypatch):
+    masks = Auth.compile_abilities()
+    check.equal(masks["create_cart"], Role.mask({"possessor", "client"}))
+    check.equal(masks["bulk_series"], 0)
+    monkeypatch.setitem(Auth.__abilities__, "read_cart", ["unknown"])
+    with pytest.raises(KeyError):
+        Auth.compile_abilities()
+
+
+def test_check_role_endpoint():
+    Auth._check_role_endpoint(Role.mask({"client", "possessor"}), "read_cart")
+    # an endpoint without abilities is open to every role
+    Auth._check_role_endpoint(Role.mask({"client"}), "read_serie")
+    for role, endpoint in [({"client"}, "read_cart"), ({"pro"}, "bulk_series")]:
+        with pytest.raises(HTTPException):
+            Auth._check_role_endpoint(Role.mask(role), endpoint)
+
+
+def test_validate_abilities():
+    # the routes of the app are checked at startup
+    Auth.validate_abilities(app.routes)
+    router = APIRouter()
+
+    @router.get("/unknown")
+    def read_unknown(user=Depends(Auth.check_role_user)):
+        return user
+
+    @router.get("/open")
+    def read_open():
+        return None
+
+    with pytest.raises(AbilityError) as error:
+        Auth.validate_abilities(router.routes)
+    check.equal(error.value.endpoints, ["read_unknown"])
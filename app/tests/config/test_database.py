@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+import pytest_check as check
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from ...config.database import get_async_url, get_engine_options, get_pool_stats
+from ...config.env import settings
+from ...config.seeds import Seed
+from ..test_main import engine
+
+
+def test_engine_options_pool():
+    options = get_engine_options("postgresql://user@host/db")
+    check.equal(options["pool_size"], settings.database_pool_size)
+    check.equal(options["max_overflow"], settings.database_max_overflow)
+    check.equal(options["pool_pre_ping"], settings.database_pool_pre_ping)
+    check.equal(options["query_cache_size"], settings.database_statement_cache_size)
+    check.is_not_in("connect_args", options)
+
+
+def test_engine_options_sqlite():
+    options = get_engine_options("sqlite:///./db/app.db")
+    check.equal(options["connect_args"], {"check_same_thread": False})
+    check.equal(options["pool_size"], settings.database_pool_size)
+    # the pool of an in-memory database isn't changed
+    check.is_not_in("pool_size", get_engine_options("sqlite://"))
+
+
+def test_sqlite_pragmas(tmp_path):
+    connection = sqlite3.connect(tmp_path / "pragma.db")
+    Seed._set_sqlite_pragma(connection, None)
+    pragmas = {
+        pragma: connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+        for pragma in ["foreign_keys", "journal_mode", "synchronous", "cache_size"]
+    }
+    connection.close()
+    check.equal(pragmas["foreign_keys"], 1)
+    check.equal(pragmas["journal_mode"].upper(), settings.database_sqlite_journal_mode)
+    check.equal(pragmas["synchronous"], 1)  # NORMAL
+    check.equal(pragmas["cache_size"], settings.database_sqlite_cache_size)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_sqlite_pragmas_async(tmp_path):
+    url = f"sqlite:///{tmp_path}/pragma.db"
+    sync_engine = sa.create_engine(url)
+    async_engine = create_async_engine(get_async_url(url))
+    Seed.initialize_database(sync_engine, async_engine)
+    async with async_engine.connect() as connection:
+        pragmas = {
+            pragma: (await connection.exec_driver_sql(f"PRAGMA {pragma}")).scalar()
+            for pragma in ["foreign_keys", "journal_mode", "cache_size"]
+        }
+    await async_engine.dispose()
+    sync_engine.dispose()
+    check.equal(pragmas["foreign_keys"], 1)
+    check.equal(pragmas["journal_mode"].upper(), settings.database_sqlite_journal_mode)
+    check.equal(pragmas["cache_size"], settings.database_sqlite_cache_size)
+
+
+def test_pool_stats():
+    stats = get_pool_stats(engine)
+    check.is_in("status", stats)
+    check.equal(stats["pool"], type(engine.pool).__name__)
@@ -0,0 +1,28 @@
+import logging
+
+import pytest_check as check
+from fastapi.logger import logger as logger_fastapi
+
+from ...config.constants import REQUEST_LOGGER
+from ...config.logging import Logging
+from ..utils.test_request_log import ListHandler
+
+
+def test_request_logging_through_queue():
+    handler = ListHandler()
+    logger_fastapi.addHandler(handler)
+    logger_request = logging.getLogger(REQUEST_LOGGER)
+    old_level = logger_request.level
+    logger_request.setLevel(logging.INFO)
+    try:
+        Logging.initialize_request_logging()
+        logger_request.info("GET /v1/series 200")
+        # the records left in the queue are written when it stops
+        Logging.stop_request_logging()
+        check.equal(handler.messages, ["GET /v1/series 200"])
+    finally:
+        Logging.stop_request_logging()
+        logger_fastapi.removeHandler(handler)
+        logger_request.handlers = []
+        logger_request.propagate = True
+        logger_request.setLevel(old_level)
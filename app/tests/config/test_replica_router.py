@@ -0,0 +1,103 @@
+import time
+
+import pytest_check as check
+from fastapi import Response
+from sqlalchemy import create_engine, text
+from starlette.requests import Request
+
+from ...config.constants import READ_YOUR_WRITES_COOKIE
+from ...config.replica_router import ReplicaRouter
+from ...utils.dependency import Dependency
+from ..test_main import app
+
+
+def _request(method: str, cookie: str | None = None) -> Request:
+    headers = []
+    if cookie is not None:
+        headers.append((b"cookie", f"{READ_YOUR_WRITES_COOKIE}={cookie}".encode()))
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+def _router(tmp_path, strategy: str = "round_robin") -> ReplicaRouter:
+    engines = [
+        create_engine(f"sqlite:///{tmp_path / name}.db")
+        for name in ["primary", "replica_1", "replica_2"]
+    ]
+    return ReplicaRouter(engines[0], engines[1:], strategy)
+
+
+def test_round_robin(tmp_path):
+    router = _router(tmp_path)
+    binds = [router.get_bind() for _ in range(4)]
+    check.equal(binds, router.replicas * 2)
+    check.equal(router.get_bind(write=True), router.primary)
+    check.equal(router.get_bind(read_your_writes=True), router.primary)
+
+
+def test_least_connections(tmp_path):
+    router = _router(tmp_path, "least_connections")
+    with router.replicas[0].connect() as connection:
+        connection.execute(text("SELECT 1"))
+        check.equal(router.get_bind(), router.replicas[1])
+    check.equal(router.get_bind(), router.replicas[0])
+
+
+def test_no_replica(tmp_path):
+    router = ReplicaRouter(create_engine(f"sqlite:///{tmp_path / 'primary.db'}"))
+    check.equal(router.get_bind(), router.primary)
+
+
+def test_read_your_writes(tmp_path, monkeypatch):
+    router = _router(tmp_path)
+    response = Response()
+    check.equal(
+        Dependency._get_bind(router, _request("PUT"), response, True), router.primary
+    )
+    check.is_in(READ_YOUR_WRITES_COOKIE, response.headers["set-cookie"])
+    # the next reads of the client go to the primary during the window
+    cookie = str(time.time() + 5)
+    check.equal(
+        Dependency._get_bind(router, _request("GET", cookie), Response(), False),
+        router.primary,
+    )
+    expired = str(time.time() - 1)
+    check.is_in(
+        Dependency._get_bind(router, _request("GET", expired), Response(), False),
+        router.replicas,
+    )
+    check.is_in(
+        Dependency._get_bind(router, _request("GET", "invalid"), Response(), False),
+        router.replicas,
+    )
+
+
+def test_write_without_replica_no_cookie(tmp_path):
+    router = ReplicaRouter(create_engine(f"sqlite:///{tmp_path / 'primary.db'}"))
+    response = Response()
+    Dependency._get_bind(router, _request("POST"), response, True)
+    check.is_not_in("set-cookie", response.headers)
+
+
+def test_read_route_post(tmp_path):
+    router = _router(tmp_path)
+    response = Response()
+    # a POST read route (filter) reads a replica without the read-your-writes cookie
+    check.is_in(
+        Dependency._get_bind(router, _request("POST"), response, False),
+        router.replicas,
+    )
+    check.is_not_in("set-cookie", response.headers)
+
+
+def test_filter_routes_read_session():
+    routes = {
+        (route.path, method): route
+        for route in app.routes
+        for method in getattr(route, "methods", [])
+    }
+    dependencies = [
+        dependency.call
+        for dependency in routes[("/v1/cards/filter", "POST")].dependant.dependencies
+    ]
+    check.is_in(Dependency.get_replica_db, dependencies)
+    check.is_not_in(Dependency.get_db, dependencies)
@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+import pytest
+import pytest_check as check
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import DeclarativeBase, configure_mappers, relationship
+
+from ...config.role import Role
+from ...utils.table_version import TableVersion
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.statements import StatementCounter
+
+
+# the resources of Role.__tables_by_id__ (shop, product, cart) on their own metadata
+class RoleBase(DeclarativeBase):
+    pass
+
+
+class ShopMember(RoleBase):
+    __tablename__ = "role_shop_members"
+
+    shop_id = Column(Integer, ForeignKey("role_shops.id"), primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+
+
+class Shop(RoleBase):
+    __tablename__ = "role_shops"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer)
+    members = relationship(ShopMember)
+    user_ids = association_proxy("members", "user_id")
+
+
+class Product(RoleBase):
+    __tablename__ = "role_products"
+
+    id = Column(Integer, primary_key=True)
+    shop_id = Column(Integer, ForeignKey("role_shops.id"))
+
+
+class Cart(RoleBase):
+    __tablename__ = "role_carts"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer)
+
+
+configure_mappers()
+RoleBase.metadata.create_all(bind=engine)
+
+OWNER = SimpleNamespace(id=1, is_admin=False, is_pro=True)
+MEMBER = SimpleNamespace(id=2, is_admin=False, is_pro=True)
+CLIENT = SimpleNamespace(id=3, is_admin=False, is_pro=False)
+
+
+@pytest.fixture
+def resources(session: TestingSessionLocal) -> dict:
+    Role.facts.clear()
+    shop = Shop(id=10, user_id=OWNER.id, members=[ShopMember(user_id=MEMBER.id)])
+    other_shop = Shop(id=11, user_id=5, members=[ShopMember(user_id=12)])
+    session.add_all(
+        [shop, other_shop, Product(id=20, shop_id=10), Cart(id=30, user_id=CLIENT.id)]
+    )
+    session.flush()
+    return {"shop_id": "10", "product_id": "20", "cart_id": "30"}
+
+
+def test_roles(session: TestingSessionLocal, resources: dict):
+    shop = {"shop_id": resources["shop_id"]}
+    # the product is owned through its shop
+    product = {"product_id": resources["product_id"]}
+    cart = {"cart_id": resources["cart_id"]}
+    check.equal(Role.resolve(session, OWNER, shop), Role.mask({"pro", "owner"}))
+    check.equal(Role.resolve(session, OWNER, product), Role.mask({"pro", "owner"}))
+    check.equal(Role.resolve(session, MEMBER, shop), Role.mask({"pro", "member"}))
+    check.equal(Role.resolve(session, MEMBER, product), Role.mask({"pro", "member"}))
+    check.equal(Role.resolve(session, CLIENT, cart), Role.mask({"client", "possessor"}))
+    check.equal(Role.resolve(session, CLIENT, shop), Role.mask({"client"}))
+    # the member ids are compared as a whole (1 isn't a member of 12)
+    check.equal(Role.resolve(session, OWNER, {"shop_id": "11"}), Role.mask({"pro"}))
+    check.equal(
+        Role.resolve(session, OWNER, {"user_id": "1"}), Role.mask({"pro", "myself"})
+    )
+    admin = SimpleNamespace(id=4, is_admin=True, is_pro=False)
+    check.equal(Role.resolve(session, admin, shop), Role.mask({"admin"}))
+
+
+def test_one_query(session: TestingSessionLocal, resources: dict):
+    with StatementCounter() as statements:
+        role = Role.resolve(session, OWNER, resources)
+    check.equal(Role.names(role), {"pro", "owner"})
+    check.equal(len(statements), 1)
+    # the facts are kept for the next checks of the user on the resources
+    with StatementCounter() as statements:
+        check.equal(Role.resolve(session, OWNER, resources), role)
+    check.equal(len(statements), 0)
+    # until a table of the resources is written
+    TableVersion.bump(Shop.__tablename__)
+    with StatementCounter() as statements:
+        Role.resolve(session, OWNER, resources)
+    check.equal(len(statements), 1)
+
+
+def test_member_removed(session: TestingSessionLocal, resources: dict):
+    shop = {"shop_id": resources["shop_id"]}
+    check.equal(Role.resolve(session, MEMBER, shop), Role.mask({"pro", "member"}))
+    # the membership table is in the version of the facts, a removed member loses the role at once
+    check.is_in(ShopMember.__tablename__, Role.tables(("shop_id",)))
+    for member in session.get(Shop, 10).members:
+        session.delete(member)
+    session.flush()
+    check.equal(Role.resolve(session, MEMBER, shop), Role.mask({"pro"}))
+
+
+def test_stats(session: TestingSessionLocal, resources: dict):
+    checks = Role.stats()["checks"]
+    Role.resolve(session, CLIENT, {"cart_id": resources["cart_id"]})
+    stats = Role.stats()
+    check.equal(stats["checks"], checks + 1)
+    check.greater(stats["checks_per_second"], 0)
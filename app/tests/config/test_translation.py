@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+import pytest_check as check
+from fastapi import status
+
+from ... import models
+from ...config.database import Base
+from ...config.translation import Translation
+from ..test_main import TestClient, client, engine, session
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+@pytest.fixture
+def locales(tmp_path):
+    for language, messages in [
+        ("en", 'en:\n  hello: "Hello %{name} {x}"\n  only_en: English\n'),
+        ("fr", 'fr:\n  hello: "Bonjour %{name} {x}"\n'),
+    ]:
+        (tmp_path / language).mkdir()
+        (tmp_path / language / f"tests.{language}.yml").write_text(messages)
+    Translation.load(tmp_path)
+    yield
+    Translation.load()
+
+
+def test_parse_accept_language():
+    check.equal(Translation.parse_accept_language(None), "en")
+    check.equal(Translation.parse_accept_language("fr-CH, fr;q=0.9, en;q=0.8"), "fr")
+    check.equal(Translation.parse_accept_language("en;q=0.5, fr;q=0.8"), "fr")
+    check.equal(Translation.parse_accept_language("fr;q=0, en"), "en")
+    check.equal(Translation.parse_accept_language("de, *;q=0.1"), "en")
+    check.equal(Translation.parse_accept_language("de-DE, FR;q=0.5"), "fr")
+
+
+def test_translate(locales):
+    token = Translation.activate("fr")
+    try:
+        check.equal(Translation.t("tests.hello", name="Sacha"), "Bonjour Sacha {x}")
+        # a placeholder without value is kept
+        check.equal(Translation.t("tests.hello"), "Bonjour %{name} {x}")
+        # a message missing in French is in English, an unknown key is the key
+        check.equal(Translation.t("tests.only_en"), "English")
+        check.equal(Translation.t("tests.unknown"), "tests.unknown")
+    finally:
+        Translation.reset(token)
+    check.equal(Translation.t("tests.hello", name="Ash"), "Hello Ash {x}")
+
+
+def test_catalogs_frozen():
+    with pytest.raises(TypeError):
+        Translation.catalogs["en"]["errors.invalid_cursor"] = "changed"
+
+
+def test_locale_by_context():
+    async def translate(header: str) -> str:
+        Translation.activate(header)
+        await asyncio.sleep(0)
+        return Translation.t("errors.invalid_cursor")
+
+    async def translate_concurrently() -> list[str]:
+        return await asyncio.gather(translate("fr"), translate("en"))
+
+    check.equal(
+        asyncio.run(translate_concurrently()),
+        ["Le curseur de pagination est invalide", "Invalid pagination cursor"],
+    )
+    # the language of a task doesn't leak out of it
+    check.equal(Translation.locale(), "en")
+
+
+def test_requests_dont_reload(client: TestClient):
+    catalogs, loads = Translation.catalogs, Translation.loads
+    for i in range(100):
+        language = ["fr", "en-US,en;q=0.9"][i % 2]
+        response = client.get(
+            "/v1/series?limit=2&after=not-a-cursor",
+            headers={"Accept-Language": language},
+        )
+        check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    check.equal(response.json(), {"detail": "Invalid pagination cursor"})
+    response = client.get(
+        "/v1/series?limit=2&after=not-a-cursor", headers={"Accept-Language": "fr"}
+    )
+    check.equal(response.json(), {"detail": "Le curseur de pagination est invalide"})
+    # the locales are read once, the requests don't add anything to load
+    check.is_(Translation.catalogs, catalogs)
+    check.equal(Translation.loads, loads)
@@ -0,0 +1,109 @@
+import pytest
+import pytest_check as check
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from ... import errors, models
+from ...config.database import Base
+from ...utils.unit_of_work import UnitOfWork
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.fake_model import fake_block
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+def serie_rows(block_id: int, number: int) -> list[dict]:
+    return [
+        {
+            "name": f"Bulk serie {i}",
+            "tag": f"bk{i}",
+            "logo": "logo",
+            "symbol_tag": "symbol",
+            "expanded": True,
+            "standard": False,
+            "realease": "2024-03-22",
+            "block_id": block_id,
+        }
+        for i in range(number)
+    ]
+
+
+def test_bulk_create(session: TestingSessionLocal):
+    block = fake_block(session)
+    rows = serie_rows(block.id, 5)
+    rows[3]["total_count"] = 12
+    ids = models.serie.Serie.bulk_create(session, rows, batch_size=2)
+    check.equal(len(ids), 5)
+    series = {
+        serie.id: serie for serie in models.serie.Serie.where(session, id={"in_": ids})
+    }
+    check.equal([series[id].name for id in ids], [row["name"] for row in rows])
+    check.equal(series[ids[3]].total_count, 12)
+    check.equal(str(series[ids[0]].realease), "2024-03-22")
+
+
+def test_bulk_update_and_upsert(session: TestingSessionLocal):
+    block = fake_block(session)
+    ids = models.serie.Serie.bulk_create(session, serie_rows(block.id, 2))
+    models.serie.Serie.bulk_update(
+        session, [{"id": ids[0], "name": "first"}, {"id": ids[1], "total_count": 3}]
+    )
+    session.expire_all()
+    check.equal(models.serie.Serie.find_by(session, id=ids[0]).name, "first")
+    check.equal(models.serie.Serie.find_by(session, id=ids[1]).total_count, 3)
+
+    new_row, updated_row = serie_rows(block.id, 2)
+    upserted = models.serie.Serie.bulk_upsert(
+        session, [{**updated_row, "id": ids[1], "name": "second"}, new_row]
+    )
+    session.expire_all()
+    check.equal(upserted[0], ids[1])
+    check.equal(models.serie.Serie.find_by(session, id=ids[1]).name, "second")
+    check.equal(
+        models.serie.Serie.find_by(session, id=upserted[1]).name, new_row["name"]
+    )
+
+
+def test_bulk_create_invalid_column(session: TestingSessionLocal):
+    block = fake_block(session)
+    rows = serie_rows(block.id, 1)
+    rows[0]["unknown"] = 1
+    with pytest.raises(errors.columns_error.ColumnsError):
+        models.serie.Serie.bulk_create(session, rows)
+
+
+def test_bulk_in_unit_of_work(session: TestingSessionLocal):
+    block = fake_block(session)
+    commits = []
+
+    def after_commit(session):
+        commits.append(session)
+
+    event.listen(session, "after_commit", after_commit)
+    try:
+        with UnitOfWork.begin(session) as unit:
+            ids = models.serie.Serie.bulk_create(session, serie_rows(block.id, 2))
+            check.is_true(
+                models.serie.Serie.update_by_id(session, ids[0], name="Renamed")
+            )
+            check.equal(commits, [])
+    finally:
+        event.remove(session, "after_commit", after_commit)
+    check.equal(len(commits), 1)
+    check.equal(unit.errors, [])
+    check.equal(models.serie.Serie.find_by(session, id=ids[0]).name, "Renamed")
+
+
+def test_bulk_error_rolls_back_unit_of_work(session: TestingSessionLocal):
+    block = fake_block(session)
+    rows = serie_rows(block.id, 2)
+    rows[1]["name"] = None
+    with pytest.raises(IntegrityError):
+        with UnitOfWork.begin(session):
+            models.serie.Serie.bulk_create(session, serie_rows(block.id, 1))
+            models.serie.Serie.bulk_create(session, rows)
+    # the rows written before the error in the unit of work are rolled back too
+    check.equal(models.serie.Serie.count(session, name={"like": "Bulk serie %"}), 0)
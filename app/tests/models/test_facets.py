@@ -0,0 +1,64 @@
+from collections import Counter
+
+import pytest_check as check
+
+from ... import models
+from ...config.database import Base
+from ...schemas.card import CardFilter
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.fake_model import fake_block, fake_serie
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+def test_facets_count_by_value(session: TestingSessionLocal):
+    block = fake_block(session)
+    series = [fake_serie(session, block_id=block.id) for _ in range(6)]
+
+    facets = models.serie.Serie.facets(
+        session, ["expanded", "block_id", "unknown"], block_id=block.id
+    )
+    check.equal(set(facets), {"expanded", "block_id"})
+    check.equal(facets["block_id"], [(block.id, 6)])
+    check.equal(
+        dict(facets["expanded"]), dict(Counter(serie.expanded for serie in series))
+    )
+    counts = [count for _, count in facets["expanded"]]
+    check.equal(counts, sorted(counts, reverse=True))
+
+
+def test_facets_follow_filters(session: TestingSessionLocal):
+    block = fake_block(session)
+    series = [fake_serie(session, block_id=block.id) for _ in range(4)]
+    ids = [serie.id for serie in series[:3]]
+
+    facets = models.serie.Serie.facets(
+        session, ["block_id"], block_id=block.id, id={"in_": ids}
+    )
+    check.equal(facets["block_id"], [(block.id, 3)])
+    facets = models.serie.Serie.facets(session, ["block_id"], id={"in_": []})
+    check.equal(facets["block_id"], [])
+
+
+def test_card_filter_to_query():
+    card_filter = CardFilter(
+        category=["Pokemon"],
+        standard=True,
+        hp={"min": 60, "max": 120},
+        retreat={"max": 2},
+        energy_types=[1, 3],
+    )
+    check.equal(
+        card_filter.to_query(),
+        {
+            "category": {"in_": ["Pokemon"]},
+            "standard": True,
+            "hp": {"between": [60, 120]},
+            "retreat": {"__le__": 2},
+            "energy_types": {"overlap": [1, 3]},
+        },
+    )
+    check.equal(CardFilter().to_query(), {})
@@ -0,0 +1,74 @@
+import pytest
+import pytest_check as check
+from sqlalchemy import event
+
+from ... import errors, models
+from ...config.database import Base
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.fake_model import fake_block
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+def create_serie(session: TestingSessionLocal, **columns):
+    return models.serie.Serie.create(
+        session,
+        name="Info serie",
+        tag="info",
+        logo="logo",
+        symbol_tag="symbol",
+        expanded=True,
+        standard=False,
+        block_id=fake_block(session).id,
+        **columns,
+    )
+
+
+def test_model_info():
+    info = models.serie.Serie.__model_info__
+    check.equal(info.tablename, "series")
+    check.equal(info.primary_key, "id")
+    check.is_in("block", info.attributes)
+    check.is_in("total_count", info.nullable)
+    check.is_not_in("name", info.nullable)
+    check.equal(info.types["expanded"], bool)
+
+
+def test_update_keeps_not_nullable(session: TestingSessionLocal):
+    serie = create_serie(session, total_count=5)
+    check.is_true(serie.update(session, name=None, total_count=None))
+    check.equal(serie.name, "Info serie")
+    check.is_none(serie.total_count)
+    check.is_false(serie.update(session, unknown=1))
+    check.is_instance(serie._errors, errors.columns_error.ColumnsError)
+    check.is_not_in("_errors", serie.as_dict())
+
+
+def test_update_by_id_single_statement(session: TestingSessionLocal):
+    serie = create_serie(session)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        found = models.serie.Serie.update_by_id(
+            session, serie.id, name="Updated", total_count=7
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    check.is_true(found)
+    # the savepoints of the test session aren't counted
+    statements = [statement for statement in statements if "SAVEPOINT" not in statement]
+    # the UPDATE and the version of the table
+    check.equal(len(statements), 2)
+    check.is_true(statements[0].startswith("UPDATE series"))
+    check.is_in("table_versions", statements[1])
+    check.equal(models.serie.Serie.find_by(session, id=serie.id).name, "Updated")
+    check.is_false(models.serie.Serie.update_by_id(session, 0, name="Missing"))
+    with pytest.raises(errors.columns_error.ColumnsError):
+        models.serie.Serie.update_by_id(session, serie.id, unknown=1)
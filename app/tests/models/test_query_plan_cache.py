@@ -0,0 +1,69 @@
+import pytest_check as check
+
+from ... import models
+from ...config.database import Base
+from ...utils.query_plan import QueryPlanCache
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.fake_model import fake_block, fake_serie
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+def test_parametrize_same_shape():
+    shape_a, _, values_a = QueryPlanCache.parametrize({"name": {"ilike": "%a%"}})
+    shape_b, _, values_b = QueryPlanCache.parametrize({"name": {"ilike": "%b%"}})
+    check.equal(shape_a, shape_b)
+    check.not_equal(values_a, values_b)
+    shape_c, _, _ = QueryPlanCache.parametrize({"tag": {"ilike": "%a%"}})
+    check.not_equal(shape_a, shape_c)
+
+
+def test_parametrize_literals():
+    shape_a, template, values = QueryPlanCache.parametrize(
+        {"name": {"ilike": {"other": "a", "escape": "\\"}}, "logo": None}
+    )
+    check.equal(template["name"]["ilike"]["escape"], "\\")
+    check.is_none(template["logo"])
+    check.equal(list(values.values()), ["a"])
+    shape_b, _, _ = QueryPlanCache.parametrize(
+        {"name": {"ilike": {"other": "a", "escape": "!"}}, "logo": None}
+    )
+    check.not_equal(shape_a, shape_b)
+
+
+def test_query_plan_reused(session: TestingSessionLocal):
+    block = fake_block(session)
+    first = fake_serie(session, block_id=block.id)
+    second = fake_serie(session, block_id=block.id)
+    models.serie.Serie._query_plans.clear()
+
+    check.equal(models.serie.Serie.find_by(session, id=first.id), first)
+    check.equal(models.serie.Serie.find_by(session, id=second.id), second)
+    check.equal(models.serie.Serie.count(session, id={"in_": [first.id, second.id]}), 2)
+    check.equal(models.serie.Serie.count(session, id={"in_": [first.id]}), 1)
+    check.equal(models.serie.Serie.count(session, block={"id": block.id}), 2)
+    stats = models.serie.Serie._query_plans.stats()
+    check.equal(stats["misses"], 3)
+    check.equal(stats["hits"], 2)
+
+
+def test_query_plan_uncacheable(session: TestingSessionLocal):
+    block = fake_block(session)
+    fake_serie(session, block_id=block.id)
+    models.serie.Serie._query_plans.clear()
+    check.equal(models.serie.Serie.count(session, block=block), 1)
+    check.equal(len(models.serie.Serie._query_plans), 0)
+
+
+def test_query_plan_lru_bound():
+    cache = QueryPlanCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    check.is_in("a", cache)
+    check.is_not_in("b", cache)
+    check.equal(len(cache), 2)
@@ -0,0 +1,69 @@
+import pytest_check as check
+from sqlalchemy import event
+
+from ... import models
+from ...config.database import Base
+from ...utils.unit_of_work import UnitOfWork
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.statements import StatementCounter
+
+Base.metadata.create_all(bind=engine, tables=[models.block.Block.__table__])
+
+
+def block_columns(name: str) -> dict:
+    return {"name": name, "tag": name[:5], "logo": "logo"}
+
+
+def test_save_without_select(session: TestingSessionLocal):
+    with StatementCounter() as statements:
+        block = models.block.Block.create(session, **block_columns("Saved"))
+        check.equal(block.name, "Saved")
+        check.is_not_none(block.id)
+    # the row and the version of the table
+    check.equal(statements.kinds, ["INSERT", "INSERT"])
+    check.is_in("table_versions", statements.statements[1])
+    with StatementCounter() as statements:
+        check.is_true(block.update(session, name="Updated"))
+        check.equal(block.tag, "Saved")
+    check.equal(statements.kinds, ["UPDATE", "INSERT"])
+
+
+def test_save_without_refresh(session: TestingSessionLocal):
+    block = models.block.Block.create(session, refresh=False, **block_columns("Raw"))
+    check.is_none(block._errors)
+    with StatementCounter() as statements:
+        check.equal(block.name, "Raw")
+    # the instance expired by the commit is loaded on its first access
+    check.equal(statements.kinds, ["SELECT"])
+
+
+def test_unit_of_work_commit_once(session: TestingSessionLocal):
+    commits = []
+
+    def after_commit(session):
+        commits.append(session)
+
+    event.listen(session, "after_commit", after_commit)
+    try:
+        with UnitOfWork.begin(session) as unit:
+            blocks = [
+                models.block.Block.create(session, **block_columns(f"Unit {i}"))
+                for i in range(3)
+            ]
+            check.equal(commits, [])
+            check.is_true(all(block.id for block in blocks))
+    finally:
+        event.remove(session, "after_commit", after_commit)
+    check.equal(len(commits), 1)
+    check.equal(unit.errors, [])
+    check.equal(models.block.Block.count(session, name={"like": "Unit %"}), 3)
+
+
+def test_unit_of_work_rollback(session: TestingSessionLocal):
+    with UnitOfWork.begin(session) as unit:
+        models.block.Block.create(session, **block_columns("Rollback"))
+        invalid = models.block.Block.create(session, name="Invalid")
+        models.block.Block.create(session, **block_columns("Rollback"))
+    check.is_not_none(invalid._errors)
+    check.equal(len(unit.errors), 1)
+    check.equal(models.block.Block.count(session, name="Rollback"), 0)
@@ -68,3 +68,17 @@ def test_get_reset_database(client_with_engine: TestClient):
     response = client_with_engine.get("/debug/reset")
     check.equal(response.status_code, status.HTTP_200_OK)
     check.equal(response.json(), {"message": "database is reseting"})
+
+
+def test_get_caches(client: TestClient):
+    response = client.get("/debug/caches")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.is_in("hit_rate", response.json()["read"])
+    check.is_in("hit_rate", response.json()["query_plan"])
+    check.is_in("checks_per_second", response.json()["roles"])
+
+
+def test_get_pool(client: TestClient):
+    response = client.get("/debug/pool")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.is_in("status", response.json()["sync"])
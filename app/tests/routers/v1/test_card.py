@@ -0,0 +1,51 @@
+import pytest
+import pytest_check as check
+import sqlalchemy as sa
+from fastapi import status
+
+from .... import models
+from ...test_main import TestClient, TestingSessionLocal, client, engine, session
+from ...utils.fake_model import fake_card
+
+
+@pytest.fixture(autouse=True)
+def cards_table():
+    # created by each test : the tests resetting the database drop it
+    models.card.Card.__table__.create(bind=engine, checkfirst=True)
+
+
+def test_filter_cards_paginated(client: TestClient, session: TestingSessionLocal):
+    card_ids = [fake_card(session).id for _ in range(3)]
+    fake_card(session, category="Trainer")
+
+    seen = []
+    url = "/v1/cards/filter?limit=2"
+    while url:
+        response = client.post(url, json={"category": ["Pokemon"]})
+        check.equal(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        check.less_equal(len(body["items"]), 2)
+        check.equal(body["facets"]["category"], [{"value": "Pokemon", "count": 3}])
+        seen += [card["id"] for card in body["items"]]
+        url = response.links.get("next", {}).get("url")
+    check.equal(seen, sorted(card_ids))
+
+
+def test_filter_cards_without_limit(client: TestClient, session: TestingSessionLocal):
+    for _ in range(2):
+        fake_card(session)
+    response = client.post("/v1/cards/filter", json={"standard": True})
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(len(response.json()["items"]), 2)
+
+
+def test_no_text_index_without_trigrams():
+    sqlite_engine = sa.create_engine("sqlite://")
+    models.card.Card.__table__.create(bind=sqlite_engine)
+    indexes = {
+        index["name"] for index in sa.inspect(sqlite_engine).get_indexes("cards")
+    }
+    # the trigram indexes of the search are only created on postgresql
+    check.is_in("ix_cards_category_rarity", indexes)
+    check.is_not_in("ix_cards_description_trgm", indexes)
+    sqlite_engine.dispose()
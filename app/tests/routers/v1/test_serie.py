@@ -0,0 +1,317 @@
+import base64
+import json
+from datetime import date
+
+import pytest
+import pytest_check as check
+from fastapi import HTTPException, status
+
+from .... import models, schemas
+from ....config.auth import Auth
+from ....config.constants import PROJECTION_CACHE_SIZE
+from ....config.database import Base
+from ....helpers.check_uniq import CheckUniqHelper
+from ....helpers.list_params import ListParams
+from ....helpers.projection import Projection
+from ....helpers.router import RouterModelHelper
+from ....main import app
+from ....utils.read_cache import ReadCache, RedisCacheBackend
+from ...test_main import TestClient, TestingSessionLocal, client, engine, session
+from ...utils.fake_model import fake_block, fake_serie
+from ...utils.fake_redis import FakeRedis
+from ...utils.statements import StatementCounter
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+def test_list_series_keyset_pagination(
+    client: TestClient, session: TestingSessionLocal
+):
+    block = fake_block(session)
+    serie_ids = [fake_serie(session, block_id=block.id).id for _ in range(5)]
+
+    seen = []
+    url = "/v1/series?limit=2"
+    while url:
+        response = client.get(url)
+        check.equal(response.status_code, status.HTTP_200_OK)
+        page = response.json()
+        check.less_equal(len(page), 2)
+        seen += [serie["id"] for serie in page]
+        url = response.links.get("next", {}).get("url")
+    check.equal(seen, sorted(serie_ids))
+
+
+def test_list_series_without_limit(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    for _ in range(3):
+        fake_serie(session, block_id=block.id)
+    response = client.get("/v1/series")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(len(response.json()), 3)
+    check.is_not_in("link", response.headers)
+
+
+def test_list_series_invalid_cursor(client: TestClient):
+    response = client.get("/v1/series?limit=2&after=not-a-cursor")
+    check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    check.equal(response.json(), {"detail": "Invalid pagination cursor"})
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        {"id": 1, "value": 2, "last_id": 3},
+        ["id", [1], 1],
+        ["id", 1, {"id": 1}],
+        ["id", 1],
+        "id",
+    ],
+)
+def test_list_series_cursor_not_scalars(client: TestClient, cursor):
+    after = base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+    response = client.get(f"/v1/series?limit=2&after={after}")
+    check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    check.equal(response.json(), {"detail": "Invalid pagination cursor"})
+
+
+def test_list_series_cursor_invalid_id(client: TestClient):
+    after = base64.urlsafe_b64encode(json.dumps(["id", 1, "abc"]).encode()).decode()
+    response = client.get(f"/v1/series?limit=2&after={after}")
+    check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    check.equal(response.json(), {"detail": "Invalid pagination cursor"})
+
+
+def test_decode_cursor_column_types():
+    params = ListParams(after=ListParams.encode_cursor("realease", ["2024-02-01", "3"]))
+    check.equal(
+        params.decode_cursor("realease", models.serie.Serie), [date(2024, 2, 1), 3]
+    )
+    params = ListParams(after=ListParams.encode_cursor("realease", ["02/01/2024", 3]))
+    with pytest.raises(HTTPException) as error:
+        params.decode_cursor("realease", models.serie.Serie)
+    check.equal(error.value.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+def test_list_series_stream_json(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    serie_ids = [fake_serie(session, block_id=block.id).id for _ in range(3)]
+    response = client.get("/v1/series?stream=true")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(response.headers["content-type"], "application/json")
+    check.equal([serie["id"] for serie in response.json()], serie_ids)
+
+
+def test_list_series_stream_ndjson(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    serie_ids = [fake_serie(session, block_id=block.id).id for _ in range(3)]
+    response = client.get("/v1/series", headers={"Accept": "application/x-ndjson"})
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(response.headers["content-type"], "application/x-ndjson")
+    lines = response.text.splitlines()
+    check.equal([json.loads(line)["id"] for line in lines], serie_ids)
+
+
+def test_list_series_stream_empty(client: TestClient):
+    response = client.get("/v1/series?stream=true")
+    check.equal(response.json(), [])
+
+
+def test_list_series_etag(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    fake_serie(session, block_id=block.id)
+    response = client.get("/v1/series")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    etag = response.headers["etag"]
+
+    response = client.get("/v1/series", headers={"If-None-Match": etag})
+    check.equal(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    check.equal(response.headers["etag"], etag)
+    check.equal(response.content, b"")
+
+    # another query of the same table has another ETag
+    response = client.get("/v1/series?limit=1", headers={"If-None-Match": etag})
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.not_equal(response.headers["etag"], etag)
+
+
+def test_list_series_page_etag_only_if_none_match(
+    client: TestClient, session: TestingSessionLocal
+):
+    block = fake_block(session)
+    for _ in range(3):
+        fake_serie(session, block_id=block.id)
+    response = client.get("/v1/series?limit=2")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.is_not_in("etag", response.headers)
+    response = client.get("/v1/series?stream=true")
+    check.is_not_in("etag", response.headers)
+
+    response = client.get("/v1/series?limit=2", headers={"If-None-Match": '"old"'})
+    etag = response.headers["etag"]
+    response = client.get("/v1/series?limit=2", headers={"If-None-Match": etag})
+    check.equal(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+def test_list_series_etag_changes_after_write(
+    client: TestClient, session: TestingSessionLocal
+):
+    block = fake_block(session)
+    serie = fake_serie(session, block_id=block.id)
+    etag = client.get("/v1/series").headers["etag"]
+
+    serie.update(session, name="renamed")
+    response = client.get("/v1/series", headers={"If-None-Match": etag})
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.not_equal(response.headers["etag"], etag)
+
+    response = client.get("/v1/series?stream=true", headers={"If-None-Match": etag})
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.is_in("etag", response.headers)
+
+
+def test_read_serie_cached_and_invalidated(
+    client: TestClient, session: TestingSessionLocal
+):
+    ReadCache.backend = RedisCacheBackend(FakeRedis())
+    block = fake_block(session)
+    serie = fake_serie(session, block_id=block.id)
+
+    response = client.get(f"/v1/series/{serie.id}")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(response.json()["name"], serie.name)
+    response = client.get(f"/v1/series/{serie.id}")
+    check.equal(response.json()["name"], serie.name)
+    check.equal(ReadCache.stats()["hits"], 1)
+
+    serie.update(session, name="renamed")
+    response = client.get(f"/v1/series/{serie.id}")
+    check.equal(response.json()["name"], "renamed")
+    check.equal(ReadCache.stats()["misses"], 2)
+
+    serie_id = serie.id
+    serie.delete(session)
+    response = client.get(f"/v1/series/{serie_id}")
+    check.equal(response.status_code, status.HTTP_404_NOT_FOUND)
+    ReadCache.backend = None
+
+
+def test_bulk_series(client: TestClient, session: TestingSessionLocal):
+    app.dependency_overrides[Auth.check_role_user] = lambda: None
+    block = fake_block(session)
+    rows = [
+        {
+            "name": f"Bulk {i}",
+            "tag": f"b{i}",
+            "logo": "logo",
+            "symbol_tag": "symbol",
+            "expanded": True,
+            "standard": True,
+            "realease": "2024-03-22",
+            "updated_at": "2024-03-22T10:00:00",
+            "created_at": "2024-03-22T10:00:00",
+            "block_id": block.id,
+        }
+        for i in range(3)
+    ]
+    response = client.post("/v1/series/bulk", json=rows)
+    check.equal(response.status_code, status.HTTP_200_OK)
+    created = response.json()
+    check.equal([serie["name"] for serie in created], ["Bulk 0", "Bulk 1", "Bulk 2"])
+
+    response = client.post(
+        "/v1/series/bulk?mode=update",
+        json=[{"id": created[0]["id"], "name": "Renamed"}],
+    )
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(response.json()[0]["name"], "Renamed")
+
+    response = client.post(
+        "/v1/series/bulk?mode=update", json=[{"id": 999_999, "name": "Missing"}]
+    )
+    check.equal(response.status_code, status.HTTP_404_NOT_FOUND)
+    response = client.post("/v1/series/bulk", json=[{**rows[0], "block_id": 999_999}])
+    check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    # the rows are validated by the columns of the table
+    response = client.post("/v1/series/bulk", json=[{**rows[0], "unknown": 1}])
+    check.equal(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+    response = client.post("/v1/series/bulk", json=[{**rows[0], "block_id": "one"}])
+    check.equal(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+    del app.dependency_overrides[Auth.check_role_user]
+
+
+def test_bulk_check_uniq_set_wise(session: TestingSessionLocal):
+    router = RouterModelHelper(
+        name="serie", uniq_list=[CheckUniqHelper(name="name", ilike_list=["name"])]
+    )
+    block = fake_block(session)
+    serie = fake_serie(session, block_id=block.id, name="Uniq name")
+    with pytest.raises(HTTPException):
+        router._check_uniq_bulk(session, models.serie.Serie, [{"name": "uniq NAME"}])
+    with pytest.raises(HTTPException):
+        router._check_uniq_bulk(
+            session, models.serie.Serie, [{"name": "Other"}, {"name": "other"}]
+        )
+    router._check_uniq_bulk(session, models.serie.Serie, [{"name": "Other"}])
+    router._check_uniq_bulk(
+        session,
+        models.serie.Serie,
+        [{"id": serie.id, "name": "uniq name"}],
+        update=True,
+    )
+
+
+def test_list_series_statements(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    for number in [2, 6]:
+        for _ in range(number):
+            fake_serie(session, block_id=block.id)
+        with StatementCounter() as statements:
+            response = client.get("/v1/series?limit=50")
+        check.equal(response.status_code, status.HTTP_200_OK)
+        # the count doesn't grow with the number of series (no N+1 queries)
+        statements.assert_at_most(2)
+
+
+def test_list_series_fields(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    for _ in range(3):
+        fake_serie(session, block_id=block.id)
+    with StatementCounter() as statements:
+        response = client.get("/v1/series?limit=2&fields=name,tag")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal([set(serie) for serie in response.json()], [{"name", "tag"}] * 2)
+    check.is_in("next", response.links)
+    # the pages have an ETag only for the requests with If-None-Match
+    check.is_not_in("etag", response.headers)
+    # the columns not requested aren't selected
+    select = next(s for s in statements.statements if s.startswith("SELECT series.id"))
+    check.is_in("series.name", select)
+    check.is_not_in("series.logo", select)
+    next_page = client.get(response.links["next"]["url"]).json()
+    check.equal([set(serie) for serie in next_page], [{"name", "tag"}])
+
+
+def test_read_serie_fields(client: TestClient, session: TestingSessionLocal):
+    serie = fake_serie(session, block_id=fake_block(session).id)
+    response = client.get(f"/v1/series/{serie.id}?fields=id,total_count")
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(response.json(), {"id": serie.id, "total_count": serie.total_count})
+    response = client.get(f"/v1/series/{serie.id}?fields=id,unknown")
+    check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    check.equal(response.json(), {"detail": "Invalid fields : unknown"})
+
+
+def test_fields_in_any_order_share_one_schema():
+    schema = schemas.serie.Serie
+    names = Projection.parse("tag,name", schema)
+    check.equal(names, Projection.parse(" name,tag,name", schema))
+    check.equal(names, ("name", "tag"))
+    check.is_(
+        Projection.schema(schema, names),
+        Projection.schema(schema, Projection.parse("name,tag", schema)),
+    )
+    check.equal(Projection.schema.cache_info().maxsize, PROJECTION_CACHE_SIZE)
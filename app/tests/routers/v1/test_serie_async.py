@@ -0,0 +1,106 @@
+import json
+from unittest.mock import ANY
+
+import pytest
+import pytest_check as check
+import sqlalchemy as sa
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from .... import models
+from ....config.database import Base, get_async_url
+from ....helpers.list_params import ListParams
+from ....routers.v1.serie import router_serie
+from ....utils.table_version import table_versions
+from ...utils.fake_model import fake_block, fake_serie
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def async_session_maker(tmp_path):
+    url = f"sqlite:///{tmp_path}/async.db"
+    engine = sa.create_engine(url)
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[
+            models.block.Block.__table__,
+            models.serie.Serie.__table__,
+            table_versions,
+        ],
+    )
+    with Session(engine) as session:
+        block = fake_block(session)
+        for _ in range(5):
+            fake_serie(session, block_id=block.id)
+    engine.dispose()
+    async_engine = create_async_engine(get_async_url(url))
+    yield async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+def test_get_async_url():
+    check.equal(
+        get_async_url("sqlite:///./db/app.db"), "sqlite+aiosqlite:///./db/app.db"
+    )
+    check.equal(
+        get_async_url("postgresql+psycopg2://user@host/db"),
+        "postgresql+asyncpg://user@host/db",
+    )
+
+
+@pytest.mark.anyio
+async def test_read_async(async_session_maker):
+    async with async_session_maker() as db:
+        serie = await router_serie.read_async(db, 1)
+        check.equal(serie.id, 1)
+        response = await router_serie.read_async(db, 1, cache=True)
+        check.is_in(b'"id":1', response.body)
+        with pytest.raises(HTTPException):
+            await router_serie.read_async(db, 999_999)
+
+
+@pytest.mark.anyio
+async def test_list_async(async_session_maker):
+    async with async_session_maker() as db:
+        series = await router_serie.list_async(db, query={})
+        check.equal([serie.id for serie in series], [1, 2, 3, 4, 5])
+        check.equal(await models.serie.Serie.count_async(db, id={"__gt__": 2}), 3)
+
+        params = ListParams(limit=2)
+        page = await router_serie.list_async(db, query={}, params=params)
+        check.equal([serie.id for serie in page], [1, 2])
+        page, last_key = await models.serie.Serie.paginate_async(
+            db, limit=2, after=[4, 4]
+        )
+        check.equal([serie.id for serie in page], [5])
+        check.is_none(last_key)
+
+
+@pytest.mark.anyio
+async def test_fields_async(async_session_maker):
+    async with async_session_maker() as db:
+        response = await router_serie.read_async(db, 1, fields="id,name")
+        check.equal(set(json.loads(response.body)), {"id", "name"})
+        params = ListParams(limit=2, fields="tag")
+        response = await router_serie.list_async(db, query={}, params=params)
+        check.equal(json.loads(response.body), [{"tag": ANY}, {"tag": ANY}])
+
+
+@pytest.mark.anyio
+async def test_routes_any_session(async_session_maker, tmp_path):
+    async with async_session_maker() as db:
+        serie = await router_serie.read_route(db, 1)
+        check.equal(serie.id, 1)
+        series = await router_serie.list_route(db, query={"id": {"__gt__": 3}})
+        check.equal([serie.id for serie in series], [4, 5])
+    engine = sa.create_engine(f"sqlite:///{tmp_path}/async.db")
+    with Session(engine) as db:
+        serie = await router_serie.read_route(db, 1)
+        check.equal(serie.id, 1)
+        series = await router_serie.list_route(db, query={"id": {"__gt__": 3}})
+        check.equal([serie.id for serie in series], [4, 5])
+    engine.dispose()
@@ -0,0 +1,117 @@
+import pytest_check as check
+
+from ... import models
+from ...config.database import Base
+from ...services.autocomplete import Autocomplete, PrefixTrie
+from ...utils.unit_of_work import UnitOfWork
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.fake_model import fake_block, fake_serie
+
+Base.metadata.create_all(
+    bind=engine,
+    tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+)
+
+
+def _trie() -> PrefixTrie:
+    trie = PrefixTrie()
+    trie.add("card", 1, "Pikachu V")
+    trie.add("card", 2, "Dark Pikachu")
+    trie.add("card", 3, "Pichu")
+    trie.add("serie", 1, "Épée et Bouclier")
+    return trie
+
+
+def _names(suggestions: list[dict]) -> list[str]:
+    return [suggestion["name"] for suggestion in suggestions]
+
+
+def test_complete_ranking():
+    check.equal(_names(_trie().complete("pi")), ["Pichu", "Pikachu V", "Dark Pikachu"])
+    check.equal(_names(_trie().complete("pi", limit=1)), ["Pichu"])
+
+
+def test_complete_accent_folded():
+    check.equal(
+        _trie().complete("EPEE"),
+        [{"type": "serie", "id": 1, "name": "Épée et Bouclier"}],
+    )
+    check.equal(_names(_trie().complete("bouc")), ["Épée et Bouclier"])
+    check.equal(_trie().complete("x"), [])
+    check.equal(_trie().complete(" "), [])
+
+
+def test_complete_after_update_and_remove():
+    trie = _trie()
+    trie.add("card", 3, "Raichu")
+    check.equal(_names(trie.complete("pi")), ["Pikachu V", "Dark Pikachu"])
+    check.equal(_names(trie.complete("rai")), ["Raichu"])
+    trie.remove("card", 1)
+    trie.remove("card", 2)
+    check.equal(trie.complete("pi"), [])
+    check.equal(len(trie), 2)
+
+
+def test_complete_keeps_best_of_large_subtree():
+    trie = PrefixTrie()
+    for entry_id in range(200):
+        trie.add("card", entry_id, f"Card {entry_id:03d} long name")
+    trie.add("card", 999, "Ca")
+    check.equal(_names(trie.complete("ca", limit=2)), ["Ca", "Card 000 long name"])
+    trie.remove("card", 999)
+    trie.remove("card", 0)
+    check.equal(_names(trie.complete("ca", limit=1)), ["Card 001 long name"])
+
+
+def test_load_same_as_add():
+    trie = PrefixTrie()
+    trie.load(
+        [
+            ("card", 1, "Pikachu V"),
+            ("card", 2, "Dark Pikachu"),
+            ("card", 3, "Pichu"),
+            ("serie", 1, "Épée et Bouclier"),
+        ]
+    )
+    for prefix in ["p", "pi", "pika", "d", "epee", "bouc"]:
+        check.equal(trie.complete(prefix), _trie().complete(prefix))
+
+
+def test_bulk_writes_refresh_names(session: TestingSessionLocal):
+    block = fake_block(session)
+    row = {
+        "tag": "bk",
+        "logo": "logo",
+        "symbol_tag": "symbol",
+        "expanded": True,
+        "standard": True,
+        "block_id": block.id,
+    }
+    (serie_id,) = models.serie.Serie.bulk_create(
+        session, [{**row, "name": "Zygarde Bulk"}]
+    )
+    check.equal(
+        Autocomplete.complete("zygarde b"),
+        [{"type": "serie", "id": serie_id, "name": "Zygarde Bulk"}],
+    )
+    models.serie.Serie.bulk_update(session, [{"id": serie_id, "name": "Xerneas Bulk"}])
+    check.equal(Autocomplete.complete("zygarde b"), [])
+    check.equal(_names(Autocomplete.complete("xerneas b")), ["Xerneas Bulk"])
+    models.serie.Serie.bulk_upsert(
+        session, [{**row, "id": serie_id, "name": "Yveltal Bulk"}]
+    )
+    check.equal(_names(Autocomplete.complete("yveltal b")), ["Yveltal Bulk"])
+    Autocomplete.trie.remove("serie", serie_id)
+
+
+def test_rolled_back_write_not_completed(session: TestingSessionLocal):
+    block = fake_block(session)
+    with UnitOfWork.begin(session) as unit:
+        fake_serie(session, block_id=block.id, name="Phantom Serie")
+        unit.fail()
+    check.equal(Autocomplete.complete("phantom se"), [])
+    serie = fake_serie(session, block_id=block.id, name="Phantom Serie")
+    check.equal(
+        Autocomplete.complete("phantom se"),
+        [{"type": "serie", "id": serie.id, "name": "Phantom Serie"}],
+    )
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+import pytest_check as check
+from moto import mock_dynamodb, mock_s3, mock_sns
+
+from ...config.env import settings
+from ...services.aws import AWS, AWSClients
+
+TABLE = "monitoring"
+
+
+@pytest.fixture(autouse=True)
+def aws(monkeypatch):
+    for name, value in {
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_DEFAULT_REGION": "eu-west-3",
+    }.items():
+        monkeypatch.setenv(name, value)
+    AWSClients.close()
+    with mock_dynamodb(), mock_s3(), mock_sns():
+        yield
+    AWSClients.close()
+
+
+@pytest.fixture
+def no_new_client(monkeypatch):
+    """The methods of AWS must use the clients of the registry, never a new one."""
+    AWSClients.initialize()
+
+    def client(*args, **kwargs):
+        raise AssertionError("boto3.client called")
+
+    monkeypatch.setattr(boto3, "client", client)
+    monkeypatch.setattr(boto3.session.Session, "client", client)
+
+
+def test_client_reused():
+    client = AWSClients.client("dynamodb")
+    check.is_(AWSClients.client("dynamodb"), client)
+    check.is_not(AWSClients.client("dynamodb", "us-east-1"), client)
+    check.equal(client.meta.region_name, "eu-west-3")
+    check.equal(
+        client.meta.config.max_pool_connections, settings.aws_max_pool_connections
+    )
+    check.equal(client.meta.config.retries["mode"], settings.aws_retry_mode)
+    check.equal(client.meta.config.read_timeout, settings.aws_read_timeout)
+
+
+def test_client_created_once_by_threads():
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        clients = list(executor.map(lambda _: AWSClients.client("sns"), range(64)))
+    check.equal(len({id(client) for client in clients}), 1)
+    check.equal(list(AWSClients.clients), [("sns", None)])
+
+
+def test_close():
+    AWSClients.initialize(("s3",))
+    client = AWSClients.client("s3")
+    AWSClients.close()
+    check.equal(AWSClients.clients, {})
+    check.is_not(AWSClients.client("s3"), client)
+
+
+def test_dynamodb_put_item_and_scan(no_new_client):
+    AWSClients.client("dynamodb").create_table(
+        TableName=TABLE,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    for i in range(3):
+        check.is_none(AWS.dynamodb_put_item(TABLE, {"id": {"S": str(i)}}))
+    error, items = AWS.dynamodb_scan(TABLE, {})
+    check.is_none(error)
+    check.equal(sorted(item["id"]["S"] for item in items), ["0", "1", "2"])
+    check.is_not_none(AWS.dynamodb_put_item("unknown", {"id": {"S": "0"}}))
+
+
+def test_s3_upload_file(no_new_client, tmp_path):
+    AWSClients.client("s3").create_bucket(
+        Bucket="bucket", CreateBucketConfiguration={"LocationConstraint": "eu-west-3"}
+    )
+    file = tmp_path / "file.txt"
+    file.write_bytes(b"pikachu")
+
+    class Upload:
+        def __init__(self, path):
+            self.file = open(path, "rb")
+
+    upload = Upload(file)
+    check.is_none(AWS.s3_upload_file(upload, "bucket", "file.txt"))
+    upload.file.close()
+    check.is_none(
+        AWS.s3_download_file("bucket", "file.txt", str(tmp_path / "download.txt"))
+    )
+    check.equal((tmp_path / "download.txt").read_bytes(), b"pikachu")
+
+
+def test_sns_publish(no_new_client):
+    topic_arn = AWSClients.client("sns").create_topic(Name="alert")["TopicArn"]
+    AWS.sns_subscribe(topic_arn, "sacha@gmail.com")
+    AWS.sns_publish(topic_arn, "subject", '{"default": "body"}')
+    check.equal(len(AWS.sns_get_subscriptions_status(topic_arn)), 1)
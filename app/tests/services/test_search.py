@@ -0,0 +1,69 @@
+import pytest_check as check
+
+from ... import models
+from ...services.search import Search, TrigramIndex
+from ...utils.unit_of_work import UnitOfWork
+from ..test_main import TestingSessionLocal, engine, session
+from ..utils.fake_model import fake_card
+
+models.card.Card.__table__.create(bind=engine, checkfirst=True)
+
+
+def _index() -> TrigramIndex:
+    index = TrigramIndex({"name": 1.0, "description": 0.5})
+    index.add(1, name="Pikachu", description="Un Pokémon électrique")
+    index.add(2, name="Raichu", description="L'évolution de Pikachu")
+    index.add(3, name="Évoli", description=None)
+    return index
+
+
+def test_trigrams():
+    check.equal(TrigramIndex.trigrams("Éa"), {"  e", " ea", "ea "})
+    check.equal(TrigramIndex.trigrams(None), set())
+
+
+def test_search_ranking():
+    ranked = _index().search("pikachu")
+    check.equal([document_id for document_id, _ in ranked], [1, 2])
+    check.greater(ranked[0][1], ranked[1][1])
+
+
+def test_search_folds_accents_and_typos():
+    index = _index()
+    check.equal(index.search("evoli")[0][0], 3)
+    check.equal([document_id for document_id, _ in index.search("pikachuu")], [1, 2])
+    check.equal(index.search("bulbizarre"), [])
+    check.equal(index.search(""), [])
+
+
+def test_search_after_update_and_remove():
+    index = _index()
+    index.add(1, name="Pichu", description="")
+    check.equal([document_id for document_id, _ in index.search("pikachu")], [2])
+    index.remove(2)
+    check.equal(index.search("pikachu"), [])
+    check.equal(len(index), 2)
+
+
+def test_bulk_writes_indexed(session: TestingSessionLocal):
+    Search._load_card_index(session)
+    row = {
+        key: value for key, value in fake_card(session).as_dict().items() if key != "id"
+    }
+    (card_id,) = models.card.Card.bulk_create(session, [{**row, "name": "Mewtwo"}])
+    check.equal([card.id for card in Search.search_cards(session, "mewtwo")], [card_id])
+    models.card.Card.bulk_update(session, [{"id": card_id, "name": "Lugia"}])
+    check.equal(Search.search_cards(session, "mewtwo"), [])
+    check.equal([card.id for card in Search.search_cards(session, "lugia")], [card_id])
+    Search.card_index.loaded = False
+
+
+def test_rolled_back_write_not_indexed(session: TestingSessionLocal):
+    Search._load_card_index(session)
+    with UnitOfWork.begin(session) as unit:
+        card = fake_card(session, name="Phantom")
+        unit.fail()
+    check.equal(Search.card_index.search("phantom"), [])
+    card = fake_card(session, name="Phantom")
+    check.equal([id for id, _ in Search.card_index.search("phantom")], [card.id])
+    Search.card_index.loaded = False
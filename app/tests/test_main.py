@@ -3,6 +3,8 @@ import sqlalchemy as sa
 from faker import Faker
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
 
 from ..config.database import Base
@@ -11,6 +13,7 @@ from ..config.lifespan import startup
 from ..config.translation import active_translation
 from ..main import app
 from ..utils.dependency import Dependency
+from ..utils.table_version import table_versions
 
 engine = sa.create_engine(
     settings.database_url, connect_args={"check_same_thread": False}
@@ -45,12 +48,20 @@ def do_begin(conn):
     conn.exec_driver_sql("BEGIN")
 
 
+# The ARRAY columns (cards) are stored as JSON by sqlite, so their tables can be created by the tests.
+@compiles(ARRAY, "sqlite")
+def compile_array(element, compiler, **kwargs):
+    return "JSON"
+
+
 # This fixture is the main difference to before. It creates a nested
 # transaction, recreates it when the application code calls session.commit
 # and rolls it back at the end.
 # Based on: https://docs.sqlalchemy.org/en/14/orm/session_transaction.html#joining-a-session-into-an-external-transaction-such-as-for-test-suites
 @pytest.fixture()
 def session():
+    # each write bumps the version of its table (dropped by the tests resetting the database)
+    table_versions.create(bind=engine, checkfirst=True)
     connection = engine.connect()
     transaction = connection.begin()
     session = TestingSessionLocal(bind=connection)
@@ -84,8 +95,10 @@ def client(session: TestingSessionLocal):
         yield session
 
     app.dependency_overrides[Dependency.get_db] = override_get_db
+    app.dependency_overrides[Dependency.get_replica_db] = override_get_db
     yield TestClient(app)
     del app.dependency_overrides[Dependency.get_db]
+    del app.dependency_overrides[Dependency.get_replica_db]
 
 
 # A fixture for the fastapi test client.
@@ -97,5 +110,7 @@ def client_with_engine():
         yield session
 
     app.dependency_overrides[Dependency.get_db] = override_get_db
+    app.dependency_overrides[Dependency.get_replica_db] = override_get_db
     yield TestClient(app)
     del app.dependency_overrides[Dependency.get_db]
+    del app.dependency_overrides[Dependency.get_replica_db]
@@ -35,6 +35,35 @@ def fake_machine(
     return models.machine.Machine.create(session, **machine_json)
 
 
+def fake_block(session: TestingSessionLocal, **columns_ids):
+    block_json = {
+        "name": fake.pystr(),
+        "tag": fake.pystr(max_chars=5),
+        "logo": fake.url(),
+        "updated_at": fake.date_time(),
+        "created_at": fake.date_time(),
+    }
+    return models.block.Block.create(session, **block_json)
+
+
+def fake_card(session: TestingSessionLocal, **columns_ids):
+    card_json = {
+        "name": fake.pystr(),
+        "tag": fake.pystr(max_chars=5),
+        "category": "Pokemon",
+        "local_tag": fake.pystr(max_chars=5),
+        "description": fake.sentence(),
+        "regulation_mark": "G",
+        "rarity": 1,
+        "expanded": True,
+        "standard": True,
+        "updated_at": fake.date_time(),
+        "created_at": fake.date_time(),
+        **columns_ids,
+    }
+    return models.card.Card.create(session, **card_json)
+
+
 def fake_cart(session: TestingSessionLocal, **columns_ids):
     quantity = fake.pyint()
     product_id = (
@@ -92,6 +121,27 @@ def fake_role_pro(session: TestingSessionLocal):
     return fake_user(session, is_pro=True)
 
 
+def fake_serie(session: TestingSessionLocal, **columns_ids):
+    block_id = (
+        columns_ids["block_id"]
+        if "block_id" in columns_ids and isinstance(columns_ids["block_id"], int)
+        else fake_block(session).id
+    )
+    serie_json = {
+        "name": columns_ids.get("name", fake.pystr()),
+        "tag": fake.pystr(max_chars=5),
+        "logo": fake.url(),
+        "symbol_tag": fake.pystr(max_chars=5),
+        "expanded": fake.pybool(),
+        "standard": fake.pybool(),
+        "realease": fake.date_object(),
+        "updated_at": fake.date_time(),
+        "created_at": fake.date_time(),
+        "block_id": block_id,
+    }
+    return models.serie.Serie.create(session, **serie_json)
+
+
 def fake_shop(session: TestingSessionLocal, **columns_ids):
     name = fake.pystr()
     user_id = (
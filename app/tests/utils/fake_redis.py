@@ -0,0 +1,30 @@
+import fnmatch
+import time
+
+
+class FakeRedis:
+    """A local stand-in of the redis client with the commands used by RedisCacheBackend."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[float | None, bytes]] = {}
+
+    def get(self, name: str) -> bytes | None:
+        expires, value = self.data.get(name, (None, None))
+        if expires is not None and expires <= time.monotonic():
+            del self.data[name]
+            return None
+        return value
+
+    def set(self, name: str, value, ex: int | None = None) -> bool:
+        expires = None if ex is None else time.monotonic() + ex
+        self.data[name] = (
+            expires,
+            value if isinstance(value, bytes) else value.encode(),
+        )
+        return True
+
+    def delete(self, *names: str) -> int:
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str = "*"):
+        return iter([name for name in self.data if fnmatch.fnmatchcase(name, match)])
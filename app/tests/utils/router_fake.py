@@ -1,7 +1,6 @@
 import enum
 from datetime import datetime
 
-import i18n
 import pytest
 import pytest_check as check
 from fastapi import status
@@ -9,6 +8,7 @@ from fastapi.logger import logger
 from pydantic import BaseModel
 
 from ... import models, schemas
+from ...config.translation import Translation
 from ...utils.tools import Tools
 from ..test_main import TestClient, TestingSessionLocal, fake
 from . import fake_model
@@ -76,7 +76,7 @@ class RouterFake(BaseModel):
             user = schemas.user.UserComplete.model_validate(fake_ability["user"])
             if request.param == "invalid_manager" and role != "admin":
                 return_json["response_json"] = {
-                    "detail": i18n.t(self.message_invalid_role)
+                    "detail": Translation.t(self.message_invalid_role)
                 }
                 return return_json
 
@@ -111,7 +111,7 @@ class RouterFake(BaseModel):
             user = schemas.user.UserComplete.model_validate(fake_ability["user"])
             if request.param == "invalid_manager" and role != "admin":
                 return_json["response_json"] = {
-                    "detail": i18n.t(self.message_invalid_role)
+                    "detail": Translation.t(self.message_invalid_role)
                 }
                 return return_json
             levels = get_levels(session, role, user, self.owner)
@@ -137,9 +137,11 @@ class RouterFake(BaseModel):
                     return_json[self.name_model_key][_attribute] = model_attribute
                 return_json["status_code"] = status.HTTP_400_BAD_REQUEST
                 return_json["response_json"] = {
-                    "detail": i18n.t(
+                    "detail": Translation.t(
                         self.message_already,
-                        name=i18n.t(f"models.{self.tablename}.{self.uniq_attribute}"),
+                        name=Translation.t(
+                            f"models.{self.tablename}.{self.uniq_attribute}"
+                        ),
                     )
                 }
                 print(f"{model = } | {return_json = }")
@@ -165,14 +167,15 @@ class RouterFake(BaseModel):
                 allowed_roles += ["possessor", "client"]
             if role not in allowed_roles and request.param != "valid_manager":
                 return_json["response_json"] = {
-                    "detail": i18n.t(self.message_invalid_role)
+                    "detail": Translation.t(self.message_invalid_role)
                 }
                 return return_json
             elif request.param == "not_found":
                 return_json["status_code"] = status.HTTP_404_NOT_FOUND
                 return_json["response_json"] = {
-                    "detail": i18n.t(
-                        self.message_not_found, name=i18n.t(self.message_model_name)
+                    "detail": Translation.t(
+                        self.message_not_found,
+                        name=Translation.t(self.message_model_name),
                     )
                 }
                 return return_json
@@ -209,14 +212,15 @@ class RouterFake(BaseModel):
             user = schemas.user.UserComplete.model_validate(fake_ability["user"])
             if role != "admin" and request.param in ["not_found", "invalid_manager"]:
                 return_json["response_json"] = {
-                    "detail": i18n.t(self.message_invalid_role)
+                    "detail": Translation.t(self.message_invalid_role)
                 }
                 return return_json
             elif request.param == "not_found":
                 return_json["status_code"] = status.HTTP_404_NOT_FOUND
                 return_json["response_json"] = {
-                    "detail": i18n.t(
-                        self.message_not_found, name=i18n.t(self.message_model_name)
+                    "detail": Translation.t(
+                        self.message_not_found,
+                        name=Translation.t(self.message_model_name),
                     )
                 }
                 return return_json
@@ -249,8 +253,8 @@ class RouterFake(BaseModel):
         return_json = {
             "status_code": status.HTTP_404_NOT_FOUND,
             "response_json": {
-                "detail": i18n.t(
-                    self.message_not_found, name=i18n.t(self.message_model_name)
+                "detail": Translation.t(
+                    self.message_not_found, name=Translation.t(self.message_model_name)
                 )
             },
         }
@@ -265,7 +269,7 @@ class RouterFake(BaseModel):
             if role != "admin" and request.param != "valid_params":
                 return_json["status_code"] = status.HTTP_401_UNAUTHORIZED
                 return_json["response_json"] = {
-                    "detail": i18n.t(self.message_invalid_role)
+                    "detail": Translation.t(self.message_invalid_role)
                 }
                 return return_json
             if request.param == "not_found":
@@ -0,0 +1,43 @@
+from sqlalchemy import event
+
+from ..test_main import engine
+
+
+class StatementCounter:
+    """Record the SQL statements executed on an engine (without the savepoints of the test session).
+
+    with StatementCounter() as statements:
+        client.get("/v1/series")
+    statements.assert_at_most(2)
+    """
+
+    def __init__(self, bind=engine):
+        self.bind = bind
+        self.statements: list[str] = []
+
+    def __enter__(self) -> "StatementCounter":
+        self.statements = []
+        event.listen(self.bind, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *args) -> None:
+        event.remove(self.bind, "before_cursor_execute", self._record)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, *args) -> None:
+        if "SAVEPOINT" not in statement:
+            self.statements.append(statement)
+
+    @property
+    def kinds(self) -> list[str]:
+        """The first keyword of each statement (SELECT, INSERT, ...)."""
+        return [statement.split(" ", 1)[0] for statement in self.statements]
+
+    def assert_at_most(self, number: int) -> None:
+        """This function fail if more than `number` statements were executed (N+1 queries)."""
+        assert len(self) <= number, (
+            f"{len(self)} statements executed, {number} expected at most:\n"
+            + "\n".join(self.statements)
+        )
@@ -0,0 +1,90 @@
+import gzip
+import json
+
+import pytest
+import pytest_check as check
+from fastapi import Request
+
+from ... import models
+from ...config.database import Base
+from ...config.env import settings
+from ...utils.compression import Compression
+from ..test_main import TestClient, TestingSessionLocal, client, engine, session
+from .fake_model import fake_block, fake_serie
+from .statements import StatementCounter
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    # created by each test : the tests resetting the database drop them
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+    )
+
+
+def make_request(accept_encoding: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"accept-encoding", accept_encoding.encode())],
+        }
+    )
+
+
+def test_accepts():
+    check.is_true(Compression.accepts(make_request("gzip, deflate, br")))
+    check.is_true(Compression.accepts(make_request("br;q=1.0, gzip;q=0.5")))
+    check.is_true(Compression.accepts(make_request("*")))
+    check.is_false(Compression.accepts(make_request("gzip;q=0")))
+    check.is_false(Compression.accepts(make_request("identity")))
+    check.is_false(Compression.accepts(None))
+
+
+def test_compress_is_deterministic():
+    content = b'{"name": "serie"}' * 100
+    check.equal(Compression.compress(content), Compression.compress(content))
+    check.equal(gzip.decompress(Compression.compress(content)), content)
+
+
+def test_list_snapshot(client: TestClient, session: TestingSessionLocal, monkeypatch):
+    monkeypatch.setattr(settings, "compression_minimum_size", 0)
+    Compression.snapshots.clear()
+    block = fake_block(session)
+    for _ in range(3):
+        fake_serie(session, block_id=block.id)
+    identity = client.get("/v1/series", headers={"Accept-Encoding": "identity"})
+    check.is_not_in("content-encoding", identity.headers)
+    compressed = client.get("/v1/series", headers={"Accept-Encoding": "gzip"})
+    check.equal(compressed.headers["content-encoding"], "gzip")
+    check.equal(compressed.json(), identity.json())
+    check.equal(compressed.headers["etag"], identity.headers["etag"])
+    check.equal(len(Compression.snapshots), 1)
+    # the same list is served from the snapshot, only the version of the table is read
+    with StatementCounter() as statements:
+        cached = client.get("/v1/series", headers={"Accept-Encoding": "gzip"})
+    check.equal(len(statements), 1)
+    check.equal(cached.json(), identity.json())
+    check.equal(cached.headers["etag"], identity.headers["etag"])
+    # a write changes the version of the table, the snapshot isn't served anymore
+    fake_serie(session, block_id=block.id)
+    updated = client.get("/v1/series", headers={"Accept-Encoding": "gzip"})
+    check.equal(len(updated.json()), 4)
+    check.not_equal(updated.headers["etag"], identity.headers["etag"])
+    check.equal(len(Compression.snapshots), 2)
+
+
+def test_middleware_minimum_size(client: TestClient, session: TestingSessionLocal):
+    block = fake_block(session)
+    serie = fake_serie(session, block_id=block.id)
+    small = client.get(f"/v1/series/{serie.id}", headers={"Accept-Encoding": "gzip"})
+    check.is_not_in("content-encoding", small.headers)
+    for _ in range(30):
+        fake_serie(session, block_id=block.id)
+    # the pages aren't kept, they are compressed by the middleware
+    page = client.get("/v1/series?limit=30", headers={"Accept-Encoding": "gzip"})
+    check.equal(page.headers["content-encoding"], "gzip")
+    check.equal(len(page.json()), 30)
+    stream = client.get("/v1/series?stream=true", headers={"Accept-Encoding": "gzip"})
+    check.equal(stream.headers["content-encoding"], "gzip")
+    check.equal(len(json.loads(stream.content)), 31)
@@ -0,0 +1,86 @@
+import pytest
+import pytest_check as check
+from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ... import models
+from ...config.database import Base, SessionLocal
+from ...utils.dependency import Dependency
+from ...utils.table_version import table_versions
+from ..test_main import engine
+
+Block = models.block.Block
+# a route using the session of the app (Dependency.get_db isn't overridden)
+app = FastAPI()
+
+
+@app.post("/blocks")
+def create_blocks(names: list[str], db: Session = Depends(Dependency.get_db)):
+    # an empty name gives a NULL tag (NOT NULL) : its save fails
+    blocks = [
+        Block.create(db, name=name, tag=name[:5] or None, logo="logo") for name in names
+    ]
+    return [block.id for block in blocks]
+
+
+@app.post("/blocks/failed")
+def create_blocks_failed(names: list[str], db: Session = Depends(Dependency.get_db)):
+    create_blocks(names, db)
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT)
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    # created by each test : the tests resetting the database drop them
+    Base.metadata.create_all(
+        bind=engine, tables=[models.block.Block.__table__, table_versions]
+    )
+
+
+@pytest.fixture
+def commits():
+    commits = []
+
+    def after_commit(session):
+        commits.append(session)
+
+    event.listen(SessionLocal, "after_commit", after_commit)
+    yield commits
+    event.remove(SessionLocal, "after_commit", after_commit)
+    with SessionLocal() as db:
+        Block.delete_all(db, name={"like": "Request %"})
+        db.commit()
+
+
+def _count(name: str) -> int:
+    with SessionLocal() as db:
+        return Block.count(db, name={"like": name})
+
+
+def test_request_commits_once(commits):
+    response = TestClient(app).post("/blocks", json=["Request 1", "Request 2"])
+    check.equal(response.status_code, status.HTTP_200_OK)
+    check.equal(len(response.json()), 2)
+    check.equal(len(commits), 1)
+    check.equal(_count("Request %"), 2)
+
+
+def test_request_failed_commits_nothing(commits):
+    response = TestClient(app).post("/blocks/failed", json=["Request failed"])
+    check.equal(response.status_code, status.HTTP_409_CONFLICT)
+    check.equal(commits, [])
+    check.equal(_count("Request failed"), 0)
+
+
+def test_request_failed_write_commits_nothing(commits):
+    # the save of the second block fails, so the first one isn't committed either
+    response = TestClient(app).post("/blocks", json=["Request valid", ""])
+    check.equal(response.status_code, status.HTTP_400_BAD_REQUEST)
+    check.equal(
+        response.json(),
+        {"detail": "The changes conflict with the constraints of the database"},
+    )
+    check.equal(commits, [])
+    check.equal(_count("Request %"), 0)
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+import pytest_check as check
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from ... import models, schemas
+from ...config.database import Base
+from ...config.env import settings
+from ...utils.fast_json import FastJSON
+from ..test_main import TestClient, TestingSessionLocal, client, engine, session
+from .fake_model import fake_block, fake_serie
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    # created by each test : the tests resetting the database drop them
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+    )
+
+
+def test_response_class():
+    check.equal(FastJSON.response_class("orjson"), ORJSONResponse)
+    check.equal(FastJSON.response_class("json"), JSONResponse)
+    check.equal(FastJSON.response_class("unknown"), JSONResponse)
+
+
+def test_dump_list_same_as_encoder(session: TestingSessionLocal):
+    block = fake_block(session)
+    series = [fake_serie(session, block_id=block.id) for _ in range(3)]
+    expected = jsonable_encoder(
+        [schemas.serie.SerieList.model_validate(serie) for serie in series]
+    )
+    content = FastJSON.dump_list(schemas.serie.SerieList, series)
+    check.is_instance(content, bytes)
+    check.equal(json.loads(content), expected)
+    check.equal(json.loads(FastJSON.dump(schemas.serie.Serie, series[0])), expected[0])
+
+
+def test_list_fast_path(client: TestClient, session: TestingSessionLocal, monkeypatch):
+    block = fake_block(session)
+    for _ in range(3):
+        fake_serie(session, block_id=block.id)
+    headers = {"If-None-Match": '"old"'}
+    fast = client.get("/v1/series?limit=2", headers=headers)
+    monkeypatch.setattr(settings, "json_fast_path", False)
+    default = client.get("/v1/series?limit=2", headers=headers)
+    check.equal(fast.json(), default.json())
+    check.equal(fast.headers["link"], default.headers["link"])
+    check.equal(fast.headers["etag"], default.headers["etag"])
@@ -0,0 +1,70 @@
+import pytest
+import pytest_check as check
+from sqlalchemy.orm import joinedload, selectinload
+
+from ... import models, schemas
+from ...config.database import Base
+from ...helpers.list_params import ListParams
+from ...helpers.router import RouterModelHelper
+from ...utils.loader_plan import LoaderPlan
+from ..test_main import TestingSessionLocal, engine, session
+from .fake_model import fake_block, fake_serie
+from .statements import StatementCounter
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    # created by each test : the tests resetting the database drop them
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+    )
+
+
+class SerieWithBlock(schemas.serie.Serie):
+    block: schemas.block.Block
+
+
+class BlockWithSeries(schemas.block.Block):
+    series: list[SerieWithBlock] = []
+
+
+def test_options_strategies():
+    (serie_loader,) = LoaderPlan.options(models.serie.Serie, SerieWithBlock)
+    check.equal(
+        serie_loader.path, joinedload(models.serie.Serie.block).path
+    )  # many-to-one in the same query
+    (block_loader,) = LoaderPlan.options(models.block.Block, BlockWithSeries)
+    check.equal(block_loader.path, selectinload(models.block.Block.series).path)
+    check.equal(LoaderPlan.options(models.serie.Serie, schemas.serie.Serie), ())
+    check.equal(LoaderPlan.options(models.serie.Serie, None), ())
+
+
+def test_list_nested_bounded_statements(session: TestingSessionLocal):
+    router = RouterModelHelper(
+        name="block", parents=[], uniq_list=[], list_schema=BlockWithSeries
+    )
+    counts = []
+    for _ in range(2):
+        block = fake_block(session)
+        for _ in range(3):
+            fake_serie(session, block_id=block.id)
+        session.expire_all()
+        with StatementCounter() as statements:
+            blocks = router.list(session, query={}, params=ListParams(limit=20))
+            response = [BlockWithSeries.model_validate(block) for block in blocks]
+        counts.append(len(statements))
+        check.equal(len(response[-1].series), 3)
+    # the blocks then their series : the count doesn't grow with the rows
+    check.equal(counts, [2, 2])
+
+
+def test_read_nested_bounded_statements(session: TestingSessionLocal):
+    router = RouterModelHelper(
+        name="serie", parents=["block"], uniq_list=[], read_schema=SerieWithBlock
+    )
+    serie_id = fake_serie(session, block_id=fake_block(session).id).id
+    session.expire_all()
+    with StatementCounter() as statements:
+        SerieWithBlock.model_validate(router.read(session, serie_id))
+    statements.assert_at_most(1)
@@ -0,0 +1,32 @@
+import pytest_check as check
+
+from ... import models
+from ...utils.model_registry import ModelRegistry
+from ...utils.tools import Tools
+
+
+def test_registry_keys():
+    for key in ["card", "card.Card", "cards", "card_id"]:
+        check.equal(ModelRegistry.get_class(key), models.card.Card)
+    check.equal(ModelRegistry.get_class("weaknesses"), models.weakness.Weakness)
+    check.is_none(ModelRegistry.get_class("unknown"))
+
+
+def test_registry_same_classes_as_tools():
+    for name in ["attack", "block", "card", "resistance", "serie", "user", "variant"]:
+        check.equal(
+            ModelRegistry.get_class(name),
+            Tools.get_class_from_string(
+                models, f"{name}.{name.title().replace('_', '')}"
+            ),
+        )
+
+
+def test_registry_metadata():
+    info = ModelRegistry.get("serie")
+    check.equal(info.tablename, "series")
+    check.equal(info.primary_key, "id")
+    check.is_in("block_id", info.columns)
+    check.is_in("block", info.relationships)
+    check.is_in("created_at", info.nullable)
+    check.is_not_in("name", info.nullable)
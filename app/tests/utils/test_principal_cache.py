@@ -0,0 +1,105 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_check as check
+from fastapi import HTTPException
+from jose import jwt
+from pydantic import ValidationError
+
+from ... import models, schemas
+from ...config.auth import Auth
+from ...config.constants import TIME_ZONE_APP
+from ...config.database import Base
+from ...config.env import settings
+from ...utils.principal_cache import PrincipalCache
+from ..test_main import TestingSessionLocal, engine, fake, session
+from .statements import StatementCounter
+
+
+@pytest.fixture(autouse=True)
+def users_table():
+    # created by each test : the tests resetting the database drop it
+    Base.metadata.create_all(bind=engine, tables=[models.user.User.__table__])
+
+
+def create_user(session: TestingSessionLocal, **columns) -> models.user.User:
+    columns = {
+        "first_name": "Sacha",
+        "last_name": "KETCHUM",
+        # an email per user : the users of the other tests may be in the database
+        "email": fake.unique.email(),
+        **columns,
+    }
+    now = datetime.now()
+    user = models.user.User.create(session, updated_at=now, created_at=now, **columns)
+    assert user.id is not None, user._errors
+    return user
+
+
+def create_token(email: str, minutes: int = 2) -> str:
+    return jwt.encode(
+        {
+            "matricule": "matricule",
+            "email": email,
+            "exp": datetime.now(tz=TIME_ZONE_APP) + timedelta(minutes=minutes),
+        },
+        settings.secret_key_jwt,
+        algorithm=settings.algorithm,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    PrincipalCache.invalidate()
+    yield
+    PrincipalCache.invalidate()
+
+
+def test_get_set(session: TestingSessionLocal):
+    principal = schemas.user.UserComplete.model_validate(create_user(session))
+    PrincipalCache.set("token", principal, time.time() + 60)
+    check.is_(PrincipalCache.get("token"), principal)
+    check.is_none(PrincipalCache.get("other"))
+    # the token isn't kept in clear
+    check.is_not_in("token", PrincipalCache.store._data)
+    # the principal is immutable
+    with pytest.raises(ValidationError):
+        principal.email = "other@gmail.com"
+
+
+def test_expired_token(session: TestingSessionLocal):
+    principal = schemas.user.UserComplete.model_validate(create_user(session))
+    PrincipalCache.set("token", principal, time.time() - 1)
+    check.is_none(PrincipalCache.get("token"))
+    check.equal(len(PrincipalCache.store), 0)
+
+
+def test_decode_token_from_cache(session: TestingSessionLocal):
+    user = create_user(session)
+    token = create_token(user.email)
+    principal = schemas.user.UserComplete.model_validate(user)
+    PrincipalCache.set(token, principal)
+    with StatementCounter() as statements:
+        check.equal(Auth._decode_token(token=token, db=session), (principal, session))
+        check.equal(Auth.get_current_user((principal, session)), (principal, session))
+    # the identity of a known token doesn't read the database
+    check.equal(len(statements), 0)
+
+
+def test_decode_token_not_cached_on_error(session: TestingSessionLocal):
+    with pytest.raises(HTTPException):
+        Auth._decode_token(token="not a jwt", db=session)
+    check.equal(len(PrincipalCache.store), 0)
+
+
+def test_invalidate_on_write(session: TestingSessionLocal):
+    user = create_user(session)
+    other = create_user(session, first_name="Ondine")
+    PrincipalCache.set("user", schemas.user.UserComplete.model_validate(user))
+    PrincipalCache.set("other", schemas.user.UserComplete.model_validate(other))
+    user.update(session, first_name="Red")
+    check.is_none(PrincipalCache.get("user"))
+    check.is_not_none(PrincipalCache.get("other"))
+    other.delete(session)
+    check.is_none(PrincipalCache.get("other"))
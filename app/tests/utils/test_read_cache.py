@@ -0,0 +1,44 @@
+import time
+
+import pytest_check as check
+
+from ...utils.lru import LRUCache
+from ...utils.read_cache import MemoryCacheBackend, RedisCacheBackend
+from .fake_redis import FakeRedis
+
+
+def test_lru_cache_ttl():
+    cache = LRUCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    check.equal(cache.get("a"), 1)
+    time.sleep(0.06)
+    check.is_false("a" in cache)
+    check.is_none(cache.get("a"))
+    check.equal(cache.stats()["misses"], 1)
+
+
+def test_memory_backend_delete_prefix():
+    backend = MemoryCacheBackend(maxsize=10)
+    backend.set("cards:1", b"1")
+    backend.set("cards:2", b"2")
+    backend.set("series:1", b"3")
+    backend.delete("cards:1")
+    check.is_none(backend.get("cards:1"))
+    backend.delete_prefix("cards:")
+    check.is_none(backend.get("cards:2"))
+    check.equal(backend.get("series:1"), b"3")
+
+
+def test_redis_backend():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client, ttl=60)
+    backend.set("cards:1", b"1")
+    backend.set("series:1", b"2")
+    check.equal(backend.get("cards:1"), b"1")
+    check.is_none(backend.get("cards:2"))
+    check.equal(backend.stats()["hit_rate"], 0.5)
+    backend.delete_prefix("cards:")
+    check.is_none(backend.get("cards:1"))
+    check.equal(list(client.data), ["read:series:1"])
+    backend.clear()
+    check.equal(client.data, {})
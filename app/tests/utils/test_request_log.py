@@ -0,0 +1,99 @@
+import logging
+
+import pytest
+import pytest_check as check
+from fastapi import FastAPI, Request, UploadFile
+from fastapi.testclient import TestClient
+
+from ...config.constants import REQUEST_LOGGER
+from ...config.env import settings
+from ...utils.request_log import RequestLog, RequestLogMiddleware
+
+app = FastAPI()
+app.add_middleware(RequestLogMiddleware)
+
+
+@app.post("/echo")
+async def echo(request: Request):
+    return {"size": len(await request.body())}
+
+
+@app.post("/upload")
+async def upload(file: UploadFile):
+    return {"size": len(await file.read())}
+
+
+@app.post("/ignore")
+async def ignore():
+    return {}
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def messages():
+    logger = logging.getLogger(REQUEST_LOGGER)
+    handler = ListHandler()
+    old_level, old_propagate = logger.level, logger.propagate
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield handler.messages
+    logger.removeHandler(handler)
+    logger.setLevel(old_level)
+    logger.propagate = old_propagate
+
+
+def test_redact():
+    check.equal(
+        RequestLog.redact('{"name": "ash", "Password": "pika\\"chu", "age": 10}'),
+        '{"name": "ash", "Password": "***", "age": 10}',
+    )
+    check.equal(RequestLog.redact('{"token": 1234}'), '{"token": "***"}')
+    # a truncated body is redacted too
+    check.equal(RequestLog.redact('{"password": "pika'), '{"password": "***"')
+    check.equal(
+        RequestLog.redact("username=ash&password=pikachu&x=1"),
+        "username=ash&password=***&x=1",
+    )
+
+
+def test_log_request(messages: list):
+    response = TestClient(app).post("/echo", json={"name": "ash", "password": "pika"})
+    check.equal(response.json(), {"size": 35})
+    check.equal(len(messages), 1)
+    check.is_true(messages[0].startswith("POST /echo 200 "))
+    check.is_in('"password": "***"', messages[0])
+    check.is_not_in("pika", messages[0])
+
+
+def test_log_truncated_body(messages: list, monkeypatch):
+    monkeypatch.setattr(settings, "request_log_body_size", 16)
+    body = b"x" * (1024 * 1024)
+    response = TestClient(app).post("/echo", content=body)
+    # the route reads the whole body
+    check.equal(response.json(), {"size": len(body)})
+    check.is_true(messages[0].endswith(f" {'x' * 16}... ({len(body)} bytes)"))
+
+
+def test_log_without_body(messages: list):
+    client = TestClient(app)
+    client.post("/upload", files={"file": ("card.png", b"secret bytes")})
+    client.post("/ignore", content=b"not read")
+    check.equal(len(messages), 2)
+    check.is_not_in("secret", messages[0])
+    # the body not read by the route isn't read for the log
+    check.is_not_in("not read", messages[1])
+
+
+def test_sampling(messages: list, monkeypatch):
+    monkeypatch.setattr(settings, "request_log_sample_rate", 0.0)
+    TestClient(app).post("/echo", content=b"body")
+    check.equal(messages, [])
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+import pytest_check as check
+from fastapi import Request, Response
+from sqlalchemy import delete, update
+
+from ... import models
+from ...config.database import Base
+from ...helpers.list_params import ListParams
+from ...utils.table_version import TableVersion
+from ..test_main import TestingSessionLocal, engine, session
+from .fake_model import fake_block, fake_serie
+
+Serie = models.serie.Serie
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    # created by each test : the tests resetting the database drop them
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[models.block.Block.__table__, models.serie.Serie.__table__],
+    )
+
+
+def test_etag_same_in_all_processes(session: TestingSessionLocal):
+    fake_serie(session, block_id=fake_block(session).id)
+    etag = TableVersion.etag(session, Serie, "/v1/series")
+    # the counters of this process (the other processes have their own) aren't in the ETag
+    TableVersion.bump(Serie.__tablename__)
+    check.equal(TableVersion.etag(session, Serie, "/v1/series"), etag)
+    check.not_equal(TableVersion.etag(session, Serie, "/v1/series?limit=1"), etag)
+
+
+def test_etag_changes_after_update_of_another_process(session: TestingSessionLocal):
+    block = fake_block(session)
+    series = [fake_serie(session, block_id=block.id) for _ in range(3)]
+    etag = TableVersion.etag(session, Serie, "/v1/series")
+    counters = dict(TableVersion.counters)
+
+    # an update outside of the models, with the counters of this process unchanged (as another process)
+    session.execute(update(Serie).where(Serie.id == series[0].id).values(name="new"))
+    session.commit()
+    TableVersion.counters.clear()
+    TableVersion.counters.update(counters)
+    check.not_equal(TableVersion.etag(session, Serie, "/v1/series"), etag)
+
+
+def test_etag_changes_after_delete_and_insert(session: TestingSessionLocal):
+    block = fake_block(session)
+    series = [fake_serie(session, block_id=block.id) for _ in range(3)]
+    etag = TableVersion.etag(session, Serie, "/v1/series")
+    # the same count and max id : only the version of the table tells the change
+    id = series[-1].id
+    session.execute(delete(Serie).where(Serie.id == id))
+    session.commit()
+    check.equal(fake_serie(session, block_id=block.id).id, id)
+    check.not_equal(TableVersion.etag(session, Serie, "/v1/series"), etag)
+
+
+def _list_params(method: str, body: bytes) -> ListParams:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    request = Request(
+        {
+            "type": "http",
+            "method": method,
+            "path": "/v1/cards/filter",
+            "query_string": b"limit=2",
+            "headers": [],
+            "server": ("test", 80),
+            "scheme": "http",
+        },
+        receive,
+    )
+    return asyncio.run(
+        ListParams.depends(
+            request, Response(), limit=2, after=None, stream=False, fields=None
+        )
+    )
+
+
+def test_etag_parts_with_body():
+    parts = _list_params("POST", b'{"category": ["Pokemon"]}').etag_parts()
+    check.equal(parts, _list_params("POST", b'{"category": ["Pokemon"]}').etag_parts())
+    check.not_equal(
+        parts, _list_params("POST", b'{"category": ["Trainer"]}').etag_parts()
+    )
+    check.is_none(_list_params("GET", b"").etag_parts()[2])
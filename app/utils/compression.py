@@ -0,0 +1,93 @@
+import gzip
+from typing import ClassVar
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from ..config.env import settings
+from .lru import LRUCache
+
+
+class Compression(BaseModel):
+    # the compressed bodies of the full lists by ETag (the ETag changes with the version of the table)
+    snapshots: ClassVar[LRUCache] = LRUCache(maxsize=settings.compression_snapshot_size)
+
+    @staticmethod
+    def accepts(request: Request | None) -> bool:
+        """This function check if the client of a request accepts a gzip body (Accept-Encoding with its q-values).
+
+        :param request: the request
+        :type request: Request | None
+        :returns: bool
+
+        """
+        if request is None:
+            return False
+        accepted = {}
+        for coding in request.headers.get("accept-encoding", "").split(","):
+            name, _, parameters = coding.partition(";")
+            quality = 1.0
+            parameter, _, value = parameters.partition("=")
+            if parameter.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            accepted[name.strip().lower()] = quality
+        return accepted.get("gzip", accepted.get("*", 0.0)) > 0
+
+    @staticmethod
+    def compress(content: bytes) -> bytes:
+        """This function compress a body with gzip (without timestamp, the same content gives the same bytes).
+
+        :param content: the body
+        :type content: bytes
+        :returns: bytes
+
+        """
+        return gzip.compress(content, compresslevel=settings.compression_level, mtime=0)
+
+    @staticmethod
+    def response(content: bytes, media_type: str = "application/json") -> Response:
+        """This function create a response of a gzip body (left untouched by the compression middleware).
+
+        :param content: the compressed body
+        :param media_type: the media type of the uncompressed body
+        :type content: bytes
+        :type media_type: str
+        :returns: Response
+
+        """
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+
+    @classmethod
+    def get(cls, etag: str) -> bytes | None:
+        """This function get the compressed body of a list.
+
+        :param etag: the ETag of the list
+        :type etag: str
+        :returns: bytes | None
+
+        """
+        return cls.snapshots.get(etag)
+
+    @classmethod
+    def snapshot(cls, etag: str, content: bytes) -> bytes | None:
+        """This function compress the body of a list and keep it (None if the body is under the minimum size).
+
+        :param etag: the ETag of the list
+        :param content: the body of the list
+        :type etag: str
+        :type content: bytes
+        :returns: bytes | None
+
+        """
+        if len(content) < settings.compression_minimum_size:
+            return None
+        compressed = cls.compress(content)
+        cls.snapshots.set(etag, compressed)
+        return compressed
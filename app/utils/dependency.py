@@ -1,13 +1,126 @@
+import math
+import time
+
+from fastapi import HTTPException, Request, Response, status
 from pydantic import BaseModel
 
-from ..config.database import SessionLocal
+from ..config.constants import READ_YOUR_WRITES_COOKIE
+from ..config.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_replica_router,
+    replica_router,
+)
+from ..config.env import settings
+from ..config.replica_router import ReplicaRouter
+from ..config.translation import Translation
+from .unit_of_work import UnitOfWork
 
 
 class Dependency(BaseModel):
     @staticmethod
-    def get_db():
-        db = SessionLocal()
+    def _get_bind(
+        router: ReplicaRouter, request: Request, response: Response, write: bool
+    ):
+        """This function get the engine of the session of a route (replica for a read route, primary for a write route).
+
+        The route is a read or a write by its dependency (get_replica_db / get_db), not by its HTTP method :
+        a POST filter is a read. A write sets a cookie so the next reads of the client go to the primary
+        during the read-your-writes window.
+
+        :param router: the router of the primary and the replicas
+        :param request: the request
+        :param response: the response
+        :param write: True for the session of a write route
+        :type router: ReplicaRouter
+        :type request: Request
+        :type response: Response
+        :type write: bool
+        :returns: the engine
+
+        """
+        window = settings.database_read_your_writes_seconds
+        if write:
+            if router.replicas and window > 0:
+                response.set_cookie(
+                    READ_YOUR_WRITES_COOKIE,
+                    str(time.time() + window),
+                    max_age=math.ceil(window),
+                    httponly=True,
+                )
+            return router.primary
         try:
-            yield db
+            primary_until = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+        return router.get_bind(read_your_writes=primary_until > time.time())
+
+    @staticmethod
+    def _get_session(request: Request, response: Response, write: bool):
+        """This function give the session of a request, its writes are committed once at the end of the request.
+
+        The request is a unit of work (UnitOfWork) : each save is only flushed, and if a write or the route fails,
+        nothing is committed.
+
+        :param request: the request
+        :param response: the response
+        :param write: True for the session of a write route (primary)
+        :type request: Request
+        :type response: Response
+        :type write: bool
+        :returns: the session
+        :raises HTTPException: raises HTTP exception if the writes can't be committed
+
+        """
+        db = SessionLocal(
+            bind=Dependency._get_bind(replica_router, request, response, write)
+        )
+        try:
+            with UnitOfWork.begin(db) as unit:
+                yield db
+            if unit.errors:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=Translation.t("errors.unit_of_work_failed"),
+                )
         finally:
             db.close()
+
+    @staticmethod
+    def get_db(request: Request, response: Response):
+        """This function give the session of a write route (primary).
+
+        :param request: the request
+        :param response: the response
+        :type request: Request
+        :type response: Response
+        :returns: the session
+
+        """
+        yield from Dependency._get_session(request, response, write=True)
+
+    @staticmethod
+    def get_replica_db(request: Request, response: Response):
+        """This function give the session of a read route (a replica, or the primary during the read-your-writes window).
+
+        :param request: the request
+        :param response: the response
+        :type request: Request
+        :type response: Response
+        :returns: the session
+
+        """
+        yield from Dependency._get_session(request, response, write=False)
+
+    @staticmethod
+    async def get_async_db(request: Request, response: Response):
+        db = AsyncSessionLocal(
+            bind=Dependency._get_bind(async_replica_router, request, response, False)
+        )
+        try:
+            yield db
+        finally:
+            await db.close()
+
+    # the session of the read routes : async if the database is async (settings.database_async)
+    get_read_db = get_async_db if settings.database_async else get_replica_db
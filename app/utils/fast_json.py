@@ -0,0 +1,76 @@
+import importlib.util
+from functools import lru_cache
+from typing import ClassVar
+
+from fastapi.logger import logger
+from fastapi.responses import JSONResponse, ORJSONResponse, UJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from ..config.env import settings
+
+
+class FastJSON(BaseModel):
+    # the response classes by JSON library (the library has to be installed)
+    __response_classes__: ClassVar[dict[str, type[JSONResponse]]] = {
+        "json": JSONResponse,
+        "orjson": ORJSONResponse,
+        "ujson": UJSONResponse,
+    }
+
+    @classmethod
+    def response_class(cls, library: str | None = None) -> type[JSONResponse]:
+        """This function get the default response class of the app for a JSON library (json if it isn't installed).
+
+        :param library: the JSON library (json, orjson or ujson), settings.json_response if None
+        :type library: str | None
+        :returns: type[JSONResponse]
+
+        """
+        library = library or settings.json_response
+        if library not in cls.__response_classes__:
+            logger.warning(f"Fast JSON : unknown library {library}, json used")
+            return JSONResponse
+        if library != "json" and importlib.util.find_spec(library) is None:
+            logger.warning(f"Fast JSON : {library} isn't installed, json used")
+            return JSONResponse
+        return cls.__response_classes__[library]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def adapter(schema: type[BaseModel]) -> TypeAdapter:
+        """This function get the adapter of a list of a schema (built once per schema).
+
+        :param schema: the schema of the items
+        :type schema: type[BaseModel]
+        :returns: TypeAdapter
+
+        """
+        return TypeAdapter(list[schema])
+
+    @classmethod
+    def dump_list(cls, schema: type[BaseModel], db_models: list) -> bytes:
+        """This function validate the models with a schema and serialize them in a JSON array in one pass.
+
+        :param schema: the schema of the items
+        :param db_models: the models
+        :type schema: type[BaseModel]
+        :type db_models: list
+        :returns: bytes
+
+        """
+        adapter = cls.adapter(schema)
+        return adapter.dump_json(
+            adapter.validate_python(db_models, from_attributes=True)
+        )
+
+    @staticmethod
+    def dump(schema: type[BaseModel], db_model) -> bytes:
+        """This function validate a model with a schema and serialize it in JSON.
+
+        :param schema: the schema
+        :param db_model: the model
+        :type schema: type[BaseModel]
+        :returns: bytes
+
+        """
+        return schema.__pydantic_serializer__.to_json(schema.model_validate(db_model))
@@ -0,0 +1,74 @@
+import types
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel
+from sqlalchemy.orm import joinedload, selectinload
+
+from ..config.constants import LOADER_PLAN_CACHE_SIZE
+
+
+class LoaderPlan(BaseModel):
+    @staticmethod
+    def _get_schema(annotation) -> type[BaseModel] | None:
+        """This function get the pydantic model of a field annotation (X, list[X], X | None, ...).
+
+        :param annotation: the annotation of the field
+        :returns: type[BaseModel] | None
+
+        """
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation
+        if typing.get_origin(annotation) in (typing.Union, types.UnionType, list, set):
+            for argument in typing.get_args(annotation):
+                schema = LoaderPlan._get_schema(argument)
+                if schema is not None:
+                    return schema
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=LOADER_PLAN_CACHE_SIZE)
+    def options(model_class: type, schema: type[BaseModel] | None) -> tuple:
+        """This function get the loader options which load the relationships serialized by a response schema.
+
+        A collection is loaded with selectinload (one query per level), a many-to-one relationship with joinedload
+        (same query), so a response is built in a bounded number of queries whatever the number of rows.
+
+        :param model_class: the class of the model
+        :param schema: the response schema of the model
+        :type model_class: type
+        :type schema: type[BaseModel] | None
+        :returns: tuple of loader options
+
+        """
+        return tuple(LoaderPlan._plan(model_class, schema, frozenset()))
+
+    @staticmethod
+    def _plan(model_class: type, schema: type[BaseModel] | None, visited: frozenset):
+        """This function build the loader options of a model for a schema, recursively on the nested schemas.
+
+        :param model_class: the class of the model
+        :param schema: the schema of the model
+        :param visited: the (model, schema) already planned on the path (recursive schemas)
+        :type model_class: type
+        :type visited: frozenset
+        :returns: list of loader options
+
+        """
+        if schema is None or (model_class, schema) in visited:
+            return []
+        visited = visited | {(model_class, schema)}
+        relationships = model_class.__model_info__.relationships
+        loaders = []
+        for name, field in schema.model_fields.items():
+            relationship = relationships.get(name)
+            sub_schema = LoaderPlan._get_schema(field.annotation)
+            if relationship is None or sub_schema is None:
+                continue
+            attribute = getattr(model_class, name)
+            loader = selectinload if relationship.uselist else joinedload
+            sub_loaders = LoaderPlan._plan(
+                relationship.mapper.class_, sub_schema, visited
+            )
+            loaders.append(loader(attribute).options(*sub_loaders))
+        return loaders
@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """A thread-safe bounded mapping evicting the least recently used entries (and the expired ones if a ttl is given)."""
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and (entry[0] is None or entry[0] > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """This function get the value of a key and mark it as recently used.
+
+        :param key: the key to search
+        :param default: the value returned if the key isn't in the cache
+        :type key: Hashable
+        :returns: the value or default
+
+        """
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            expires, value = self._data[key]
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """This function store a value and evict the oldest entries above maxsize.
+
+        :param key: the key of the value
+        :param value: the value to store
+        :type key: Hashable
+        :returns: None
+
+        """
+        if self.maxsize <= 0:
+            return
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """This function remove a key from the cache and return its value.
+
+        :param key: the key to remove
+        :param default: the value returned if the key isn't in the cache
+        :type key: Hashable
+        :returns: the value or default
+
+        """
+        with self._lock:
+            if key not in self._data:
+                return default
+            return self._data.pop(key)[1]
+
+    def clear(self) -> None:
+        """This function remove all the entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """This function get the size and the hit/miss counters of the cache.
+
+        :returns: dict
+
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
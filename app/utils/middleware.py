@@ -1,22 +1,29 @@
-from fastapi import Request
-from fastapi.logger import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from ..config.translation import active_translation
+from ..config.translation import Translation
+from .request_log import RequestLogMiddleware
+
+
+class LocaleMiddleware:
+    """Set the language of the request from its Accept-Language header, in the context of the request only."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = Translation.activate(Headers(scope=scope).get("accept-language"))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            Translation.reset(token)
 
 
 def add_middlewares(app):
-    @app.middleware("http")
-    async def get_accept_language(request: Request, call_next):
-        active_translation(request.headers.get("accept-language", None))
-        response = await call_next(request)
-        return response
-
-    @app.middleware("http")
-    async def app_entry(request: Request, call_next):
-        body = await request.body()
-        if body:
-            body_decoded = body.decode(errors="ignore")
-            logger.info(body_decoded)
-
-        response = await call_next(request)
-        return response
+    app.add_middleware(LocaleMiddleware)
+
+    # log the requests without reading their body (see RequestLogMiddleware)
+    app.add_middleware(RequestLogMiddleware)
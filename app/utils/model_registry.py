@@ -0,0 +1,140 @@
+import re
+from typing import ClassVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, configure_mappers
+
+_CAMEL_CASE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+class ModelInfo:
+    """The metadata of a model computed once when its mapper is configured.
+
+    Class, table, columns, relationships, nullable columns, primary key, scalar defaults and python types.
+    """
+
+    __slots__ = (
+        "name",
+        "model_class",
+        "tablename",
+        "columns",
+        "relationships",
+        "attributes",
+        "nullable",
+        "primary_key",
+        "defaults",
+        "types",
+    )
+
+    def __init__(self, name: str, mapper):
+        self.name = name
+        self.model_class = mapper.class_
+        self.tablename = mapper.local_table.name
+        self.columns = dict(mapper.columns.items())
+        self.relationships = dict(mapper.relationships.items())
+        self.attributes = frozenset(self.columns) | frozenset(self.relationships)
+        self.nullable = frozenset(
+            key for key, column in self.columns.items() if column.nullable
+        )
+        self.primary_key = mapper.primary_key[0].key
+        self.defaults = {
+            key: column.default.arg
+            for key, column in self.columns.items()
+            if column.default is not None and column.default.is_scalar
+        }
+        self.types = {
+            key: self._python_type(column) for key, column in self.columns.items()
+        }
+
+    @staticmethod
+    def _python_type(column) -> type | None:
+        """This function get the python type of a column (None if the type doesn't define it).
+
+        :param column: the column
+        :returns: type | None
+
+        """
+        try:
+            return column.type.python_type
+        except NotImplementedError:
+            return None
+
+
+class ModelRegistry(BaseModel):
+    # the models by name ("card"), path ("card.Card"), table name ("cards") and key ("card_id")
+    __models__: ClassVar[dict[str, ModelInfo]] = {}
+
+    @staticmethod
+    def _get_name(model_class: type) -> str:
+        """This function get the name of a model from its module (app.models.card -> card) or its class.
+
+        :param model_class: the class of the model
+        :type model_class: type
+        :returns: str
+
+        """
+        module = model_class.__module__.rsplit(".", 1)[-1]
+        if model_class.__name__.lower() == module.replace("_", ""):
+            return module
+        return _CAMEL_CASE.sub("_", model_class.__name__).lower()
+
+    @classmethod
+    def register(cls, mapper) -> ModelInfo:
+        """This function compute the metadata of a model, store it in the class (__model_info__) and in the registry.
+
+        :param mapper: the mapper of the model
+        :returns: ModelInfo
+
+        """
+        info = ModelInfo(cls._get_name(mapper.class_), mapper)
+        mapper.class_.__model_info__ = info
+        for key in [
+            info.name,
+            f"{info.name}.{info.model_class.__name__}",
+            info.tablename,
+            f"{info.name}_id",
+        ]:
+            cls.__models__.setdefault(key, info)
+        return info
+
+    @classmethod
+    def build(cls, base) -> None:
+        """This function configure the mappers of the declarative base, which fill the registry.
+
+        :param base: the declarative base of the models
+        :returns: None
+
+        """
+        configure_mappers()
+        for mapper in base.registry.mappers:
+            if "__model_info__" not in mapper.class_.__dict__:
+                cls.register(mapper)
+
+    @classmethod
+    def get(cls, name: str) -> ModelInfo | None:
+        """This function get the metadata of a model.
+
+        :param name: the name, the path, the table name or the key of the model
+        :type name: str
+        :returns: ModelInfo | None
+
+        """
+        return cls.__models__.get(name)
+
+    @classmethod
+    def get_class(cls, name: str) -> type | None:
+        """This function get the class of a model.
+
+        :param name: the name, the path, the table name or the key of the model
+        :type name: str
+        :returns: type | None
+
+        """
+        info = cls.__models__.get(name)
+        return info.model_class if info is not None else None
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _register_model(mapper, model_class) -> None:
+    ModelRegistry.register(mapper)
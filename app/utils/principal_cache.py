@@ -0,0 +1,94 @@
+import hashlib
+import time
+from typing import Any, ClassVar
+
+from pydantic import BaseModel
+
+from ..config.env import settings
+from .lru import LRUCache
+
+
+class PrincipalStore(LRUCache):
+    """The in-process store of the authenticated users by token, one per worker."""
+
+    def delete_user(self, user_id: int | None) -> None:
+        """This function remove the tokens of a user (all the tokens if user_id is None).
+
+        :param user_id: the id of the user
+        :type user_id: int | None
+        :returns: None
+
+        """
+        with self._lock:
+            if user_id is None:
+                self._data.clear()
+                return
+            for key in [
+                key
+                for key, (_, (_, principal)) in self._data.items()
+                if principal.id == user_id
+            ]:
+                del self._data[key]
+
+
+class PrincipalCache(BaseModel):
+    # the verified tokens (by hash) with their expiration and their user
+    store: ClassVar[PrincipalStore] = PrincipalStore(
+        maxsize=settings.auth_principal_cache_size,
+        ttl=settings.auth_principal_cache_ttl,
+    )
+
+    @staticmethod
+    def key(token: str) -> str:
+        """This function get the key of a token in the cache (the token itself isn't kept).
+
+        :param token: the token
+        :type token: str
+        :returns: str
+
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def get(cls, token: str) -> Any | None:
+        """This function get the user of a token already verified (None if unknown or expired).
+
+        :param token: the token
+        :type token: str
+        :returns: the principal or None
+
+        """
+        key = cls.key(token)
+        entry = cls.store.get(key)
+        if entry is None:
+            return None
+        expires, principal = entry
+        if expires is not None and expires <= time.time():
+            cls.store.pop(key)
+            return None
+        return principal
+
+    @classmethod
+    def set(cls, token: str, principal: Any, expires: float | None = None) -> None:
+        """This function keep the user of a verified token until the expiration of the token (and the ttl).
+
+        :param token: the token
+        :param principal: the immutable user of the token
+        :param expires: the timestamp of the expiration of the token (exp claim)
+        :type token: str
+        :type expires: float | None
+        :returns: None
+
+        """
+        cls.store.set(cls.key(token), (expires, principal))
+
+    @classmethod
+    def invalidate(cls, user_id: int | None = None) -> None:
+        """This function forget the tokens of a user (of all the users if user_id is None) after a write.
+
+        :param user_id: the id of the user
+        :type user_id: int | None
+        :returns: None
+
+        """
+        cls.store.delete_user(user_id)
@@ -0,0 +1,95 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import bindparam
+
+from ..errors.query_plan_error import UncacheableQueryError
+from .lru import LRUCache
+
+# values kept as literals in the plan because they change the structure of the query
+_LITERAL_KEYS = {"escape", "autoescape"}
+_LITERAL_VALUES = {"sa_not_"}
+_EXPANDING_OPERATORS = {"in_", "not_in"}
+# operators of the ARRAY columns taking the whole list as one parameter
+_ARRAY_OPERATORS = {"overlap", "contained_by"}
+_BINDABLE_TYPES = (str, bool, int, float, Decimal, date, datetime, time, UUID)
+
+
+class QueryPlanCache(LRUCache):
+    """Cache of the statements built by BaseModel._query keyed on the shape of the filters."""
+
+    @classmethod
+    def parametrize(cls, columns: dict) -> tuple[tuple, dict, dict]:
+        """This function split a filter dict in its shape, a template with bind parameters and the values to bind.
+
+        :param columns: the filter dict given to BaseModel._query
+        :type columns: dict
+        :returns: tuple[tuple, dict, dict]
+        :raises UncacheableQueryError: raises if a value can't be bound (model instance, ...)
+
+        """
+        values = {}
+        shape, template = cls._parametrize_value(columns, values)
+        return (shape, template, values)
+
+    @classmethod
+    def _parametrize_value(cls, value, values: dict, key: str | None = None) -> tuple:
+        """This function replace recursively the leaves of a filter by bind parameters.
+
+        :param value: the value to parametrize
+        :param values: the dict where the bound values are stored
+        :param key: the key of the value in its parent dict
+        :type values: dict
+        :type key: str | None
+        :returns: tuple with the shape and the template of the value
+
+        """
+        if isinstance(value, dict):
+            shapes, template = [], {}
+            for sub_key, sub_value in value.items():
+                sub_shape, template[sub_key] = cls._parametrize_value(
+                    sub_value, values, sub_key
+                )
+                shapes.append((sub_key, sub_shape))
+            return (("dict", tuple(shapes)), template)
+        if key in _EXPANDING_OPERATORS and isinstance(value, list | tuple | set):
+            return (
+                "in",
+                cls._bind(values, list(value), expanding=True),
+            )
+        if key in _ARRAY_OPERATORS and isinstance(value, list | tuple):
+            return ("array", cls._bind(values, list(value)))
+        if isinstance(value, list | tuple):
+            shapes, template = [], []
+            for sub_value in value:
+                sub_shape, sub_template = cls._parametrize_value(sub_value, values)
+                shapes.append(sub_shape)
+                template.append(sub_template)
+            return (("list", tuple(shapes)), template)
+        if (
+            value is None
+            or key in _LITERAL_KEYS
+            or isinstance(value, str)
+            and value in _LITERAL_VALUES
+        ):
+            return (("literal", value), value)
+        if isinstance(value, _BINDABLE_TYPES):
+            return ("?", cls._bind(values, value))
+        raise UncacheableQueryError(type(value).__name__)
+
+    @staticmethod
+    def _bind(values: dict, value, expanding: bool = False):
+        """This function create a bind parameter and store its value.
+
+        :param values: the dict where the bound values are stored
+        :param value: the value to bind
+        :param expanding: True for a list of values (IN operator)
+        :type values: dict
+        :type expanding: bool
+        :returns: BindParameter
+
+        """
+        name = f"qp_{len(values)}"
+        values[name] = value
+        return bindparam(name, expanding=expanding)
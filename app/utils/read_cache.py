@@ -0,0 +1,226 @@
+from threading import Lock
+from typing import ClassVar
+
+from fastapi.logger import logger
+from pydantic import BaseModel
+
+from ..config.env import settings
+from .lru import LRUCache
+
+
+class MemoryCacheBackend(LRUCache):
+    """The in-process store of the read cache (LRU with a ttl), one per worker."""
+
+    def delete(self, key: str) -> None:
+        """This function remove a key from the store.
+
+        :param key: the key to remove
+        :type key: str
+        :returns: None
+
+        """
+        self.pop(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """This function remove all the keys starting with a prefix.
+
+        :param prefix: the prefix of the keys
+        :type prefix: str
+        :returns: None
+
+        """
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                del self._data[key]
+
+
+class RedisCacheBackend:
+    """A store of the read cache shared by the workers, on a Redis-compatible client (get, set, delete, scan_iter)."""
+
+    def __init__(self, client, ttl: float | None = None, namespace: str = "read:"):
+        self.client = client
+        self.ttl = ttl
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def get(self, key: str, default=None):
+        """This function get the value of a key.
+
+        :param key: the key to search
+        :param default: the value returned if the key isn't in the store
+        :type key: str
+        :returns: the value or default
+
+        """
+        value = self.client.get(f"{self.namespace}{key}")
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """This function store a value (expiring after the ttl).
+
+        :param key: the key of the value
+        :param value: the value to store
+        :type key: str
+        :type value: bytes
+        :returns: None
+
+        """
+        ttl = None if self.ttl is None else max(1, int(self.ttl))
+        self.client.set(f"{self.namespace}{key}", value, ex=ttl)
+
+    def delete(self, key: str) -> None:
+        """This function remove a key from the store.
+
+        :param key: the key to remove
+        :type key: str
+        :returns: None
+
+        """
+        self.client.delete(f"{self.namespace}{key}")
+
+    def delete_prefix(self, prefix: str) -> None:
+        """This function remove all the keys starting with a prefix.
+
+        :param prefix: the prefix of the keys
+        :type prefix: str
+        :returns: None
+
+        """
+        keys = list(self.client.scan_iter(match=f"{self.namespace}{prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def clear(self) -> None:
+        """This function remove all the keys of the cache and reset the counters."""
+        self.delete_prefix("")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """This function get the hit/miss counters of this worker.
+
+        :returns: dict
+
+        """
+        total = self.hits + self.misses
+        return {
+            "backend": "redis",
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class ReadCache(BaseModel):
+    backend: ClassVar[MemoryCacheBackend | RedisCacheBackend | None] = None
+
+    @staticmethod
+    def create_backend() -> MemoryCacheBackend | RedisCacheBackend:
+        """This function create the backend from the settings (Redis if an url is given, in-process otherwise).
+
+        :returns: MemoryCacheBackend | RedisCacheBackend
+
+        """
+        if settings.read_cache_redis_url:
+            try:
+                import redis
+
+                return RedisCacheBackend(
+                    redis.Redis.from_url(settings.read_cache_redis_url),
+                    ttl=settings.read_cache_ttl,
+                )
+            except ImportError:
+                logger.warning(
+                    "Read cache : redis isn't installed, in-process cache used"
+                )
+        return MemoryCacheBackend(
+            maxsize=settings.read_cache_size, ttl=settings.read_cache_ttl
+        )
+
+    @classmethod
+    def get_backend(cls) -> MemoryCacheBackend | RedisCacheBackend:
+        """This function get the backend of the cache (created on the first use).
+
+        :returns: MemoryCacheBackend | RedisCacheBackend
+
+        """
+        if cls.backend is None:
+            cls.backend = cls.create_backend()
+        return cls.backend
+
+    @staticmethod
+    def key(tablename: str, id: int) -> str:
+        """This function get the key of a model in the cache.
+
+        :param tablename: the name of the table of the model
+        :param id: the id of the model
+        :type tablename: str
+        :type id: int
+        :returns: str
+
+        """
+        return f"{tablename}:{id}"
+
+    @classmethod
+    def get(cls, tablename: str, id: int) -> bytes | None:
+        """This function get the serialized response of a model.
+
+        :param tablename: the name of the table of the model
+        :param id: the id of the model
+        :type tablename: str
+        :type id: int
+        :returns: bytes | None
+
+        """
+        return cls.get_backend().get(cls.key(tablename, id))
+
+    @classmethod
+    def set(cls, tablename: str, id: int, content: bytes) -> None:
+        """This function store the serialized response of a model.
+
+        :param tablename: the name of the table of the model
+        :param id: the id of the model
+        :param content: the serialized response
+        :type tablename: str
+        :type id: int
+        :type content: bytes
+        :returns: None
+
+        """
+        cls.get_backend().set(cls.key(tablename, id), content)
+
+    @classmethod
+    def invalidate(cls, tablename: str, id: int | None = None) -> None:
+        """This function remove a model (or all the models of a table if id is None) from the cache.
+
+        :param tablename: the name of the table of the model
+        :param id: the id of the model
+        :type tablename: str
+        :type id: int | None
+        :returns: None
+
+        """
+        if cls.backend is None:
+            return
+        if id is None:
+            cls.backend.delete_prefix(f"{tablename}:")
+        else:
+            cls.backend.delete(cls.key(tablename, id))
+
+    @classmethod
+    def stats(cls) -> dict:
+        """This function get the size and the hit rate of the cache.
+
+        :returns: dict
+
+        """
+        return cls.get_backend().stats()
@@ -0,0 +1,151 @@
+import logging
+import random
+import re
+import time
+from functools import lru_cache
+
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config.constants import REQUEST_LOGGER
+from ..config.env import settings
+
+logger = logging.getLogger(REQUEST_LOGGER)
+
+
+class RequestLog(BaseModel):
+    @staticmethod
+    def sampled() -> bool:
+        """This function draw if a request is logged (settings.request_log_sample_rate of the requests).
+
+        :returns: bool
+
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return False
+        rate = settings.request_log_sample_rate
+        return rate >= 1 or random.random() < rate
+
+    @staticmethod
+    def capture_body(headers: Headers) -> bool:
+        """This function check if the body of a request is logged (never the multipart uploads).
+
+        :param headers: the headers of the request
+        :type headers: Headers
+        :returns: bool
+
+        """
+        return settings.request_log_body_size > 0 and not headers.get(
+            "content-type", ""
+        ).startswith("multipart/")
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _patterns(fields: tuple[str, ...]) -> tuple[re.Pattern, re.Pattern]:
+        """This function compile the patterns of the redacted fields in a JSON body and in a form body.
+
+        :param fields: the names of the redacted fields
+        :type fields: tuple[str, ...]
+        :returns: tuple[re.Pattern, re.Pattern]
+
+        """
+        names = "|".join(re.escape(field) for field in fields)
+        return (
+            re.compile(
+                rf'("(?:{names})"\s*:\s*)(?:"(?:[^"\\]|\\.)*"?|[^,}}\]\s]+)', re.I
+            ),
+            re.compile(rf"((?:^|&)(?:{names})=)[^&]*", re.I),
+        )
+
+    @classmethod
+    def redact(cls, body: str) -> str:
+        """This function hide the values of the sensitive fields of a body (JSON or form, even truncated).
+
+        :param body: the decoded body
+        :type body: str
+        :returns: str
+
+        """
+        if not settings.request_log_redact_fields:
+            return body
+        json_pattern, form_pattern = cls._patterns(
+            tuple(settings.request_log_redact_fields)
+        )
+        body = json_pattern.sub(r'\1"***"', body)
+        return form_pattern.sub(r"\1***", body)
+
+    @classmethod
+    def log(
+        cls, scope: Scope, status_code: int, duration: float, body: bytes, size: int
+    ) -> None:
+        """This function log a request with the beginning of its body.
+
+        :param scope: the scope of the request
+        :param status_code: the status code of the response
+        :param duration: the duration of the request in seconds
+        :param body: the first bytes of the body
+        :param size: the size of the whole body
+        :type scope: Scope
+        :type status_code: int
+        :type duration: float
+        :type body: bytes
+        :type size: int
+        :returns: None
+
+        """
+        message = (
+            f"{scope['method']} {scope['path']} {status_code} {duration * 1000:.1f}ms"
+        )
+        if body:
+            message += f" {cls.redact(body.decode(errors='replace'))}"
+            if size > len(body):
+                message += f"... ({size} bytes)"
+        logger.info(message)
+
+
+class RequestLogMiddleware:
+    """Log the sampled requests once answered, with the beginning of their body.
+
+    The body isn't read by the middleware : its first bytes are copied while the route reads it, so an upload is
+    never buffered for the log.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not RequestLog.sampled():
+            await self.app(scope, receive, send)
+            return
+        capture = RequestLog.capture_body(Headers(scope=scope))
+        limit = settings.request_log_body_size
+        chunks: list[bytes] = []
+        captured = 0
+        size = 0
+        status_code = 500
+
+        async def receive_logged() -> Message:
+            nonlocal captured, size
+            message = await receive()
+            if capture and message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if captured < limit:
+                    chunks.append(chunk[: limit - captured])
+                    captured += len(chunks[-1])
+            return message
+
+        async def send_logged(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_logged, send_logged)
+        finally:
+            RequestLog.log(
+                scope, status_code, time.perf_counter() - start, b"".join(chunks), size
+            )
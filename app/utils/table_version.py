@@ -0,0 +1,209 @@
+import hashlib
+from threading import Lock
+from typing import ClassVar
+
+from pydantic import BaseModel
+from sqlalchemy import (
+    Column,
+    Integer,
+    Table,
+    Text,
+    event,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ..config.database import Base
+
+# the version of each table, bumped in the transaction of each write so all the processes read the same version
+table_versions = Table(
+    "table_versions",
+    Base.metadata,
+    Column("tablename", Text, primary_key=True),
+    Column("version", Integer, nullable=False),
+)
+
+
+class TableVersion(BaseModel):
+    # change counters of the tables, bumped by the writes of this process
+    counters: ClassVar[dict[str, int]] = {}
+    _lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def bump(cls, tablename: str) -> None:
+        """This function increment the change counter of a table after a write.
+
+        :param tablename: the name of the table
+        :type tablename: str
+        :returns: None
+
+        """
+        with cls._lock:
+            cls.counters[tablename] = cls.counters.get(tablename, 0) + 1
+
+    @staticmethod
+    def bump_database(connection, tablenames) -> None:
+        """This function increment the version of some tables in the database, in the transaction of their write.
+
+        :param connection: the connection of the write
+        :param tablenames: the names of the written tables
+        :returns: None
+
+        """
+        dialect_insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(
+            connection.dialect.name
+        )
+        # sorted : the concurrent writes of the same tables lock their versions in the same order
+        for tablename in sorted(set(tablenames) - {table_versions.name}):
+            if dialect_insert is not None:
+                statement = dialect_insert(table_versions).values(
+                    tablename=tablename, version=1
+                )
+                connection.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=["tablename"],
+                        set_={"version": table_versions.c.version + 1},
+                    )
+                )
+                continue
+            # no ON CONFLICT : the version is inserted by the first write of the table
+            result = connection.execute(
+                update(table_versions)
+                .where(table_versions.c.tablename == tablename)
+                .values(version=table_versions.c.version + 1)
+            )
+            if result.rowcount == 0:
+                connection.execute(
+                    insert(table_versions).values(tablename=tablename, version=1)
+                )
+
+    @staticmethod
+    def _version_statement(model_class):
+        """This function get the query of the version of the table of a model.
+
+        :param model_class: the class of the model
+        :returns: Select
+
+        """
+        return select(table_versions.c.version).where(
+            table_versions.c.tablename == model_class.__tablename__
+        )
+
+    @staticmethod
+    def _etag(model_class, version: int | None, parts: tuple) -> str:
+        """This function hash the version of a table and the parts of the request in a strong ETag.
+
+        Only the version in the database is hashed (not the counters of this process), so all the processes give the
+        same ETag for the same rows.
+
+        :param model_class: the class of the model
+        :param version: the version of the table (None if it was never written)
+        :param parts: the parts of the request changing the response
+        :type version: int | None
+        :type parts: tuple
+        :returns: str
+
+        """
+        version = (model_class.__tablename__, version or 0, *parts)
+        return f'"{hashlib.sha1(repr(version).encode()).hexdigest()}"'
+
+    @classmethod
+    def etag(cls, db: Session, model_class, *parts) -> str:
+        """This function compute a strong ETag from the version of the table of a model and the parts of the request.
+
+        :param db: the session
+        :param model_class: the class of the model
+        :param parts: the parts of the request changing the response (url, format, body, ...)
+        :type db: Session
+        :returns: str
+
+        """
+        return cls._etag(
+            model_class, db.scalar(cls._version_statement(model_class)), parts
+        )
+
+    @classmethod
+    async def etag_async(cls, db: AsyncSession, model_class, *parts) -> str:
+        """This function compute the ETag of etag with an async session.
+
+        :param db: the async session
+        :param model_class: the class of the model
+        :param parts: the parts of the request changing the response (url, format, body, ...)
+        :type db: AsyncSession
+        :returns: str
+
+        """
+        version = await db.scalar(cls._version_statement(model_class))
+        return cls._etag(model_class, version, parts)
+
+    @staticmethod
+    def match(etag: str, if_none_match: str | None) -> bool:
+        """This function check if an ETag is in the If-None-Match header of a request (weak comparison).
+
+        :param etag: the ETag of the current response
+        :param if_none_match: the value of the If-None-Match header
+        :type etag: str
+        :type if_none_match: str | None
+        :returns: bool
+
+        """
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed_tables(session: Session, flush_context) -> None:
+    """This function bump the version of the tables written by a flush, the association tables included.
+
+    The writes which don't go through the save of a model (a member added to a relationship, ...) change the version
+    too.
+
+    :param session: the flushed session
+    :param flush_context: the context of the flush
+    :type session: Session
+    :returns: None
+
+    """
+    tables = set()
+    for instance in [*session.new, *session.dirty, *session.deleted]:
+        state = inspect(instance)
+        tables.update(table.name for table in state.mapper.tables)
+        for relationship in state.mapper.relationships:
+            if (
+                relationship.secondary is not None
+                and state.attrs[relationship.key].history.has_changes()
+            ):
+                tables.add(relationship.secondary.name)
+    for tablename in tables:
+        TableVersion.bump(tablename)
+    if tables:
+        TableVersion.bump_database(session.connection(), tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_executed_table(execute_state: ORMExecuteState):
+    """This function bump the version of the table written by an INSERT, UPDATE or DELETE statement of a session.
+
+    The bulk writes and the UPDATE by id don't go through the flush.
+
+    :param execute_state: the statement executed by the session
+    :type execute_state: ORMExecuteState
+    :returns: the result of the statement, None if it isn't a write
+
+    """
+    if not (
+        execute_state.is_insert or execute_state.is_update or execute_state.is_delete
+    ):
+        return None
+    result = execute_state.invoke_statement()
+    tablename = execute_state.statement.table.name
+    TableVersion.bump(tablename)
+    TableVersion.bump_database(execute_state.session.connection(), [tablename])
+    return result
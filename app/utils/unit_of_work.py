@@ -0,0 +1,139 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+# the key of the unit of work in the info of the session
+_SESSION_KEY = "unit_of_work"
+# the key of the functions waiting for the commit of the session in its info
+_PENDING_KEY = "after_commit"
+
+
+class UnitOfWork:
+    """Batch the writes of the models on a session : each save is flushed, the session is committed once at the end.
+
+    If a write fails, the whole unit of work is rolled back and nothing is committed.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.depth = 0
+        self.errors: list[Exception] = []
+        self._callbacks: list = []
+
+    @classmethod
+    def get(cls, db: Session) -> "UnitOfWork | None":
+        """This function get the unit of work in progress on a session.
+
+        :param db: the session
+        :type db: Session
+        :returns: UnitOfWork | None
+
+        """
+        return db.info.get(_SESSION_KEY)
+
+    @classmethod
+    @contextmanager
+    def begin(cls, db: Session):
+        """This function open a unit of work on a session (nested units of work are merged in the outermost one).
+
+        :param db: the session
+        :type db: Session
+        :returns: the unit of work
+
+        """
+        unit = db.info.get(_SESSION_KEY)
+        if unit is None:
+            unit = db.info[_SESSION_KEY] = cls(db)
+        unit.depth += 1
+        try:
+            yield unit
+        except Exception:
+            if unit.depth == 1:
+                unit.fail()
+            raise
+        else:
+            if unit.depth == 1:
+                unit.commit()
+        finally:
+            unit.depth -= 1
+            if unit.depth == 0:
+                db.info.pop(_SESSION_KEY, None)
+
+    @classmethod
+    def on_commit(cls, db: Session, callback) -> None:
+        """This function call a function after the commit of the unit of work (at once without unit of work).
+
+        :param db: the session
+        :param callback: the function without argument to call
+        :type db: Session
+        :returns: None
+
+        """
+        unit = cls.get(db)
+        if unit is None:
+            callback()
+        else:
+            unit._callbacks.append(callback)
+
+    @staticmethod
+    def after_commit(db: Session, callback) -> None:
+        """This function call a function after the next commit of a session (dropped if the session is rolled back).
+
+        Unlike on_commit, the function waits for the commit even without unit of work : it is for the writes only
+        flushed (mapper events), which aren't committed yet.
+
+        :param db: the session
+        :param callback: the function without argument to call
+        :type db: Session
+        :returns: None
+
+        """
+        db.info.setdefault(_PENDING_KEY, []).append(callback)
+
+    def fail(self, error: Exception | None = None) -> None:
+        """This function roll back the writes of the unit of work.
+
+        :param error: the error of the failed write
+        :type error: Exception | None
+        :returns: None
+
+        """
+        if error is not None:
+            self.errors.append(error)
+        self._callbacks.clear()
+        self.db.rollback()
+
+    def commit(self) -> bool:
+        """This function commit the writes of the unit of work (roll back if a write failed) and return a bool.
+
+        :returns: bool
+
+        """
+        if self.errors:
+            self.db.rollback()
+            return False
+        try:
+            self.db.commit()
+        except Exception as error:
+            self.fail(error)
+            return False
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+        return True
+
+
+@event.listens_for(Session, "after_commit")
+def _call_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_PENDING_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_after_commit(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    # the rollback of the whole transaction (not of a savepoint) drops the writes
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,42 @@
+"""cards search indexes
+
+Revision ID: 3f1c2a7d9b4e
+Revises: a7c3e5b9d1f4
+Create Date: 2026-10-18 10:12:41.518230
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a7d9b4e"
+down_revision: Union[str, None] = "a7c3e5b9d1f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ["name", "illustrator", "description"]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # the trigram indexes are only on postgresql (Card.__table_args__), a B-tree doesn't help the search of a text
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_cards_{column}_trgm",
+            "cards",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"ix_cards_{column}_trgm", table_name="cards")
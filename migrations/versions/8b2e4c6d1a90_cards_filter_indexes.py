@@ -0,0 +1,45 @@
+"""cards filter indexes
+
+Revision ID: 8b2e4c6d1a90
+Revises: 3f1c2a7d9b4e
+Create Date: 2026-10-18 14:03:27.904112
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4c6d1a90"
+down_revision: Union[str, None] = "3f1c2a7d9b4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FILTER_INDEXES = {
+    "ix_cards_category_rarity": ["category", "rarity"],
+    "ix_cards_standard_expanded_regulation_mark": [
+        "standard",
+        "expanded",
+        "regulation_mark",
+    ],
+    "ix_cards_stage": ["stage"],
+    "ix_cards_hp": ["hp"],
+    "ix_cards_retreat": ["retreat"],
+}
+ARRAY_INDEXES = {
+    "ix_cards_energy_types": ["energy_types"],
+    "ix_cards_pokedex_numbers": ["pokedex_numbers"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in FILTER_INDEXES.items():
+        op.create_index(name, "cards", columns)
+    for name, columns in ARRAY_INDEXES.items():
+        op.create_index(name, "cards", columns, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for name in [*FILTER_INDEXES, *ARRAY_INDEXES]:
+        op.drop_index(name, table_name="cards")
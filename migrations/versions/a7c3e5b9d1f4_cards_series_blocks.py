@@ -0,0 +1,87 @@
+"""cards series blocks
+
+Revision ID: a7c3e5b9d1f4
+Revises: 051850ea5362
+Create Date: 2026-10-18 09:41:16.027734
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e5b9d1f4"
+down_revision: Union[str, None] = "051850ea5362"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the arrays are stored as JSON by sqlite
+INTEGER_ARRAY = sa.ARRAY(sa.Integer()).with_variant(sa.JSON(), "sqlite")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "blocks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("tag", sa.Text(), nullable=False),
+        sa.Column("logo", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "series",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("tag", sa.Text(), nullable=False),
+        sa.Column("logo", sa.Text(), nullable=False),
+        sa.Column("symbol_tag", sa.Text(), nullable=False),
+        sa.Column("first_edition_count", sa.Integer(), nullable=True),
+        sa.Column("holo_count", sa.Integer(), nullable=True),
+        sa.Column("normal_count", sa.Integer(), nullable=True),
+        sa.Column("official_count", sa.Integer(), nullable=True),
+        sa.Column("reverse_count", sa.Integer(), nullable=True),
+        sa.Column("total_count", sa.Integer(), nullable=True),
+        sa.Column("expanded", sa.Boolean(), nullable=False),
+        sa.Column("standard", sa.Boolean(), nullable=False),
+        sa.Column("realease", sa.Date(), nullable=True),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("block_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["block_id"], ["blocks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "cards",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("tag", sa.Text(), nullable=False),
+        sa.Column("category", sa.Text(), nullable=False),
+        sa.Column("local_tag", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("regulation_mark", sa.Text(), nullable=False),
+        sa.Column("suffix", sa.Text(), nullable=True),
+        sa.Column("evolve_from", sa.Text(), nullable=True),
+        sa.Column("illustrator", sa.Text(), nullable=True),
+        sa.Column("rarity", sa.Integer(), nullable=True),
+        sa.Column("stage", sa.Integer(), nullable=True),
+        sa.Column("hp", sa.Integer(), nullable=True),
+        sa.Column("level", sa.Integer(), nullable=True),
+        sa.Column("retreat", sa.Integer(), nullable=True),
+        sa.Column("energy_types", INTEGER_ARRAY, nullable=True),
+        sa.Column("pokedex_numbers", INTEGER_ARRAY, nullable=True),
+        sa.Column("expanded", sa.Boolean(), nullable=False),
+        sa.Column("standard", sa.Boolean(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cards")
+    op.drop_table("series")
+    op.drop_table("blocks")
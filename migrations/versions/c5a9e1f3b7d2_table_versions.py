@@ -0,0 +1,31 @@
+"""table versions
+
+Revision ID: c5a9e1f3b7d2
+Revises: 8b2e4c6d1a90
+Create Date: 2026-10-18 21:04:52.613907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9e1f3b7d2"
+down_revision: Union[str, None] = "8b2e4c6d1a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "table_versions",
+        sa.Column("tablename", sa.Text(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("tablename"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("table_versions")
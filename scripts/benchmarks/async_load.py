@@ -0,0 +1,128 @@
+"""Requests/sec and latency of concurrent serie lookups through the sync and the async read path.
+
+Each mode runs a uvicorn worker in a subprocess serving RouterModelHelper.read (threadpool, Session)
+or RouterModelHelper.read_async (event loop, AsyncSession) on the same seeded SQLite file,
+and the load is sent by an httpx.AsyncClient with CONCURRENCY requests in flight.
+The client shares the machine with the server: on a single core the run is CPU bound and
+an in-process SQLite has no network wait to overlap, so the async path gains with a remote
+PostgreSQL (asyncpg) rather than with this local setup.
+"""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config.database import get_async_url
+from app.routers.v1.serie import router_serie
+
+from .common import seed_series, sqlite_engine
+
+ROWS = 10_000
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "2000"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "200"))
+PORT = 8765
+
+
+def create_app(mode: str, url: str) -> FastAPI:
+    app = FastAPI()
+    if mode == "async":
+        session_maker = async_sessionmaker(
+            create_async_engine(get_async_url(url)), expire_on_commit=False
+        )
+
+        async def get_db():
+            async with session_maker() as db:
+                yield db
+
+        @app.get("/series/{serie_id}")
+        async def read_serie(serie_id: int, db: AsyncSession = Depends(get_db)):
+            return await router_serie.read_async(db, serie_id)
+
+    else:
+        session_maker = sessionmaker(
+            bind=sqlite_engine(url), autoflush=False, expire_on_commit=False
+        )
+
+        def get_db():
+            with session_maker() as db:
+                yield db
+
+        @app.get("/series/{serie_id}")
+        def read_serie(serie_id: int, db: Session = Depends(get_db)):
+            return router_serie.read(db, serie_id)
+
+    return app
+
+
+def serve(mode: str, url: str) -> None:
+    import uvicorn
+
+    uvicorn.run(
+        create_app(mode, url), port=PORT, log_level="warning", timeout_keep_alive=60
+    )
+
+
+async def load() -> tuple[float, list[float]]:
+    durations = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    limits = httpx.Limits(max_connections=CONCURRENCY)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60
+    ) as client:
+
+        async def request(index: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(f"/series/{index % ROWS + 1}")
+                response.raise_for_status()
+                durations.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[request(index) for index in range(REQUESTS)])
+        return (time.perf_counter() - start, durations)
+
+
+def wait_server() -> None:
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/series/1")
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+
+
+def main():
+    url = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    seed_series(sqlite_engine(url), ROWS)
+    for mode in ["sync", "async"]:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "scripts.benchmarks.async_load", "serve", mode, url]
+        )
+        try:
+            wait_server()
+            elapsed, durations = asyncio.run(load())
+        finally:
+            server.terminate()
+            server.wait()
+        ordered = sorted(durations)
+        print(
+            f"{mode:<6} {REQUESTS / elapsed:8.0f} req/s "
+            f"p50={statistics.median(ordered) * 1e3:7.1f}ms "
+            f"p99={ordered[int(len(ordered) * 0.99)] * 1e3:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "serve":
+        serve(sys.argv[2], sys.argv[3])
+    else:
+        main()
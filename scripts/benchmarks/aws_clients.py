@@ -0,0 +1,73 @@
+"""A burst of dynamodb_put_item : a client created by call (boto3.client, as AWS did before) against the client
+of AWSClients, created once and reused.
+
+DynamoDB is mocked by moto in the process, so the durations are the work of the client (no network) : the
+credentials, the config and the endpoint resolved at each creation, then the serialization of the call.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from moto import mock_dynamodb
+
+from app.services.aws import AWS, AWSClients
+
+from .common import report, timings
+
+CALLS = 1_000
+THREADS = 16
+TABLE = "benchmark"
+
+
+def put_item_before(table_name: str, item: dict) -> str | None:
+    """This function send an item like AWS.dynamodb_put_item did before the registry of clients."""
+    dynamodb_client = boto3.client("dynamodb")
+    try:
+        dynamodb_client.put_item(TableName=table_name, Item=item)
+    except Exception as e:
+        return e.__repr__()
+
+
+def main():
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-west-3")
+    with mock_dynamodb():
+        AWSClients.initialize(("dynamodb",))
+        AWSClients.client("dynamodb").create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        functions = {"before": put_item_before, "after": AWS.dynamodb_put_item}
+        # the two functions are called in turn, so both see the same state of the table
+        durations = {"before": [], "after": []}
+        for i in range(CALLS):
+            for label, function in functions.items():
+                item = {"id": {"S": f"{label}-{i}"}}
+                durations[label] += timings(lambda: function(TABLE, item), 1)
+        for label, label_durations in durations.items():
+            report(f"{label} : dynamodb_put_item", label_durations)
+        for label, function in functions.items():
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                errors = list(
+                    executor.map(
+                        lambda i: function(TABLE, {"id": {"S": f"{label}-burst-{i}"}}),
+                        range(CALLS),
+                    )
+                )
+            duration = time.perf_counter() - start
+            assert errors == [None] * CALLS, errors[0]
+            print(
+                f"{label} : burst of {CALLS} on {THREADS} threads".ljust(45),
+                f"{duration:8.2f}s {CALLS / duration:9.1f} calls/s",
+            )
+    AWSClients.close()
+
+
+if __name__ == "__main__":
+    main()
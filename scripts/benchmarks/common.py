@@ -0,0 +1,74 @@
+"""Shared helpers for the benchmark scripts (run them from the root of the project with `python -m scripts.benchmarks.<name>`)."""
+
+import statistics
+import time
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app import models
+from app.config.database import Base
+
+
+def sqlite_engine(url: str = "sqlite://"):
+    """This function create an sqlite engine with the tables used by the benchmarks."""
+    engine = sa.create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[
+            models.block.Block.__table__,
+            models.serie.Serie.__table__,
+            models.user.User.__table__,
+        ],
+    )
+    return engine
+
+
+def seed_series(engine, number: int, batch: int = 10_000) -> None:
+    """This function insert a block and `number` series with an executemany."""
+    with Session(engine) as db:
+        block = models.block.Block.create(db, name="Block", tag="bk", logo="logo")
+        rows = [
+            {
+                "name": f"Serie {i:06d}",
+                "tag": f"s{i}",
+                "logo": "logo",
+                "symbol_tag": "symbol",
+                "total_count": i % 300,
+                "expanded": i % 2 == 0,
+                "standard": i % 3 == 0,
+                "block_id": block.id,
+            }
+            for i in range(number)
+        ]
+        for start in range(0, number, batch):
+            db.execute(sa.insert(models.serie.Serie), rows[start : start + batch])
+        db.commit()
+
+
+def timings(function, repeat: int) -> list[float]:
+    """This function call `function` `repeat` times and return the durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    """This function print the p50 / p99 / mean of durations in microseconds."""
+    ordered = sorted(durations)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<45} p50={statistics.median(ordered) * 1e6:9.1f}us "
+        f"p99={p99 * 1e6:9.1f}us mean={statistics.fmean(ordered) * 1e6:9.1f}us"
+    )
+
+
+@contextmanager
+def session(engine):
+    """This function open a session on the benchmark engine."""
+    with Session(engine) as db:
+        yield db
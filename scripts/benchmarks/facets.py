@@ -0,0 +1,58 @@
+"""Latency of a filter + facet counts, with one grouped query and with one query per facet.
+
+The cards have ARRAY columns that SQLite can't create, so the benchmark runs on the series
+(same BaseModel._query and BaseModel.facets code path), with and without a composite index.
+"""
+
+import sqlalchemy as sa
+
+from app import models
+
+from .common import report, seed_series, session, sqlite_engine, timings
+
+ROWS = 100_000
+REPEAT = 30
+FACET_COLUMNS = ["expanded", "standard", "total_count"]
+FILTERS = {"standard": True, "total_count": {"between": [50, 150]}}
+
+
+def facets_one_query_each(db, model_class, facet_columns, **columns):
+    filtered = model_class._query(db, **columns).statement.subquery()
+    return {
+        column: db.execute(
+            sa.select(filtered.c[column], sa.func.count()).group_by(filtered.c[column])
+        ).all()
+        for column in facet_columns
+    }
+
+
+def main():
+    engine = sqlite_engine()
+    seed_series(engine, ROWS)
+    serie = models.serie.Serie
+    with session(engine) as db:
+        for indexed in [False, True]:
+            if indexed:
+                sa.Index(
+                    "ix_series_standard_total_count", serie.standard, serie.total_count
+                ).create(bind=engine)
+            label = "index" if indexed else "no index"
+            report(
+                f"filter items ({label})",
+                timings(lambda: serie.where(db, **FILTERS), REPEAT),
+            )
+            report(
+                f"facets one grouped query ({label})",
+                timings(lambda: serie.facets(db, FACET_COLUMNS, **FILTERS), REPEAT),
+            )
+            report(
+                f"facets one query per facet ({label})",
+                timings(
+                    lambda: facets_one_query_each(db, serie, FACET_COLUMNS, **FILTERS),
+                    REPEAT,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
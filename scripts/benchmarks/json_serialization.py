@@ -0,0 +1,81 @@
+"""Serialization of 10k cards in a list response : FastAPI default path, with orjson, and in one pass by the schema.
+
+The cards are built in memory (no database), only the response path is measured.
+"""
+
+import asyncio
+from datetime import datetime
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app import models, schemas
+from app.utils.fast_json import FastJSON
+
+from .common import report, timings
+
+CARDS = 10_000
+REPEAT = 10
+
+
+def build_cards(number: int) -> list:
+    now = datetime.now()
+    cards = []
+    for i in range(number):
+        card = models.card.Card(
+            id=i + 1,
+            name=f"Card {i:05d}",
+            tag=f"c{i}",
+            category="Pokemon",
+            local_tag=f"{i % 200:03d}",
+            description="A long description of the card. " * 8,
+            regulation_mark="G",
+            illustrator="Illustrator",
+            rarity=i % 6,
+            stage=i % 3,
+            hp=10 * (i % 30),
+            retreat=i % 4,
+            energy_types=[i % 10, (i + 3) % 10],
+            pokedex_numbers=[i % 1_000],
+            expanded=True,
+            standard=i % 2 == 0,
+            updated_at=now,
+            created_at=now,
+        )
+        # column of the schema missing on the model
+        card.realease = now
+        cards.append(card)
+    return cards
+
+
+def fastapi_path(field, cards, response_class) -> bytes:
+    content = asyncio.run(serialize_response(field=field, response_content=cards))
+    return response_class(content).body
+
+
+def main():
+    cards = build_cards(CARDS)
+    field = create_response_field(
+        name="Response", type_=list[schemas.card.CardList], mode="serialization"
+    )
+    assert (
+        len(fastapi_path(field, cards, JSONResponse))
+        > len(FastJSON.dump_list(schemas.card.CardList, cards)) * 0.9
+    )
+    report(
+        "FastAPI default (jsonable + json.dumps)",
+        timings(lambda: fastapi_path(field, cards, JSONResponse), REPEAT),
+    )
+    report(
+        "FastAPI + ORJSONResponse",
+        timings(lambda: fastapi_path(field, cards, ORJSONResponse), REPEAT),
+    )
+    report(
+        "FastJSON.dump_list (one pass)",
+        timings(lambda: FastJSON.dump_list(schemas.card.CardList, cards), REPEAT),
+    )
+
+
+if __name__ == "__main__":
+    main()
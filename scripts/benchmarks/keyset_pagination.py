@@ -0,0 +1,39 @@
+"""Latency of a deep page with OFFSET and with the keyset pagination of BaseModel.paginate."""
+
+from app import models
+
+from .common import report, seed_series, session, sqlite_engine, timings
+
+ROWS = 100_000
+PAGE_SIZE = 100
+REPEAT = 50
+
+
+def main():
+    engine = sqlite_engine()
+    seed_series(engine, ROWS)
+    serie = models.serie.Serie
+    with session(engine) as db:
+        for page in [1, 100, 500, 999]:
+            offset = (page - 1) * PAGE_SIZE
+            last_key = None if page == 1 else [offset, offset]
+            report(
+                f"page {page:>4} OFFSET {offset:>6}",
+                timings(
+                    lambda: serie._query(
+                        db, order_by={"id": "asc"}, limit=PAGE_SIZE, offset=offset
+                    ).all(),
+                    REPEAT,
+                ),
+            )
+            report(
+                f"page {page:>4} keyset after id={offset:>6}",
+                timings(
+                    lambda: serie.paginate(db, limit=PAGE_SIZE, after=last_key),
+                    REPEAT,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
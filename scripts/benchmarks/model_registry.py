@@ -0,0 +1,51 @@
+"""Per-call overhead of resolving a model class, with Tools.get_class_from_string and with the ModelRegistry.
+
+The cards have ARRAY columns that SQLite can't create, so the full read route runs on the series
+(same RouterModelHelper.read code path as read_card); the class lookup alone is measured on the cards.
+"""
+
+from app import models
+from app.helpers.router import RouterModelHelper
+from app.utils.model_registry import ModelRegistry
+from app.utils.tools import Tools
+
+from .common import report, seed_series, session, sqlite_engine, timings
+
+REPEAT = 20_000
+
+
+def get_class_from_string(name: str):
+    return Tools.get_class_from_string(
+        models, f"{name}.{name.title().replace('_', '')}"
+    )
+
+
+def main():
+    report(
+        "lookup card [get_class_from_string]",
+        timings(lambda: get_class_from_string("card"), REPEAT),
+    )
+    report(
+        "lookup card [registry]",
+        timings(lambda: ModelRegistry.get_class("card"), REPEAT),
+    )
+    engine = sqlite_engine()
+    seed_series(engine, 1_000)
+    router = RouterModelHelper(name="serie", parents=["block"], uniq_list=[])
+    get_class = ModelRegistry.get_class
+    with session(engine) as db:
+        for label, resolver in [
+            ("get_class_from_string", get_class_from_string),
+            ("registry", get_class),
+        ]:
+            ModelRegistry.get_class = resolver
+            counter = iter(range(REPEAT * 2))
+            report(
+                f"read serie [{label}]",
+                timings(lambda: router.read(db, next(counter) % 1_000 + 1), REPEAT),
+            )
+    ModelRegistry.get_class = get_class
+
+
+if __name__ == "__main__":
+    main()
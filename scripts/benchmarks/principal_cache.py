@@ -0,0 +1,130 @@
+"""Authenticated serie reads : identity resolved per request (jwt.decode, user SELECT, validations and copies)
+against the principal cache of Auth._decode_token.
+
+The models of this tree have no matricule column, so the "before" route finds the user by email only and the
+cache is filled once with the user of the token (what the first request does).
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import models, schemas
+from app.config.auth import Auth, _oauth2_scheme
+from app.config.constants import TIME_ZONE_APP
+from app.config.env import settings
+from app.routers.v1.serie import router_serie
+from app.utils.dependency import Dependency
+from app.utils.principal_cache import PrincipalCache
+
+from .common import report, seed_series, session, sqlite_engine, timings
+
+ROWS = 1_000
+REQUESTS = 2_000
+
+
+def identity_before(token: str, db: Session) -> schemas.user.User:
+    """This function resolve the user of a token like every request did before the principal cache."""
+    payload = jwt.decode(
+        token, settings.secret_key_jwt, algorithms=[settings.algorithm]
+    )
+    db_user = models.user.User.find_by(db, email=payload["email"])
+    current_user = schemas.user.UserComplete.model_validate(db_user)
+    user = schemas.user.UserComplete(**current_user.model_dump())
+    return schemas.user.User(**user.model_dump())
+
+
+def identity_after(token: str, db: Session) -> schemas.user.User:
+    """This function resolve the user of a token through the dependencies of Auth."""
+    return Auth.get_current_user(Auth._decode_token(token, db))[0]
+
+
+def create_app(session_maker) -> FastAPI:
+    app = FastAPI()
+
+    def get_db():
+        with session_maker() as db:
+            yield db
+
+    app.dependency_overrides[Dependency.get_db] = get_db
+
+    def before_identity(
+        token: str = Depends(_oauth2_scheme), db: Session = Depends(get_db)
+    ) -> schemas.user.User:
+        return identity_before(token, db)
+
+    @app.get("/before/series/{serie_id}")
+    def read_before(
+        serie_id: int,
+        user: schemas.user.User = Depends(before_identity),
+        db: Session = Depends(get_db),
+    ):
+        return router_serie.read(db, serie_id)
+
+    @app.get("/after/series/{serie_id}")
+    def read_after(
+        serie_id: int,
+        response_user: tuple = Depends(Auth.get_current_user),
+        db: Session = Depends(get_db),
+    ):
+        return router_serie.read(db, serie_id)
+
+    return app
+
+
+def main():
+    database = tempfile.NamedTemporaryFile(suffix=".db")
+    engine = sqlite_engine(f"sqlite:///{database.name}")
+    seed_series(engine, ROWS)
+    now = datetime.now()
+    with session(engine) as db:
+        user = models.user.User.create(
+            db,
+            first_name="Sacha",
+            last_name="KETCHUM",
+            email="sacha@gmail.com",
+            updated_at=now,
+            created_at=now,
+        )
+        principal = schemas.user.UserComplete.model_validate(user)
+    token = jwt.encode(
+        {
+            "matricule": "matricule",
+            "email": principal.email,
+            "exp": datetime.now(tz=TIME_ZONE_APP) + timedelta(hours=1),
+        },
+        settings.secret_key_jwt,
+        algorithm=settings.algorithm,
+    )
+    PrincipalCache.set(token, principal)
+    session_maker = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    with session_maker() as db:
+        for label, identity in [("before", identity_before), ("after", identity_after)]:
+            report(
+                f"{label} : identity of the token",
+                timings(lambda: identity(token, db), REQUESTS),
+            )
+    client = TestClient(
+        create_app(session_maker),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    for label in ["before", "after"]:
+        assert client.get(f"/{label}/series/1").status_code == 200
+    # the two routes are called in turn, so both see the same state of the process
+    durations = {"before": [], "after": []}
+    for i in range(REQUESTS):
+        for label in durations:
+            durations[label] += timings(
+                lambda: client.get(f"/{label}/series/{i % ROWS + 1}"), 1
+            )
+    for label, label_durations in durations.items():
+        report(f"{label} : authenticated read", label_durations)
+        print(f"{'':<45} {len(label_durations) / sum(label_durations):9.1f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Per-call overhead of BaseModel._query with and without the query plan cache."""
+
+from app import models
+
+from .common import report, seed_series, session, sqlite_engine, timings
+
+REPEAT = 5_000
+
+
+def main():
+    engine = sqlite_engine()
+    seed_series(engine, 1_000)
+    serie = models.serie.Serie
+    queries = {
+        "find_by(id)": lambda db, i: serie.find_by(db, id=i % 1_000 + 1),
+        "_query(name ilike) build": lambda db, i: serie._query(
+            db, name={"ilike": f"%{i % 1_000:06d}%"}
+        ),
+        "_query(block.name, expanded) build": lambda db, i: serie._query(
+            db, block={"name": "Block"}, expanded=i % 2 == 0
+        ),
+    }
+    with session(engine) as db:
+        for label, query in queries.items():
+            for maxsize, mode in [(0, "no cache"), (512, "plan cache")]:
+                serie._query_plans.clear()
+                serie._query_plans.maxsize = maxsize
+                counter = iter(range(REPEAT * 2))
+                report(
+                    f"{label} [{mode}]",
+                    timings(lambda: query(db, next(counter)), REPEAT),
+                )
+        print(serie._query_plans.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Throughput of a 1 MB POST through the request logging : the old app_entry middleware (whole body read and
+logged by the request) against RequestLogMiddleware (first bytes copied, logged through a queue).
+
+The logs are written to a file, the app is called directly on ASGI (no server, no network).
+"""
+
+import asyncio
+import logging
+import tempfile
+import tracemalloc
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from fastapi import FastAPI, Request
+from fastapi.logger import logger
+
+from app.config.constants import REQUEST_LOGGER
+from app.utils.request_log import RequestLogMiddleware
+
+from .common import report, timings
+
+BODY = (
+    b'{"name": "card", "password": "secret", "data": "' + b"x" * (1024 * 1024) + b'"}'
+)
+CHUNK_SIZE = 64 * 1024
+REQUESTS = 50
+REPEAT = 5
+
+
+def build_app(old: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+        return {"size": size}
+
+    if old:
+
+        @app.middleware("http")
+        async def app_entry(request: Request, call_next):
+            body = await request.body()
+            if body:
+                body_decoded = body.decode(errors="ignore")
+                logger.info(body_decoded)
+
+            response = await call_next(request)
+            return response
+
+    else:
+        app.add_middleware(RequestLogMiddleware)
+    return app
+
+
+async def post(app: FastAPI) -> None:
+    chunks = [
+        BODY[start : start + CHUNK_SIZE] for start in range(0, len(BODY), CHUNK_SIZE)
+    ]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "path": "/upload",
+        "raw_path": b"/upload",
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+def run(app: FastAPI) -> None:
+    async def requests():
+        for _ in range(REQUESTS):
+            await post(app)
+
+    asyncio.run(requests())
+
+
+def main():
+    log_file = tempfile.NamedTemporaryFile(suffix=".log")
+    handler = logging.FileHandler(log_file.name)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    # the queue set by Logging.initialize_request_logging
+    queue = SimpleQueue()
+    logging.getLogger(REQUEST_LOGGER).addHandler(QueueHandler(queue))
+    logging.getLogger(REQUEST_LOGGER).propagate = False
+    listener = QueueListener(queue, handler)
+    listener.start()
+    for label, app in [
+        ("app_entry (read + log the body)", build_app(old=True)),
+        ("RequestLogMiddleware", build_app(old=False)),
+    ]:
+        durations = timings(lambda: run(app), REPEAT)
+        report(f"{label} x{REQUESTS}", durations)
+        print(f"{'':<45} {REQUESTS / min(durations):9.1f} requests/s")
+        tracemalloc.start()
+        run(app)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{'':<45} peak memory {peak / 1024 / 1024:9.1f} MB")
+    listener.stop()
+
+
+if __name__ == "__main__":
+    main()
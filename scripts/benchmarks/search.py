@@ -0,0 +1,66 @@
+"""Latency of a search with ILIKE '%text%' (full scan) and with the in-process trigram index of the search service."""
+
+import random
+
+import sqlalchemy as sa
+from faker import Faker
+from sqlalchemy.orm import Session
+
+from app import models
+from app.services.search import TrigramIndex
+
+from .common import report, session, sqlite_engine, timings
+
+ROWS = 100_000
+REPEAT = 200
+
+
+def main():
+    fake = Faker("fr_FR")
+    Faker.seed(42)
+    generator = random.Random(42)
+    names = [f"{fake.first_name()} {fake.word()}" for _ in range(ROWS)]
+    engine = sqlite_engine()
+    with Session(engine) as db:
+        block = models.block.Block.create(db, name="Block", tag="bk", logo="logo")
+        db.execute(
+            sa.insert(models.serie.Serie),
+            [
+                {
+                    "name": name,
+                    "tag": "t",
+                    "logo": "l",
+                    "symbol_tag": "s",
+                    "expanded": True,
+                    "standard": True,
+                    "block_id": block.id,
+                }
+                for name in names
+            ],
+        )
+        db.commit()
+    index = TrigramIndex({"name": 1.0})
+    for document_id, name in enumerate(names, start=1):
+        index.add(document_id, name=name)
+
+    searched = [generator.choice(names).split()[0] for _ in range(REPEAT)]
+    with session(engine) as db:
+        texts = iter(searched)
+        report(
+            "ILIKE '%text%' (SQLite, 100k rows)",
+            timings(
+                lambda: models.serie.Serie.where(
+                    db, name={"ilike": f"%{next(texts)}%"}
+                ),
+                REPEAT,
+            ),
+        )
+        texts = iter(searched)
+        report(
+            "TrigramIndex.search (100k documents)",
+            timings(lambda: index.search(next(texts), limit=20), REPEAT),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Latency of the error path of the app (404 of a serie read, message translated in the language of the request).
+
+The requests alternate Accept-Language fr and en, the latency is reported by block of requests to show if it
+drifts while the process serves more requests.
+"""
+
+import os
+import tempfile
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.routers import routers
+from app.utils.dependency import Dependency
+
+from .common import report, sqlite_engine, timings
+
+BLOCKS = 5
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "2000"))
+LANGUAGES = ["fr-FR,fr;q=0.9,en;q=0.8", "en-US,en;q=0.9"]
+
+
+def main():
+    database = tempfile.NamedTemporaryFile(suffix=".db")
+    session_maker = sessionmaker(bind=sqlite_engine(f"sqlite:///{database.name}"))
+
+    def get_db():
+        with session_maker() as db:
+            yield db
+
+    for router in routers:
+        app.include_router(router)
+    app.dependency_overrides[Dependency.get_db] = get_db
+    client = TestClient(app)
+    details = set()
+    for block in range(BLOCKS):
+        languages = iter(range(REQUESTS))
+
+        def read_missing():
+            language = LANGUAGES[next(languages) % len(LANGUAGES)]
+            response = client.get(
+                "/v1/series/999999", headers={"Accept-Language": language}
+            )
+            assert response.status_code == 404
+            details.add(response.json()["detail"])
+
+        report(
+            f"404 read, requests {block * REQUESTS}-{(block + 1) * REQUESTS}",
+            timings(read_missing, REQUESTS),
+        )
+    print(f"messages : {sorted(details)}")
+
+
+if __name__ == "__main__":
+    main()